@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Measure interpreter startup cost for common short-lived commands.
+
+Each scenario runs in a fresh interpreter several times and the median wall
+time is reported, next to the cost of importing every provider SDK eagerly
+(what importing ai_debate.models used to cost).
+
+Examples:
+  python scripts/bench_startup.py
+  python scripts/bench_startup.py --runs 10
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SCRIPTS = Path(__file__).resolve().parent
+
+SCENARIOS: list[tuple[str, list[str]]] = [
+    ("bare interpreter", ["-c", "pass"]),
+    ("eager SDK imports (old baseline)", [
+        "-c", "import anthropic, openai, google.genai, ai_debate.models",
+    ]),
+    ("import ai_debate.models", ["-c", "import ai_debate.models"]),
+    ("run_matrix.py --dry-run", [str(SCRIPTS / "run_matrix.py"), "--dry-run"]),
+    ("single provider (Anthropic)", [
+        "-c",
+        "from ai_debate.models.registry import resolve_adapter; resolve_adapter('Anthropic')",
+    ]),
+    ("offline mock matrix setup", [
+        "-c",
+        "from ai_debate.models import get_registry; get_registry().get('mock-1')",
+    ]),
+]
+
+
+def time_command(args: list[str], runs: int) -> list[float]:
+    """Wall-clock seconds for ``runs`` fresh interpreters running ``args``."""
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(
+            [sys.executable, *args],
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark command startup time")
+    parser.add_argument("--runs", "-n", type=int, default=5, help="Runs per scenario (default: 5)")
+    args = parser.parse_args()
+
+    print(f"{'Scenario':<36} {'median':>9} {'min':>9}")
+    print("-" * 56)
+    for label, command in SCENARIOS:
+        timings = time_command(command, args.runs)
+        print(f"{label:<36} {statistics.median(timings) * 1000:>7.0f}ms "
+              f"{min(timings) * 1000:>7.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
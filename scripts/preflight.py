@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Probe every configured model at once and save a performance profile.
+
+Each model gets one streamed request per prompt size; the connect time,
+time to first token, output speed and rate-limit headers are recorded and
+written to the profile file, where run_matrix.py picks them up for its ETA
+and for --concurrency auto.
+
+Examples:
+  python scripts/preflight.py
+  python scripts/preflight.py --models claude,gpt --sizes 500,8000
+  python scripts/preflight.py --mock 4
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from ai_debate.models import ModelRegistry
+from ai_debate.models.profile import (
+    PROBE_INPUT_TOKENS,
+    PROBE_OUTPUT_TOKENS,
+    PROFILE_PATH,
+    ModelProfile,
+    probe_model,
+    save_profiles,
+)
+
+
+def _seconds(value: float | None) -> str:
+    return f"{value:.2f}s" if value is not None else "-"
+
+
+def _count(value: int | None) -> str:
+    return f"{value:,}" if value is not None else "-"
+
+
+def format_profile(profile: ModelProfile) -> str:
+    """One table row for a profile."""
+    speed = f"{profile.tokens_per_second:.0f}" if profile.tokens_per_second else "-"
+    row = (
+        f"{profile.name:<24} {_seconds(profile.connect_seconds):>8} "
+        f"{_seconds(profile.ttft_seconds):>8} {profile.ttft_seconds_per_1k_input:>7.3f}s "
+        f"{speed:>6} {_count(profile.requests_limit):>8} {_count(profile.tokens_limit):>11}"
+    )
+    errors = [p.error for p in profile.probes if p.error]
+    if errors:
+        row += f"  {len(errors)}/{len(profile.probes)} failed: {errors[0][:60]}"
+    return row
+
+
+async def main() -> None:
+    """Probe the selected models concurrently."""
+    parser = argparse.ArgumentParser(description="Measure model latency and throughput")
+    parser.add_argument(
+        "--models", "-m",
+        default="claude,gpt,gemini,grok",
+        help="Comma-separated model keys (default: claude,gpt,gemini,grok)",
+    )
+    parser.add_argument(
+        "--mock",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Probe N offline mock models (mock-1..mock-N) instead of --models",
+    )
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(n) for n in PROBE_INPUT_TOKENS),
+        help="Comma-separated prompt sizes in tokens "
+             f"(default: {','.join(str(n) for n in PROBE_INPUT_TOKENS)})",
+    )
+    parser.add_argument(
+        "--output-tokens",
+        type=int,
+        default=PROBE_OUTPUT_TOKENS,
+        help=f"Tokens requested per probe (default: {PROBE_OUTPUT_TOKENS})",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=120.0,
+        help="Seconds allowed per probe request (default: 120)",
+    )
+    parser.add_argument(
+        "--profiles",
+        type=Path,
+        default=PROFILE_PATH,
+        help=f"Profile file to update (default: {PROFILE_PATH})",
+    )
+    args = parser.parse_args()
+
+    if args.mock is not None:
+        keys = [f"mock-{i}" for i in range(1, args.mock + 1)]
+    else:
+        keys = [k.strip().lower() for k in args.models.split(",")]
+    sizes = tuple(int(n) for n in args.sizes.split(","))
+
+    # Retries would hide the latency being measured.
+    registry = ModelRegistry(resilient=False)
+    models = []
+    for key in keys:
+        if key not in registry:
+            print(f"Unknown model: {key!r}. Available: {', '.join(registry.keys())}, mock-N")
+            sys.exit(1)
+        try:
+            models.append(registry.get(key))
+        except ValueError as e:
+            print(f"  Skipping {key}: {e}")
+
+    print(f"Probing {len(models)} models with prompts of {', '.join(map(str, sizes))} tokens...")
+    try:
+        profiles = await asyncio.gather(*[
+            probe_model(model, sizes, args.output_tokens, args.timeout) for model in models
+        ])
+    finally:
+        await registry.aclose()
+
+    print(f"\n{'Model':<24} {'connect':>8} {'TTFT':>8} {'per 1k':>8} {'tok/s':>6} "
+          f"{'RPM':>8} {'TPM':>11}")
+    print("-" * 80)
+    for profile in profiles:
+        print(format_profile(profile))
+
+    measured = [p for p in profiles if p.ok]
+    if measured:
+        path = save_profiles(measured, args.profiles)
+        print(f"\nSaved {len(measured)} profile(s) to {path}")
+    print(f"{len(measured)}/{len(profiles)} models measured")
+
+    if len(measured) < 2:
+        print("\n⚠ Need at least 2 working models to run a debate")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -10,22 +10,31 @@ from dotenv import load_dotenv
 # Load environment variables from .env file
 load_dotenv()
 
-from ai_debate.debate import DebateEngine, transcript_to_markdown
-from ai_debate.models import AnthropicModel, GoogleModel, OpenAIModel, XAIModel
+from ai_debate.debate import (
+    FORMATS,
+    ContextPolicy,
+    DebateEngine,
+    OutputGuard,
+    format_critical_path,
+    parse_context_budget,
+    parse_phase_reasoning,
+    transcript_to_markdown,
+)
+from ai_debate.models import Reasoning, get_registry
+from ai_debate.models.keypool import format_key_pool_summary
+from ai_debate.models.resilience import format_resilience_summary
+from ai_debate.storage.journal import RunJournal
 
-MODEL_MAP = {
-    "claude": AnthropicModel,
-    "gpt": OpenAIModel,
-    "gemini": GoogleModel,
-    "grok": XAIModel,
-}
+registry = get_registry()
 
 
 def init_model(key: str):
-    """Initialize a model by its short name."""
-    if key not in MODEL_MAP:
-        raise ValueError(f"Unknown model: {key!r}. Choose from: {', '.join(MODEL_MAP)}")
-    return MODEL_MAP[key]()
+    """Get a model by its short name from the shared registry."""
+    if key not in registry:
+        raise ValueError(
+            f"Unknown model: {key!r}. Choose from: {', '.join(registry.keys())}, mock-N"
+        )
+    return registry.get(key)
 
 
 async def main() -> None:
@@ -57,44 +66,160 @@ async def main() -> None:
         help="Comma-separated judge model names (e.g. 'gemini,grok'). "
              "Defaults to the 2 models not debating.",
     )
+    parser.add_argument(
+        "--format",
+        choices=sorted(FORMATS),
+        default="lincoln-douglas",
+        help="Debate format; 'simultaneous' writes both constructives (and both "
+             "cross-examinations) blind and in parallel",
+    )
+    parser.add_argument(
+        "--reasoning",
+        type=parse_phase_reasoning,
+        default=None,
+        metavar="TYPE=LEVEL,...",
+        help="Reasoning per phase type, e.g. 'cross_examination=low,rebuttal=2048'",
+    )
+    parser.add_argument(
+        "--judge-reasoning",
+        type=Reasoning.parse,
+        default=None,
+        metavar="LEVEL",
+        help="Reasoning effort or token budget for judges",
+    )
+    parser.add_argument(
+        "--keep-verbatim",
+        type=int,
+        default=None,
+        metavar="K",
+        help="Send only the last K speeches verbatim and summaries of older ones",
+    )
+    parser.add_argument(
+        "--context-budget",
+        type=parse_context_budget,
+        default=None,
+        metavar="TOKENS[,MODEL=TOKENS,...]",
+        help="Token budget per speech request, optionally per model ('6000,claude=12000')",
+    )
+    parser.add_argument(
+        "--no-output-guard",
+        action="store_true",
+        help="Keep speeches as generated, even past the word limit or when they loop",
+    )
+    parser.add_argument(
+        "--affirmative",
+        metavar="MODEL",
+        default=None,
+        help="Model arguing the affirmative instead of Claude (or GPT with --swap)",
+    )
+    parser.add_argument(
+        "--negative",
+        metavar="MODEL",
+        default=None,
+        help="Model arguing the negative instead of GPT (or Claude with --swap)",
+    )
+    runs = parser.add_mutually_exclusive_group()
+    runs.add_argument(
+        "--resume",
+        metavar="RUN_ID",
+        default=None,
+        help="Continue an interrupted debate from its journal without repeating "
+             "journaled speeches or judge decisions",
+    )
+    runs.add_argument(
+        "--fork",
+        metavar="RUN_ID",
+        default=None,
+        help="Rerun the latest debate of a run from the phase given by --at on, with "
+             "--affirmative/--negative as the speakers; earlier phases are reused",
+    )
+    parser.add_argument(
+        "--at",
+        type=int,
+        default=None,
+        metavar="PHASE",
+        help="Phase number (1-based) a --fork starts generating from",
+    )
     args = parser.parse_args()
+    if (args.fork is None) != (args.at is None):
+        parser.error("--fork and --at go together")
+    debate_format = FORMATS[args.format].with_reasoning(args.reasoning, args.judge_reasoning)
 
     print("Initializing models...")
 
-    try:
-        claude = AnthropicModel()
-        print(f"  Claude: {claude.name} ({claude.model_id})")
-    except ValueError as e:
-        print(f"  Error initializing Claude: {e}")
-        print("  Set ANTHROPIC_API_KEY environment variable")
-        return
-
-    try:
-        gpt = OpenAIModel()
-        print(f"  GPT: {gpt.name} ({gpt.model_id})")
-    except ValueError as e:
-        print(f"  Error initializing GPT: {e}")
-        print("  Set OPENAI_API_KEY environment variable")
-        return
-
-    # Assign roles based on --swap flag
-    if args.swap:
-        affirmative = gpt
-        negative = claude
-    else:
-        affirmative = claude
-        negative = gpt
+    # Claude and GPT by default (swapped with --swap); either side can be replaced
+    defaults = ("gpt", "claude") if args.swap else ("claude", "gpt")
+    keys = (args.affirmative or defaults[0], args.negative or defaults[1])
+    api_key_env = {"claude": "ANTHROPIC_API_KEY", "gpt": "OPENAI_API_KEY"}
+    models = {}
+    for key in dict.fromkeys(keys):
+        try:
+            models[key] = init_model(key)
+            print(f"  {key}: {models[key].name} ({models[key].model_id})")
+        except ValueError as e:
+            print(f"  Error initializing {key}: {e}")
+            if key in api_key_env:
+                print(f"  Set {api_key_env[key]} environment variable")
+            return
+    affirmative, negative = models[keys[0]], models[keys[1]]
 
     print(f"\n  Affirmative: {affirmative.name}")
     print(f"  Negative: {negative.name}")
+    print(f"  Format: {debate_format.name}, {format_critical_path(debate_format)}")
+
+    context_policy = None
+    if args.keep_verbatim is not None or args.context_budget is not None:
+        default, by_key = args.context_budget or (None, {})
+        context_policy = ContextPolicy(
+            keep_verbatim=2 if args.keep_verbatim is None else args.keep_verbatim,
+            max_context_tokens=default,
+            model_budgets={models[k].name: n for k, n in by_key.items() if k in models},
+        )
+
+    run_id = args.resume or args.fork
+    try:
+        journal = RunJournal.resume(run_id, format=debate_format) if run_id else (
+            RunJournal(format=debate_format)
+        )
+    except (FileNotFoundError, ValueError) as e:
+        print(f"\n{e}")
+        return
+    parent = journal.transcript() if args.fork else None
+    if args.fork and parent is None:
+        print(f"\nRun {args.fork} has no debate to fork.")
+        return
+    resumed = journal.transcript() if args.resume else None
+    if resumed is not None and (
+        resumed.affirmative_model != affirmative.name or resumed.negative_model != negative.name
+    ):
+        print(f"\nRun {journal.run_id} had {resumed.affirmative_model} (AFF) vs "
+              f"{resumed.negative_model} (NEG); use the same models and --swap setting "
+              "to resume it.")
+        return
+    print(f"\n  Run ID: {journal.run_id} (resume with --resume {journal.run_id})")
 
     # Create engine and run debate
-    engine = DebateEngine(verbose=True)
-    transcript = await engine.run_debate(
-        resolution=args.resolution,
-        affirmative=affirmative,
-        negative=negative,
+    engine = DebateEngine(
+        format=debate_format,
+        verbose=True,
+        context_policy=context_policy,
+        journal=journal,
+        output_guard=None if args.no_output_guard else OutputGuard(),
     )
+    if parent is not None:
+        try:
+            transcript = await engine.fork_debate(parent, args.at - 1, affirmative, negative)
+        except ValueError as e:
+            print(f"\n{e}")
+            journal.close()
+            return
+    else:
+        transcript = await engine.run_debate(
+            resolution=resumed.resolution if resumed else args.resolution,
+            affirmative=affirmative,
+            negative=negative,
+            transcript=resumed,
+        )
 
     # Save transcript as markdown
     output_dir = Path("debates")
@@ -113,29 +238,55 @@ async def main() -> None:
             judge_keys = [k.strip() for k in args.judge_models.split(",")]
         else:
             # Default: the 2 models not debating
-            debating = {"claude", "gpt"} if not args.swap else {"gpt", "claude"}
-            judge_keys = [k for k in MODEL_MAP if k not in debating]
+            debating = set(keys)
+            judge_keys = [
+                k for k in registry.keys()
+                if k not in debating and registry.config(k).provider != "Local"
+            ]
 
         print(f"\nInitializing judges: {', '.join(judge_keys)}")
         judge_models = []
+        judge_backups = {}
         for key in judge_keys:
             try:
                 model = init_model(key)
                 judge_models.append(model)
                 print(f"  {model.name} ({model.model_id})")
+                backup = registry.get_backup(key.strip().lower())
+                if backup is not None:
+                    judge_backups[model.name] = backup
             except (ValueError, Exception) as e:
                 print(f"  Error initializing {key}: {e}")
 
         if judge_models:
-            panel = JudgePanel(judges=judge_models, verbose=True)
+            panel = JudgePanel(
+                judges=judge_models,
+                verbose=True,
+                backups=judge_backups,
+                reasoning=debate_format.judge_reasoning,
+                journal=journal,
+            )
             result = await panel.judge_debate(transcript)
             markdown += result_to_markdown(transcript, result)
         else:
             print("  No judges available, skipping judging.")
 
+    journal.close()
     output_file.write_text(markdown)
     print(f"\nTranscript saved to: {output_file}")
 
+    resilience = format_resilience_summary()
+    if resilience:
+        print("\nRetries and circuit breakers:")
+        print(resilience)
+
+    key_usage = format_key_pool_summary()
+    if key_usage:
+        print("\nAPI key usage:")
+        print(key_usage)
+
+    await registry.aclose()
+
 
 if __name__ == "__main__":
     asyncio.run(main())
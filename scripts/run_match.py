@@ -22,8 +22,9 @@ from ai_debate.debate import DebateEngine, transcript_to_markdown
 from ai_debate.debate.engine import DebateTranscript
 from ai_debate.judging import DebateResult, JudgePanel
 from ai_debate.judging.judge import result_to_markdown
-from ai_debate.models import AnthropicModel, GoogleModel, OpenAIModel, XAIModel
+from ai_debate.models import get_registry
 from ai_debate.models.base import DebateModel
+from ai_debate.models.resilience import format_resilience_summary
 
 
 @dataclass
@@ -164,11 +165,10 @@ def match_to_markdown(match: MatchResult) -> str:
     lines.append("")
 
     for i, (transcript, result) in enumerate(match.rounds, 1):
-        unanimous = "Unanimous" if result.is_unanimous else "Split"
         lines.append(f"### Round {i}")
         lines.append(f"- **{transcript.affirmative_model}** (AFF) vs **{transcript.negative_model}** (NEG)")
         lines.append(f"- **Winner:** {result.winner_model} ({result.winner_side})")
-        lines.append(f"- **Decision:** {unanimous} | Margin: {result.margin:.1f}")
+        lines.append(f"- **Decision:** {result.decision_label} | Margin: {result.margin:.1f}")
         lines.append(f"- **Scores:** AFF {result.aggregate_a.total:.1f} — NEG {result.aggregate_b.total:.1f}")
 
         judges_str = ", ".join(
@@ -210,22 +210,18 @@ async def main() -> None:
 
     print("Initializing all 4 models...\n")
 
+    registry = get_registry()
     models: list[DebateModel] = []
-    model_classes = [
-        ("Claude", AnthropicModel, "ANTHROPIC_API_KEY"),
-        ("GPT", OpenAIModel, "OPENAI_API_KEY"),
-        ("Gemini", GoogleModel, "GOOGLE_API_KEY"),
-        ("Grok", XAIModel, "XAI_API_KEY"),
-    ]
 
-    for label, cls, env_var in model_classes:
+    for key in ["claude", "gpt", "gemini", "grok"]:
+        config = registry.config(key)
         try:
-            model = cls()
+            model = registry.get(key)
             models.append(model)
             print(f"  {model.name} ({model.model_id})")
         except ValueError as e:
-            print(f"  Error initializing {label}: {e}")
-            print(f"  Set {env_var} environment variable")
+            print(f"  Error initializing {config.name}: {e}")
+            print(f"  Set {config.api_key_env} environment variable")
             return
 
     if len(models) < 4:
@@ -235,11 +231,16 @@ async def main() -> None:
     print(f"\nResolution: {args.resolution}")
     print(f"Match: 4 rounds, each model debates 2x and judges 2x\n")
 
-    result = await run_match(
-        resolution=args.resolution,
-        models=models,
-        verbose=verbose,
-    )
+    await registry.prewarm()
+
+    try:
+        result = await run_match(
+            resolution=args.resolution,
+            models=models,
+            verbose=verbose,
+        )
+    finally:
+        await registry.aclose()
 
     # Save individual debate transcripts
     debates_dir = Path("debates")
@@ -271,6 +272,11 @@ async def main() -> None:
     for name, record in sorted_models:
         print(f"  {name}: {record['wins']}W-{record['losses']}L")
 
+    resilience = format_resilience_summary()
+    if resilience:
+        print("\nRetries and circuit breakers:")
+        print(resilience)
+
     print(f"\nMatch summary saved to: {summary_file}")
     print(f"Individual debates saved to: {debates_dir}/")
 
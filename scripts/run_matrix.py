@@ -13,6 +13,30 @@ Examples:
 
   # Preview schedule and cost without running
   python scripts/run_matrix.py --dry-run
+
+  # Run up to 4 debates at once, at most 3 in-flight requests per model
+  python scripts/run_matrix.py --concurrency 4 --per-model-limit 3
+
+  # Offline load test: 20 in-process mock models, no API keys needed
+  python scripts/run_matrix.py --mock 20 --concurrency 16 --quiet
+
+  # Re-run after a crash without re-billing finished calls
+  python scripts/run_matrix.py --cache read-write
+
+  # Every phase of every debate as provider batch jobs, judged the same way
+  python scripts/run_matrix.py --lockstep --batch-judging
+
+  # Size concurrency and the ETA from measured profiles (scripts/preflight.py)
+  python scripts/run_matrix.py --concurrency auto
+
+  # Think less in cross-examination, judge with a fixed 2048-token budget
+  python scripts/run_matrix.py --reasoning cross_examination=low --judge-reasoning 2048
+
+  # Keep the last 3 speeches verbatim, summarize the rest, fit 6k tokens (12k for Claude)
+  python scripts/run_matrix.py --keep-verbatim 3 --context-budget 6000,claude=12000
+
+  # Pick up a crashed run where it stopped (the run ID is printed at start)
+  python scripts/run_matrix.py --resume 3f9c2a1b
 """
 
 import argparse
@@ -23,48 +47,110 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-from ai_debate.debate import transcript_to_markdown
+from ai_debate.debate import (
+    FORMATS,
+    ContextPolicy,
+    OutputGuard,
+    format_critical_path,
+    parse_context_budget,
+    parse_phase_reasoning,
+    transcript_to_markdown,
+)
+from ai_debate.judging.batch import BatchJudging
 from ai_debate.judging.judge import result_to_markdown
 from ai_debate.matrix import (
     MatrixRunner,
     build_matrix_schedule,
     estimate_matrix_cost,
+    estimate_matrix_duration,
     leaderboard_to_markdown,
     matrix_to_markdown,
     matrix_result_to_json,
+    suggest_concurrency,
 )
-from ai_debate.models import AnthropicModel, GoogleModel, OpenAIModel, XAIModel
-
-MODEL_REGISTRY = {
-    "claude": ("Claude", AnthropicModel, "ANTHROPIC_API_KEY"),
-    "gpt": ("GPT", OpenAIModel, "OPENAI_API_KEY"),
-    "gemini": ("Gemini", GoogleModel, "GOOGLE_API_KEY"),
-    "grok": ("Grok", XAIModel, "XAI_API_KEY"),
-}
+from ai_debate.models import ModelRegistry, PoolSettings, Reasoning
+from ai_debate.models.batch import DEFAULT_STRAGGLER_TIMEOUT, BatchDispatcher
+from ai_debate.models.cache import DEFAULT_CACHE_PATH, CacheMode, open_cache
+from ai_debate.models.hedging import hedge_stats
+from ai_debate.models.keypool import format_key_pool_summary
+from ai_debate.models.profile import PROFILE_PATH, ModelProfile, load_profiles
+from ai_debate.models.ratelimit import limiter_snapshots
+from ai_debate.models.resilience import format_resilience_summary
+from ai_debate.storage.journal import JOURNAL_DIR, RunJournal
+
+
+def build_context_policy(args: argparse.Namespace, catalog: ModelRegistry) -> ContextPolicy | None:
+    """The context policy asked for on the command line, or None."""
+    if args.keep_verbatim is None and args.context_budget is None:
+        return None
+    default, by_key = args.context_budget or (None, {})
+    # Budgets are given per model key but applied per model name.
+    budgets = {catalog.config(key).name: n for key, n in by_key.items() if key in catalog}
+    return ContextPolicy(
+        keep_verbatim=2 if args.keep_verbatim is None else args.keep_verbatim,
+        max_context_tokens=default,
+        model_budgets=budgets,
+        summary_words=args.summary_words,
+    )
 
 
-def init_models(keys: list[str]) -> dict[str, object]:
+def init_models(registry: ModelRegistry, keys: list[str]) -> dict[str, object]:
     """Initialize models by their short names. Returns dict of name -> model."""
     models = {}
     for key in keys:
         key = key.strip().lower()
-        if key not in MODEL_REGISTRY:
-            print(f"Unknown model: {key!r}. Available: {', '.join(MODEL_REGISTRY)}")
+        if key not in registry:
+            print(f"Unknown model: {key!r}. Available: {', '.join(registry.keys())}, mock-N")
             raise SystemExit(1)
 
-        label, cls, env_var = MODEL_REGISTRY[key]
+        config = registry.config(key)
         try:
-            model = cls()
+            model = registry.get(key)
             models[model.name] = model
             print(f"  {model.name} ({model.model_id})")
         except ValueError as e:
-            print(f"  Error initializing {label}: {e}")
-            print(f"  Set {env_var} environment variable")
+            print(f"  Error initializing {config.name}: {e}")
+            print(f"  Set {config.api_key_env} environment variable")
             raise SystemExit(1)
 
     return models
 
 
+def init_judge_backups(registry: ModelRegistry, keys: list[str]) -> dict[str, object]:
+    """Backup judge per model name, for models with a backup model ID."""
+    backups = {}
+    for key in keys:
+        key = key.strip().lower()
+        backup = registry.get_backup(key)
+        if backup is not None:
+            backups[registry.get(key).name] = backup
+    return backups
+
+
+def load_model_profiles(
+    registry: ModelRegistry,
+    keys: list[str],
+    path: Path,
+) -> dict[str, ModelProfile]:
+    """Saved preflight profiles for the given keys, by model name."""
+    saved = load_profiles(path)
+    profiles = {}
+    for key in keys:
+        if key not in registry:
+            continue
+        config = registry.config(key)
+        if config.model_id in saved:
+            profiles[config.name] = saved[config.model_id]
+    return profiles
+
+
+def concurrency_arg(value: str) -> int | str:
+    """A debate count, or "auto" to size it from measured rate limits."""
+    if value == "auto":
+        return value
+    return int(value)
+
+
 async def main() -> None:
     """Run a full matrix tournament."""
     parser = argparse.ArgumentParser(
@@ -82,13 +168,193 @@ async def main() -> None:
     parser.add_argument(
         "--models", "-m",
         default="claude,gpt,gemini,grok",
-        help="Comma-separated model keys (default: claude,gpt,gemini,grok)",
+        help="Comma-separated model keys (default: claude,gpt,gemini,grok); "
+             "mock-N keys run offline",
+    )
+    parser.add_argument(
+        "--mock",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Use N offline mock models (mock-1..mock-N) instead of --models",
     )
     parser.add_argument(
         "--dry-run",
         action="store_true",
         help="Show schedule and cost estimate without running",
     )
+    parser.add_argument(
+        "--concurrency", "-c",
+        type=concurrency_arg,
+        default=1,
+        help="Number of debates to run at once (default: 1, sequential), or 'auto' "
+             "to use the most the measured rate limits allow",
+    )
+    parser.add_argument(
+        "--profiles",
+        type=Path,
+        default=PROFILE_PATH,
+        help=f"Model profiles written by scripts/preflight.py (default: {PROFILE_PATH})",
+    )
+    parser.add_argument(
+        "--resume",
+        metavar="RUN_ID",
+        default=None,
+        help="Continue a crashed or interrupted run from its journal; judged debates, "
+             "speeches and judge decisions already journaled are not requested again",
+    )
+    parser.add_argument(
+        "--journal-dir",
+        type=Path,
+        default=JOURNAL_DIR,
+        help=f"Directory for run journals (default: {JOURNAL_DIR})",
+    )
+    parser.add_argument(
+        "--per-model-limit",
+        type=int,
+        default=None,
+        help="Max in-flight requests per model across all debates and panels",
+    )
+    parser.add_argument(
+        "--allow-judge-overlap",
+        action="store_true",
+        help="Let a model judge one debate while debating in another",
+    )
+    parser.add_argument(
+        "--pool-size",
+        type=int,
+        default=64,
+        help="Max pooled HTTP connections per provider (default: 64)",
+    )
+    parser.add_argument(
+        "--rate-limit",
+        action="store_true",
+        help="Throttle calls per provider (RPM/TPM buckets + adaptive concurrency)",
+    )
+    parser.add_argument(
+        "--hedge",
+        action="store_true",
+        help="Send a backup request when a call is slower than its recent p95 "
+             "(at most 5%% of calls)",
+    )
+    parser.add_argument(
+        "--batch-judging",
+        action="store_true",
+        help="Judge everything at the end via provider batch APIs (cheaper, slower); "
+             "providers without one use a local stand-in",
+    )
+    parser.add_argument(
+        "--no-judge-failover",
+        action="store_true",
+        help="Do not replace failing judges with their backup models",
+    )
+    parser.add_argument(
+        "--lockstep",
+        action="store_true",
+        help="Advance all debates phase by phase, submitting each phase as one "
+             "batch job per provider; failures and stragglers are retried interactively",
+    )
+    parser.add_argument(
+        "--straggler-timeout",
+        type=float,
+        default=DEFAULT_STRAGGLER_TIMEOUT,
+        help="Seconds to wait for a lockstep batch job before cancelling it and "
+             "retrying its unfinished requests interactively (default: 3600)",
+    )
+    parser.add_argument(
+        "--batch-poll",
+        type=float,
+        default=30.0,
+        help="Seconds between batch status checks (default: 30)",
+    )
+    parser.add_argument(
+        "--cache",
+        choices=[mode.value for mode in CacheMode],
+        default=CacheMode.OFF.value,
+        help="Response cache mode: off, read-write, read-only, or replay "
+             "(cached responses only; a miss is an error)",
+    )
+    parser.add_argument(
+        "--cache-path",
+        type=Path,
+        default=DEFAULT_CACHE_PATH,
+        help=f"Response cache file (default: {DEFAULT_CACHE_PATH})",
+    )
+    parser.add_argument(
+        "--matrix-timeout",
+        type=float,
+        default=None,
+        help="Seconds allowed for the whole matrix; unfinished debates are reported as failed",
+    )
+    parser.add_argument(
+        "--debate-timeout",
+        type=float,
+        default=None,
+        help="Seconds allowed per debate including judging; timed-out debates are retried once",
+    )
+    parser.add_argument(
+        "--format",
+        choices=sorted(FORMATS),
+        default="lincoln-douglas",
+        help="Debate format; 'simultaneous' writes both constructives (and both "
+             "cross-examinations) blind and in parallel",
+    )
+    parser.add_argument(
+        "--reasoning",
+        type=parse_phase_reasoning,
+        default=None,
+        metavar="TYPE=LEVEL,...",
+        help="Reasoning per phase type (constructive, cross_examination, rebuttal) as an "
+             "effort (none/minimal/low/medium/high) or a token budget; "
+             "unset types use the provider default",
+    )
+    parser.add_argument(
+        "--judge-reasoning",
+        type=Reasoning.parse,
+        default=None,
+        metavar="LEVEL",
+        help="Reasoning effort or token budget for judges (default: provider default)",
+    )
+    parser.add_argument(
+        "--keep-verbatim",
+        type=int,
+        default=None,
+        metavar="K",
+        help="Send only the last K speeches verbatim and summaries of older ones "
+             "(default: the whole debate verbatim)",
+    )
+    parser.add_argument(
+        "--context-budget",
+        type=parse_context_budget,
+        default=None,
+        metavar="TOKENS[,MODEL=TOKENS,...]",
+        help="Token budget for each speech request, optionally per model key; "
+             "implies --keep-verbatim 2 when that is not given",
+    )
+    parser.add_argument(
+        "--summary-words",
+        type=int,
+        default=100,
+        help="Length of each speech summary when compressing context (default: 100)",
+    )
+    parser.add_argument(
+        "--word-tolerance",
+        type=float,
+        default=OutputGuard.word_tolerance,
+        help="Stop a speech this share past its word limit and trim it to a sentence "
+             f"boundary (default: {OutputGuard.word_tolerance})",
+    )
+    parser.add_argument(
+        "--no-output-guard",
+        action="store_true",
+        help="Keep speeches as generated, even past the word limit or when they loop",
+    )
+    parser.add_argument(
+        "--share-openings",
+        action="store_true",
+        help="Generate each model's opening case once per side and reuse it against every "
+             "opponent (prompts then leave out the opponent's name)",
+    )
     parser.add_argument(
         "--quiet", "-q",
         action="store_true",
@@ -97,7 +363,10 @@ async def main() -> None:
     args = parser.parse_args()
     verbose = not args.quiet
 
-    model_keys = [k.strip() for k in args.models.split(",")]
+    if args.mock is not None:
+        model_keys = [f"mock-{i}" for i in range(1, args.mock + 1)]
+    else:
+        model_keys = [k.strip() for k in args.models.split(",")]
     num_models = len(model_keys)
 
     # Cost estimate
@@ -107,6 +376,35 @@ async def main() -> None:
     print(f"  Total debates: {cost['total_debates']}")
     print(f"  Judges per debate: {cost['judges_per_debate']}")
     print(f"  Estimated tokens: ~{cost['estimated_total_tokens']:,}")
+    debate_format = FORMATS[args.format].with_reasoning(args.reasoning, args.judge_reasoning)
+    print(f"  Format: {debate_format.name}, {format_critical_path(debate_format)}")
+    if debate_format.reasoning or debate_format.judge_reasoning:
+        settings = [f"{t.value}={r}" for t, r in debate_format.reasoning.items()]
+        if debate_format.judge_reasoning:
+            settings.append(f"judges={debate_format.judge_reasoning}")
+        print(f"  Reasoning: {', '.join(settings)}")
+
+    catalog = ModelRegistry()  # Configs only; no adapter is built
+    context_policy = build_context_policy(args, catalog)
+    if context_policy is not None:
+        budget = context_policy.max_context_tokens
+        print(f"  Context: last {context_policy.keep_verbatim} speeches verbatim, "
+              f"budget {f'{budget:,} tokens' if budget else 'none'}"
+              + "".join(f", {name}: {n:,}" for name, n in context_policy.model_budgets.items()))
+    if args.share_openings:
+        print("  Openings: generated once per model and side, shared across opponents")
+    profiles = load_model_profiles(catalog, model_keys, args.profiles)
+    named_schedule = build_matrix_schedule(
+        [catalog.config(key).name for key in model_keys if key in catalog]
+    )
+    if args.concurrency == "auto":
+        args.concurrency = suggest_concurrency(named_schedule, profiles, debate_format)
+        print(f"  Concurrency: {args.concurrency} (from measured rate limits)")
+    eta = estimate_matrix_duration(named_schedule, profiles, args.concurrency, debate_format)
+    if eta is not None:
+        print(f"  Estimated duration: ~{eta / 60:.1f} min at concurrency {args.concurrency}")
+    elif profiles:
+        print("  Estimated duration: unknown (some models have no profile; run preflight.py)")
     print()
 
     if args.dry_run:
@@ -123,12 +421,44 @@ async def main() -> None:
 
     # Initialize models
     print("Initializing models...")
-    models = init_models(model_keys)
+    cache = open_cache(args.cache, args.cache_path)
+    registry = ModelRegistry(
+        pool_settings=PoolSettings(
+            max_connections=args.pool_size,
+            max_keepalive_connections=args.pool_size,
+        ),
+        rate_limit=args.rate_limit,
+        hedge=args.hedge,
+        cache=cache,
+    )
+    models = init_models(registry, model_keys)
 
     if len(models) < 2:
         print("\nNeed at least 2 models. Exiting.")
         return
 
+    # Build schedule
+    model_names = list(models.keys())
+    schedule = build_matrix_schedule(model_names)
+
+    if args.resume:
+        try:
+            journal = RunJournal.resume(args.resume, args.journal_dir, debate_format)
+        except (FileNotFoundError, ValueError) as e:
+            print(f"\n{e}")
+            raise SystemExit(1)
+        if journal.header is not None:
+            if journal.header["models"] != model_names:
+                print(f"\nRun {args.resume} used models {', '.join(journal.header['models'])}; "
+                      f"pass the same --models to resume it.")
+                raise SystemExit(1)
+            args.resolution = journal.header["resolution"]
+    else:
+        journal = RunJournal(directory=args.journal_dir, format=debate_format)
+    print(f"\nRun ID: {journal.run_id} (resume with --resume {journal.run_id})")
+
+    await registry.prewarm(connections=max(1, args.concurrency))
+
     print(f"\nResolution: {args.resolution}")
     print(f"Matrix: {cost['total_debates']} debates, every model debates every other\n")
 
@@ -147,20 +477,52 @@ async def main() -> None:
         if verbose:
             print(f"  Saved: {output_file}")
 
-    # Build schedule and run
-    model_names = list(models.keys())
-    schedule = build_matrix_schedule(model_names)
-
     runner = MatrixRunner(
         models=models,
         verbose=verbose,
         on_debate_complete=on_debate_complete,
+        max_concurrent_debates=args.concurrency,
+        per_model_limit=args.per_model_limit,
+        exclusive_judging=not args.allow_judge_overlap,
+        matrix_timeout=args.matrix_timeout,
+        debate_timeout=args.debate_timeout,
+        batch_judging=(
+            BatchJudging(
+                verbose=verbose,
+                poll_interval=args.batch_poll,
+                reasoning=debate_format.judge_reasoning,
+            )
+            if args.batch_judging
+            else None
+        ),
+        lockstep=(
+            BatchDispatcher(verbose=verbose, poll_interval=args.batch_poll, label="lockstep")
+            if args.lockstep
+            else None
+        ),
+        straggler_timeout=args.straggler_timeout,
+        judge_backups=(
+            None if args.no_judge_failover else init_judge_backups(registry, model_keys)
+        ),
+        debate_format=debate_format,
+        profiles=profiles,
+        context_policy=context_policy,
+        journal=journal,
+        output_guard=None if args.no_output_guard else OutputGuard(args.word_tolerance),
+        share_openings=args.share_openings,
     )
 
-    result = await runner.run_matrix(
-        resolution=args.resolution,
-        schedule=schedule,
-    )
+    try:
+        result = await runner.run_matrix(
+            resolution=args.resolution,
+            schedule=schedule,
+        )
+    finally:
+        journal.close()
+        await registry.aclose()
+        if cache is not None:
+            cache_summary = cache.summary()
+            cache.close()
 
     # Save matrix summary
     matrix_id = result.started_at.strftime("%Y%m%d-%H%M%S")
@@ -178,6 +540,82 @@ async def main() -> None:
     print()
     print(leaderboard_to_markdown(result.stats))
 
+    if result.failed_debates:
+        failed = ", ".join(str(i + 1) for i in result.failed_debates)
+        print(f"Not scored (timed out or no judge available): debates {failed}")
+        print()
+
+    speeches = [
+        record for r in result.debate_results for record in r.usage if record.get("stopped")
+    ]
+    if speeches:
+        tokens = sum(record["tokens_saved"] for record in speeches)
+        seconds = sum(record["seconds_saved"] for record in speeches)
+        print(f"Output guard: {len(speeches)} speech(es) cut short, ~{tokens:,} tokens and "
+              f"~{seconds:.0f}s of generation saved")
+        print()
+
+    shared = [
+        record for r in result.debate_results for record in r.usage if record.get("shared_from")
+    ]
+    if shared:
+        tokens = sum(record["shared_tokens_saved"] for record in shared)
+        print(f"Shared openings: {len(shared)} speech(es) reused, ~{tokens:,} tokens not spent")
+        print()
+
+    calls = [record for r in result.debate_results for record in r.usage]
+    read = sum(record["cache_read_input_tokens"] for record in calls)
+    written = sum(record["cache_creation_input_tokens"] for record in calls)
+    if read or written:
+        total = sum(record["input_tokens"] for record in calls)
+        billed = sum(
+            record["input_tokens"]
+            if record["billed_input_tokens"] is None
+            else record["billed_input_tokens"]
+            for record in calls
+        )
+        print(f"Prompt caching: {read:,} of {total:,} input tokens read from cache, "
+              f"{written:,} written; billed like ~{billed:,.0f} uncached")
+        print()
+
+    if context_policy is not None:
+        saved = sum(r.context_tokens_saved for r in result.debate_results)
+        spent = sum(r.summary_tokens for r in result.debate_results)
+        print(f"Context compression: ~{saved:,} input tokens saved, "
+              f"{spent:,} tokens spent on summaries")
+        print()
+
+    if args.rate_limit:
+        print("Provider limiters:")
+        for provider, snap in limiter_snapshots().items():
+            print(f"  {provider}: limit {snap['current_limit']}, "
+                  f"{snap['completed']} calls, {snap['throttled']} throttled")
+        print()
+
+    if args.hedge:
+        print("Hedged requests:")
+        for stats in hedge_stats().values():
+            print(f"  {stats.model_name}: {stats.hedged}/{stats.calls} hedged, "
+                  f"{stats.hedge_wins} won, ~{stats.seconds_saved:.1f}s tail latency saved")
+        print()
+
+    if cache is not None:
+        print("Response cache:")
+        print(cache_summary)
+        print()
+
+    resilience = format_resilience_summary()
+    if resilience:
+        print("Retries and circuit breakers:")
+        print(resilience)
+        print()
+
+    key_usage = format_key_pool_summary()
+    if key_usage:
+        print("API key usage:")
+        print(key_usage)
+        print()
+
     print(f"Matrix summary: {summary_file}")
     print(f"Structured data: {json_file}")
     print(f"Individual debates: {debates_dir}/")
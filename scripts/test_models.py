@@ -7,16 +7,16 @@ import sys
 from dotenv import load_dotenv
 load_dotenv()
 
-from ai_debate.models import AnthropicModel, OpenAIModel, GoogleModel, XAIModel
+from ai_debate.models import ModelRegistry, get_registry
 from ai_debate.models.base import Message, Role
 
 
-async def test_model(name: str, model_class: type) -> bool:
+async def test_model(name: str, registry: ModelRegistry, key: str) -> bool:
     """Test a single model adapter."""
     print(f"\nTesting {name}...")
 
     try:
-        model = model_class()
+        model = registry.get(key)
         print(f"  Model: {model.name} ({model.model_id})")
     except ValueError as e:
         print(f"  ✗ Failed to initialize: {e}")
@@ -38,17 +38,20 @@ async def test_model(name: str, model_class: type) -> bool:
 
 async def main() -> None:
     """Test all configured model adapters."""
+    registry = get_registry()
     models = [
-        ("Anthropic (Claude)", AnthropicModel),
-        ("OpenAI (GPT)", OpenAIModel),
-        ("Google (Gemini)", GoogleModel),
-        ("xAI (Grok)", XAIModel),
+        ("Anthropic (Claude)", "claude"),
+        ("OpenAI (GPT)", "gpt"),
+        ("Google (Gemini)", "gemini"),
+        ("xAI (Grok)", "grok"),
     ]
 
     results = {}
 
-    for name, model_class in models:
-        results[name] = await test_model(name, model_class)
+    for name, key in models:
+        results[name] = await test_model(name, registry, key)
+
+    await registry.aclose()
 
     # Summary
     print("\n" + "=" * 40)
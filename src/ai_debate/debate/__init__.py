@@ -1,27 +1,46 @@
 """Debate engine and format definitions."""
 
+from ai_debate.debate.context import ContextPolicy, parse_context_budget
 from ai_debate.debate.engine import (
     DebateEngine,
     DebateTranscript,
     PhaseResult,
+    PhaseStreamError,
     transcript_to_markdown,
 )
 from ai_debate.debate.formats import (
+    FORMATS,
     LINCOLN_DOUGLAS,
+    SIMULTANEOUS_OPENINGS,
     DebateFormat,
     DebatePhase,
     PhaseType,
     SpeakerRole,
+    format_critical_path,
+    parse_phase_reasoning,
 )
+from ai_debate.debate.guard import DEFAULT_GUARD, OutputGuard, StopReason
+from ai_debate.debate.sharing import SharedSpeeches
 
 __all__ = [
+    "ContextPolicy",
+    "DEFAULT_GUARD",
     "DebateEngine",
     "DebateFormat",
     "DebatePhase",
     "DebateTranscript",
+    "FORMATS",
     "LINCOLN_DOUGLAS",
+    "OutputGuard",
     "PhaseResult",
+    "PhaseStreamError",
     "PhaseType",
+    "SIMULTANEOUS_OPENINGS",
+    "SharedSpeeches",
     "SpeakerRole",
+    "StopReason",
+    "format_critical_path",
+    "parse_context_budget",
+    "parse_phase_reasoning",
     "transcript_to_markdown",
 ]
@@ -0,0 +1,155 @@
+"""Rolling compression of earlier speeches in a debater's context.
+
+By default every speech is sent verbatim for the rest of the debate, so a
+closing rebuttal carries the whole transcript. A ContextPolicy keeps only
+the most recent speeches verbatim and sends a short summary in place of
+each older one. If the context is still over the speaker's token budget,
+more recent speeches are summarized too, and as a last resort the oldest
+are left out.
+
+Summaries are written once per speech (by ``summarizer``, or else by the
+model that gave the speech) and kept on its PhaseResult, so both debaters
+and every later phase reuse them. Replacing a speech changes the prefix the
+provider has cached, so compression trades some cache reads for a shorter
+prompt; DebateTranscript.context_tokens_saved and summary_tokens show
+whether it paid off.
+"""
+
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import TYPE_CHECKING
+
+from ai_debate.models.base import DebateModel
+
+if TYPE_CHECKING:
+    from ai_debate.debate.engine import PhaseResult
+
+CHARS_PER_TOKEN = 4
+TOKENS_PER_WORD = 1.3
+
+SUMMARY_SYSTEM_PROMPT = (
+    "You condense speeches from a formal debate so they can be quoted back to the "
+    "debaters later.\n"
+    "\n"
+    "Keep every claim, argument, piece of evidence, and direct question in the speech "
+    "you are given, in the order given and attributed to the speaker. Do not evaluate "
+    "the speech or add anything of your own. Reply with the summary only.\n"
+    "\n"
+    "Stay within {words} words."
+)
+
+SUMMARY_PREFIX = "[Summary] "
+OMITTED_NOTE = "[Left out to fit the context budget]"
+
+
+class Condensed(StrEnum):
+    """How an older speech is sent instead of verbatim."""
+
+    SUMMARY = "summary"
+    OMITTED = "omitted"
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count of ``text`` (four characters per token)."""
+    return len(text) // CHARS_PER_TOKEN
+
+
+@dataclass
+class ContextPolicy:
+    """Which earlier speeches a debater is sent verbatim.
+
+    Attributes:
+        keep_verbatim: Number of most recent speeches (by either side)
+            always sent in full while the budget allows.
+        max_context_tokens: Default budget for the system prompt plus
+            messages of one speech request (None for no budget).
+        model_budgets: Budgets by model name, overriding the default.
+        summary_words: Length asked of each summary.
+        summarizer: Model that writes the summaries; None means each
+            speech is summarized by the model that gave it.
+    """
+
+    keep_verbatim: int = 2
+    max_context_tokens: int | None = None
+    model_budgets: dict[str, int] = field(default_factory=dict)
+    summary_words: int = 100
+    summarizer: DebateModel | None = None
+
+    def budget_for(self, model_name: str) -> int | None:
+        """The context budget for one speaker."""
+        return self.model_budgets.get(model_name, self.max_context_tokens)
+
+    def plan(
+        self,
+        phases: list["PhaseResult"],
+        fixed_tokens: int,
+        budget: int | None,
+    ) -> dict[int, Condensed]:
+        """Which speeches (by index in ``phases``) to condense, and how.
+
+        Args:
+            phases: Every finished speech, oldest first.
+            fixed_tokens: Size of the request apart from the speeches
+                (system prompt, phase instructions, headings).
+            budget: Token budget for the whole request, or None.
+
+        Returns:
+            The condensed speeches; any index not listed is sent verbatim.
+        """
+        recent = max(0, len(phases) - self.keep_verbatim)
+        # Speeches no longer than a summary are not worth summarizing.
+        plan = {
+            i: Condensed.SUMMARY for i in range(recent)
+            if phases[i].word_count > self.summary_words
+        }
+        if budget is None:
+            return plan
+
+        def cost(i: int) -> int:
+            mode = plan.get(i)
+            if mode is Condensed.OMITTED:
+                return estimate_tokens(OMITTED_NOTE)
+            if mode is Condensed.SUMMARY:
+                summary = phases[i].summary
+                if summary is None:
+                    return int(self.summary_words * TOKENS_PER_WORD)
+                return estimate_tokens(SUMMARY_PREFIX + summary)
+            return estimate_tokens(phases[i].content)
+
+        def size() -> int:
+            return fixed_tokens + sum(cost(i) for i in range(len(phases)))
+
+        # Summarize the verbatim speeches oldest first, then drop summaries
+        # oldest first, until the request fits.
+        for i in range(len(phases)):
+            if size() <= budget:
+                return plan
+            if i not in plan and phases[i].word_count > self.summary_words:
+                plan[i] = Condensed.SUMMARY
+        for i in range(len(phases)):
+            if size() <= budget:
+                break
+            plan[i] = Condensed.OMITTED
+        return plan
+
+
+def parse_context_budget(spec: str) -> tuple[int | None, dict[str, int]]:
+    """Parse ``"8000"`` or ``"8000,claude=20000,gpt=12000"``.
+
+    Returns:
+        (default budget or None, budgets by the given model keys).
+
+    Raises:
+        ValueError: If a budget is not a positive integer.
+    """
+    default: int | None = None
+    budgets: dict[str, int] = {}
+    for part in spec.split(","):
+        key, sep, value = part.strip().rpartition("=")
+        if not value.strip().isdigit() or int(value) <= 0:
+            raise ValueError(f"Invalid context budget {part.strip()!r}: expected a token count")
+        if sep:
+            budgets[key.strip()] = int(value)
+        else:
+            default = int(value)
+    return default, budgets
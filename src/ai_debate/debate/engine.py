@@ -1,10 +1,22 @@
 """Core debate engine for orchestrating AI debates."""
 
+import asyncio
+import time
+from collections.abc import Callable
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import Protocol
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Protocol
 from uuid import uuid4
 
+from ai_debate.debate.context import (
+    OMITTED_NOTE,
+    SUMMARY_PREFIX,
+    SUMMARY_SYSTEM_PROMPT,
+    TOKENS_PER_WORD,
+    Condensed,
+    ContextPolicy,
+    estimate_tokens,
+)
 from ai_debate.debate.formats import (
     LINCOLN_DOUGLAS,
     DebateFormat,
@@ -12,7 +24,20 @@ from ai_debate.debate.formats import (
     PhaseType,
     SpeakerRole,
 )
-from ai_debate.models.base import DebateModel, Message, ModelResponse, Role
+from ai_debate.debate.guard import DEFAULT_GUARD, OutputGuard, StopReason
+from ai_debate.debate.sharing import SharedSpeeches
+from ai_debate.models.base import (
+    DebateModel,
+    Message,
+    ModelResponse,
+    Reasoning,
+    Role,
+    Usage,
+)
+from ai_debate.models.deadline import Deadline, child_deadline, run_with_deadline
+
+if TYPE_CHECKING:
+    from ai_debate.storage.journal import RunJournal
 
 
 @dataclass
@@ -26,6 +51,32 @@ class PhaseResult:
     word_count: int
     input_tokens: int
     output_tokens: int
+    ttft_seconds: float | None = None  # Time to first token (streaming only)
+    duration_seconds: float | None = None
+    usage: Usage = field(default_factory=Usage)
+    summary: str | None = None  # Written once, when a ContextPolicy first condenses it
+    # Set when the OutputGuard cut the speech short; the savings are
+    # estimates (the max_tokens budget left when a stream was stopped).
+    stopped: StopReason | None = None
+    tokens_saved: int = 0
+    seconds_saved: float = 0.0
+    # Set on a copy of a speech generated for another debate (the transcript
+    # it was generated for). A copy costs nothing, so its token counts and
+    # usage are zero and shared_tokens_saved holds what the original spent.
+    shared_from: str | None = None
+    shared_tokens_saved: int = 0
+
+
+class PhaseStreamError(RuntimeError):
+    """A streamed speech failed after some text had already arrived."""
+
+    def __init__(self, phase: DebatePhase, speaker: str, partial: str):
+        super().__init__(
+            f"{phase.name} by {speaker} failed after {count_words(partial)} words"
+        )
+        self.phase = phase
+        self.speaker = speaker
+        self.partial = partial
 
 
 @dataclass
@@ -40,6 +91,14 @@ class DebateTranscript:
     phases: list[PhaseResult]
     started_at: datetime
     completed_at: datetime | None = None
+    # Context compression (see ContextPolicy): estimated input tokens not
+    # sent, and tokens spent writing the summaries.
+    context_tokens_saved: int = 0
+    summary_tokens: int = 0
+    # Set on a fork (see DebateEngine.fork_debate): the transcript it
+    # branched from, and how many of its phases it shares with that parent.
+    parent_id: str | None = None
+    forked_at: int | None = None
 
     @property
     def total_input_tokens(self) -> int:
@@ -56,6 +115,21 @@ class DebateTranscript:
         """Total words in the debate."""
         return sum(p.word_count for p in self.phases)
 
+    @property
+    def shared_tokens(self) -> int:
+        """Tokens not spent because speeches were copied from another debate."""
+        return sum(p.shared_tokens_saved for p in self.phases)
+
+    @property
+    def guard_tokens_saved(self) -> int:
+        """Estimated output tokens not generated because a speech was stopped."""
+        return sum(p.tokens_saved for p in self.phases)
+
+    @property
+    def guard_seconds_saved(self) -> float:
+        """Estimated generation time saved by stopping speeches."""
+        return sum(p.seconds_saved for p in self.phases)
+
 
 DEBATER_SYSTEM_PROMPT = """You are participating in a formal Lincoln-Douglas style debate.
 
@@ -67,39 +141,107 @@ You are arguing the {position} position. You MUST argue this position convincing
 YOUR OPPONENT: {opponent_name}
 
 DEBATE RULES:
-1. Stay within the word limit for each speech ({word_limit} words for this speech)
+1. Stay within the word limit given for each speech
 2. Be persuasive but intellectually honest—no fabricated statistics or false claims
 3. Engage directly with your opponent's arguments when appropriate
 4. Use clear structure and signposting
 5. Maintain a respectful, professional tone
 
-CURRENT PHASE: {phase_name}
-{phase_instructions}
+The debate unfolds in this conversation. Your opponent's speeches arrive as messages \
+together with the instructions for your next speech; your own earlier speeches are your \
+previous replies."""
 
-DEBATE SO FAR:
-{transcript}
+PHASE_PROMPT = """CURRENT PHASE: {phase_name}
+{phase_instructions}
 
 Now deliver your {phase_name}. Stay within {word_limit} words."""
 
+DEBATE_OPENING = "(This is the beginning of the debate.)"
+
+# Named in place of the opponent when speeches are shared across debates.
+ANONYMOUS_OPPONENT = "Another AI model"
+
 
 def count_words(text: str) -> int:
     """Count words in text."""
     return len(text.split())
 
 
+def default_phase_timeout(phase: DebatePhase) -> float:
+    """Generous per-phase budget: a fixed allowance plus time per word."""
+    return 60.0 + 0.25 * phase.word_limit
+
+
+def format_speech(phase: PhaseResult, content: str | None = None) -> str:
+    """A finished speech with its phase heading, optionally condensed to ``content``."""
+    role_label = phase.speaker_role.value.upper()
+    return f"=== {phase.phase.name} ({role_label}) ===\n{content or phase.content}\n"
+
+
 def format_transcript_for_context(phases: list[PhaseResult]) -> str:
     """Format completed phases as context for the next speaker."""
     if not phases:
-        return "(This is the beginning of the debate.)"
+        return DEBATE_OPENING
+    return "\n".join(format_speech(phase) for phase in phases)
 
-    lines = []
-    for phase in phases:
-        role_label = phase.speaker_role.value.upper()
-        lines.append(f"=== {phase.phase.name} ({role_label}) ===")
-        lines.append(phase.content)
-        lines.append("")
 
-    return "\n".join(lines)
+def _messages_tokens(messages: list[Message]) -> int:
+    return sum(estimate_tokens(m.content) for m in messages)
+
+
+def build_debater_messages(
+    phases: list[PhaseResult],
+    current: DebatePhase,
+    condensed: dict[int, str] | None = None,
+) -> list[Message]:
+    """The conversation sent to the speaker of ``current``.
+
+    Each of the speaker's earlier speeches is an assistant turn, preceded by
+    a user turn with the opponent's speeches since the speaker last spoke
+    and the instructions that speech answered. Earlier turns never change
+    as the debate goes on, so every request extends the speaker's previous
+    one; the last turn is marked for prompt caching so the next request can
+    read the whole prefix back from the provider's cache.
+
+    ``condensed`` maps indexes in ``phases`` to text sent in place of the
+    speech (a summary or an omission note), which gives up that stability.
+
+    An opponent's speech that one of the speaker's own speeches did not see
+    (see DebatePhase.depends_on) is held back until after that speech, so
+    a speech written blind is replayed just as it was written.
+    """
+    condensed = condensed or {}
+    messages: list[Message] = []
+    pending: list[tuple[str, str]] = []  # (phase name, formatted speech)
+
+    def turn(phase: DebatePhase, context: list[str]) -> str:
+        context = context or ([] if messages else [DEBATE_OPENING + "\n"])
+        prompt = PHASE_PROMPT.format(
+            phase_name=phase.name,
+            phase_instructions=phase.instructions,
+            word_limit=phase.word_limit,
+        )
+        return "\n".join([*context, prompt])
+
+    for i, result in enumerate(phases):
+        if result.speaker_role == current.speaker_role:
+            seen = result.phase.depends_on
+            shown = [text for name, text in pending if seen is None or name in seen]
+            pending = [
+                (name, text) for name, text in pending if seen is not None and name not in seen
+            ]
+            messages.append(Message(role=Role.USER, content=turn(result.phase, shown)))
+            messages.append(Message(
+                role=Role.ASSISTANT, content=condensed.get(i, result.content)
+            ))
+        elif i in condensed:
+            pending.append((result.phase.name, format_speech(result, condensed[i])))
+        else:
+            pending.append((result.phase.name, format_speech(result)))
+    messages.append(Message(
+        role=Role.USER, content=turn(current, [text for _, text in pending]), cache_control=True
+    ))
+    return messages
 
 
 class DebateEngine:
@@ -109,34 +251,692 @@ class DebateEngine:
         self,
         format: DebateFormat = LINCOLN_DOUGLAS,
         verbose: bool = True,
+        stream: bool = True,
+        on_token: Callable[[DebatePhase, str], None] | None = None,
+        phase_timeout: Callable[[DebatePhase], float | None] | None = default_phase_timeout,
+        debate_timeout: float | None = None,
+        context_policy: ContextPolicy | None = None,
+        journal: "RunJournal | None" = None,
+        output_guard: OutputGuard | None = DEFAULT_GUARD,
+        shared: SharedSpeeches | None = None,
     ):
         """Initialize the debate engine.
 
         Args:
             format: The debate format to use.
             verbose: Whether to print progress during debate.
+            stream: Use the models' generate_stream() so tokens are shown as
+                they arrive and time-to-first-token is recorded per phase.
+                Models without generate_stream() fall back to generate().
+            on_token: Optional callback receiving (phase, text_delta) for
+                every streamed delta.
+            phase_timeout: Seconds allowed per phase, as a function of the
+                phase (None for no per-phase limit). Retries inside the
+                model share this budget.
+            debate_timeout: Seconds allowed for the whole debate.
+            context_policy: Condense older speeches in each request
+                (None sends the whole debate verbatim). The summaries
+                are written by prepare_context() before the request.
+            journal: Write-ahead journal that every new transcript, speech
+                and summary is appended to as soon as it exists.
+            output_guard: Stops a streamed speech once it passes its word
+                limit (plus tolerance) or starts repeating itself, and
+                trims it to a sentence boundary; unstreamed speeches are
+                trimmed the same way. None keeps every speech as generated.
+            shared: Generate each opponent-independent speech once and copy
+                it into every debate that needs it (see SharedSpeeches).
+                Prompts then leave out the opponent's name.
         """
         self.format = format
         self.verbose = verbose
+        self.stream = stream
+        self.on_token = on_token
+        self.phase_timeout = phase_timeout
+        self.debate_timeout = debate_timeout
+        self.context_policy = context_policy
+        self.journal = journal
+        self.output_guard = output_guard
+        self.shared = shared
+        self._summarizing: dict[int, asyncio.Future[None]] = {}  # id(PhaseResult) -> summary
+
+    async def _generate(
+        self,
+        speaker: DebateModel,
+        phase: DebatePhase,
+        system_prompt: str,
+        messages: list[Message],
+        max_tokens: int,
+        timeout: float | None = None,
+        reasoning: Reasoning | None = None,
+        echo: bool = True,
+    ) -> tuple[ModelResponse, float | None, float]:
+        """Run one speech, streaming when possible.
+
+        In verbose mode the speech is printed as it arrives unless ``echo``
+        is unset.
+
+        Returns:
+            (response, time to first token or None, total seconds).
+        """
+        started = time.monotonic()
+
+        if not self.stream or not hasattr(speaker, "generate_stream"):
+            response = await speaker.generate(
+                system_prompt=system_prompt,
+                messages=messages,
+                max_tokens=max_tokens,
+                timeout=timeout,
+                reasoning=reasoning,
+            )
+            if self.verbose and echo:
+                print(response.content)
+            return response, None, time.monotonic() - started
+
+        ttft: float | None = None
+        parts: list[str] = []
+        final: ModelResponse | None = None
+        watch = self.output_guard.watch(phase.word_limit) if self.output_guard else None
+        stop: StopReason | None = None
+        stream = speaker.generate_stream(
+            system_prompt=system_prompt,
+            messages=messages,
+            max_tokens=max_tokens,
+            timeout=timeout,
+            reasoning=reasoning,
+        )
+        try:
+            async for chunk in stream:
+                if chunk.text:
+                    if ttft is None:
+                        ttft = time.monotonic() - started
+                    parts.append(chunk.text)
+                    if self.verbose and echo:
+                        print(chunk.text, end="", flush=True)
+                    if self.on_token:
+                        self.on_token(phase, chunk.text)
+                    if watch is not None:
+                        stop = watch.feed(chunk.text)
+                        if stop is not None:
+                            break
+                if chunk.response is not None:
+                    final = chunk.response
+        except Exception as e:
+            if parts:
+                raise PhaseStreamError(phase, speaker.name, "".join(parts)) from e
+            raise
+        finally:
+            # Closing the stream drops the connection, so a stopped speech
+            # stops generating (and billing) on the provider's side too.
+            await stream.aclose()
+
+        if self.verbose and echo:
+            print()
+        if stop is not None:
+            final = self._stopped_response(
+                speaker, phase, system_prompt, messages, max_tokens,
+                "".join(parts), stop, ttft, time.monotonic() - started,
+            )
+        if final is None:
+            raise RuntimeError(f"{speaker.name} stream ended without a final response")
+        return final, ttft, time.monotonic() - started
+
+    def _stopped_response(
+        self,
+        speaker: DebateModel,
+        phase: DebatePhase,
+        system_prompt: str,
+        messages: list[Message],
+        max_tokens: int,
+        text: str,
+        stop: StopReason,
+        ttft: float | None,
+        elapsed: float,
+    ) -> ModelResponse:
+        """The response for a stream the output guard stopped.
+
+        The provider's usage never arrives, so token counts are estimated
+        from the text. The saving is the rest of the max_tokens budget, at
+        the speed this stream was generating.
+        """
+        assert self.output_guard is not None
+        generated = round(count_words(text) * TOKENS_PER_WORD)
+        tokens_saved = max(0, max_tokens - generated)
+        generating = elapsed - (ttft or 0.0)
+        seconds_saved = tokens_saved * generating / generated if generated else 0.0
+        if self.verbose:
+            print(f"[Stopped: {stop.value.replace('_', ' ')}; "
+                  f"~{tokens_saved} tokens, ~{seconds_saved:.1f}s saved]")
+        return ModelResponse(
+            content=self.output_guard.trim(text, phase.word_limit, stop),
+            model=speaker.model_id,
+            input_tokens=estimate_tokens(system_prompt) + _messages_tokens(messages),
+            output_tokens=generated,
+            metadata={
+                "finish_reason": "stopped",
+                "stopped": stop,
+                "tokens_saved": tokens_saved,
+                "seconds_saved": seconds_saved,
+            },
+            usage=Usage(ttft_seconds=ttft, latency_seconds=elapsed),
+        )
+
+    def start_transcript(
+        self,
+        resolution: str,
+        affirmative: DebateModel,
+        negative: DebateModel,
+        debate_index: int | None = None,
+    ) -> DebateTranscript:
+        """An empty transcript that phases are appended to as they finish.
+
+        ``debate_index`` identifies the debate in the journal (a matrix
+        schedule index; None for a standalone debate).
+        """
+        transcript = DebateTranscript(
+            id=str(uuid4())[:8],
+            resolution=resolution,
+            affirmative_model=affirmative.name,
+            negative_model=negative.name,
+            format_name=self.format.name,
+            phases=[],
+            started_at=datetime.now(UTC),
+        )
+        if self.journal is not None:
+            self.journal.record_debate(transcript, debate_index)
+        return transcript
+
+    def fork_transcript(
+        self,
+        parent: DebateTranscript,
+        phase_index: int,
+        affirmative: DebateModel,
+        negative: DebateModel,
+    ) -> DebateTranscript:
+        """A transcript sharing ``parent``'s first ``phase_index`` phases.
+
+        The PhaseResults are the parent's own objects, not copies, and the
+        journal stores only a reference to the parent for them.
+
+        Raises:
+            ValueError: If ``parent`` does not have ``phase_index`` phases,
+                or follows another format.
+        """
+        if parent.format_name != self.format.name:
+            raise ValueError(
+                f"Cannot fork a {parent.format_name} debate with a {self.format.name} engine"
+            )
+        if not 0 <= phase_index <= min(len(parent.phases), len(self.format.phases) - 1):
+            raise ValueError(
+                f"Cannot fork debate {parent.id} at phase {phase_index + 1}: it has "
+                f"{len(parent.phases)} of {len(self.format.phases)} phases"
+            )
+        transcript = DebateTranscript(
+            id=str(uuid4())[:8],
+            resolution=parent.resolution,
+            affirmative_model=affirmative.name,
+            negative_model=negative.name,
+            format_name=self.format.name,
+            phases=parent.phases[:phase_index],
+            started_at=datetime.now(UTC),
+            parent_id=parent.id,
+            forked_at=phase_index,
+        )
+        if self.journal is not None:
+            self.journal.record_debate(transcript)
+        return transcript
+
+    async def fork_debate(
+        self,
+        parent: DebateTranscript,
+        phase_index: int,
+        affirmative: DebateModel,
+        negative: DebateModel,
+        deadline: Deadline | None = None,
+    ) -> DebateTranscript:
+        """Rerun a debate from one phase on, keeping every earlier phase as it was.
+
+        Only the phases from ``phase_index`` (0-based) onward are generated,
+        by ``affirmative`` and ``negative``, which may differ from the
+        parent's models (e.g. another model giving the rebuttal).
+
+        Raises:
+            ValueError: See fork_transcript().
+            DeadlineExceededError: As for run_debate().
+        """
+        transcript = self.fork_transcript(parent, phase_index, affirmative, negative)
+        return await self.run_debate(
+            parent.resolution, affirmative, negative, deadline, transcript=transcript
+        )
+
+    def _speaker_prompt(
+        self,
+        transcript: DebateTranscript,
+        role: SpeakerRole,
+        affirmative: DebateModel,
+        negative: DebateModel,
+    ) -> tuple[DebateModel, str]:
+        """The model speaking for ``role`` and its system prompt."""
+        # Determine which model speaks
+        if role == SpeakerRole.AFFIRMATIVE:
+            speaker = affirmative
+            opponent = negative
+        else:
+            speaker = negative
+            opponent = affirmative
+
+        # The system prompt is fixed for the whole debate and the messages
+        # only grow, so each speaker's requests share a cacheable prefix.
+        system_prompt = DEBATER_SYSTEM_PROMPT.format(
+            resolution=transcript.resolution,
+            position=role.value,
+            opponent_name=opponent.name if self.shared is None else ANONYMOUS_OPPONENT,
+        )
+        return speaker, system_prompt
+
+    def visible_phases(
+        self,
+        transcript: DebateTranscript,
+        phase: DebatePhase,
+        finished: dict[int, PhaseResult] | None = None,
+    ) -> list[PhaseResult]:
+        """The earlier speeches ``phase``'s speaker sees (see DebatePhase.depends_on).
+
+        ``finished`` maps phase indexes to speeches that are done but may
+        not be in the transcript yet (run_debate() appends them in format
+        order); by default the transcript's own phases are used.
+        """
+        source = finished if finished is not None else dict(enumerate(transcript.phases))
+        index = self.format.phases.index(phase)
+        return [source[i] for i in self.format.dependencies(index)]
+
+    def shared_key(
+        self,
+        transcript: DebateTranscript,
+        phase: DebatePhase,
+        affirmative: DebateModel,
+        negative: DebateModel,
+        finished: dict[int, PhaseResult] | None = None,
+    ) -> tuple[str, ...] | None:
+        """Key of ``phase``'s next speech in the shared speeches, if it can be shared.
+
+        A speech can be shared when none of the speeches it sees (which its
+        request is built from) came from the opponent. Returns None when
+        sharing is off or the speech answers the opponent.
+        """
+        speaker = affirmative if phase.speaker_role == SpeakerRole.AFFIRMATIVE else negative
+        visible = self.visible_phases(transcript, phase, finished)
+        return self._shared_key(transcript.resolution, visible, phase, speaker.name)
+
+    def _shared_key(
+        self,
+        resolution: str,
+        phases: list[PhaseResult],
+        phase: DebatePhase,
+        speaker_name: str,
+    ) -> tuple[str, ...] | None:
+        if self.shared is None:
+            return None
+        if any(p.speaker_role != phase.speaker_role for p in phases):
+            return None
+        return (resolution, phase.name, speaker_name, *(p.content for p in phases))
+
+    def share_transcript(self, transcript: DebateTranscript) -> None:
+        """Offer the opponent-independent speeches of a restored transcript for sharing."""
+        if self.shared is None:
+            return
+        for i, result in enumerate(transcript.phases):
+            visible = [transcript.phases[j] for j in self.format.dependencies(i)]
+            key = self._shared_key(
+                transcript.resolution, visible, result.phase, result.speaker_model
+            )
+            if key is not None:
+                self.shared.add(key, result, result.shared_from or transcript.id)
+
+    def _print_speech(self, result: PhaseResult) -> None:
+        """Print a finished speech that was not streamed to the console."""
+        print(f"\n--- {result.phase.name} ({result.speaker_model}) ---\n")
+        print(result.content)
+        if result.shared_from:
+            print(f"\n[{result.word_count} words, shared with debate {result.shared_from}]")
+            return
+        trimmed = (
+            f", trimmed ({result.stopped.value.replace('_', ' ')})" if result.stopped else ""
+        )
+        duration = f", {result.duration_seconds:.1f}s" if result.duration_seconds else ""
+        print(f"\n[{result.word_count} words, {result.output_tokens} tokens"
+              f"{duration}{trimmed}]")
+
+    def _context_plan(
+        self,
+        visible: list[PhaseResult],
+        speaker: DebateModel,
+        system_prompt: str,
+        messages: list[Message],
+    ) -> dict[int, Condensed]:
+        """The context policy's plan for a request of ``messages``."""
+        assert self.context_policy is not None
+        speeches = sum(estimate_tokens(p.content) for p in visible)
+        fixed = estimate_tokens(system_prompt) + _messages_tokens(messages) - speeches
+        return self.context_policy.plan(
+            visible, fixed, self.context_policy.budget_for(speaker.name)
+        )
+
+    def phase_request(
+        self,
+        transcript: DebateTranscript,
+        phase: DebatePhase,
+        affirmative: DebateModel,
+        negative: DebateModel,
+        finished: dict[int, PhaseResult] | None = None,
+    ) -> tuple[DebateModel, str, list[Message], int]:
+        """Who speaks next and what they are sent.
+
+        The speaker sees the speeches visible_phases() returns. With a
+        context policy, older speeches are replaced by the summaries
+        prepare_context() wrote (speeches without one are sent verbatim),
+        and the tokens this saves are added to the transcript.
+
+        Returns:
+            (speaker, system_prompt, messages, max_tokens).
+        """
+        speaker, system_prompt = self._speaker_prompt(
+            transcript, phase.speaker_role, affirmative, negative
+        )
+        visible = self.visible_phases(transcript, phase, finished)
+        messages = build_debater_messages(visible, phase)
+        if self.context_policy is not None:
+            condensed: dict[int, str] = {}
+            plan = self._context_plan(visible, speaker, system_prompt, messages)
+            for i, mode in plan.items():
+                summary = visible[i].summary
+                if mode is Condensed.OMITTED:
+                    condensed[i] = OMITTED_NOTE
+                elif summary is not None and len(summary) < len(visible[i].content):
+                    condensed[i] = SUMMARY_PREFIX + summary
+            if condensed:
+                compact = build_debater_messages(visible, phase, condensed)
+                saved = _messages_tokens(messages) - _messages_tokens(compact)
+                transcript.context_tokens_saved += saved
+                messages = compact
+        max_tokens = phase.word_limit * 2  # Allow some buffer for tokens vs words
+        return speaker, system_prompt, messages, max_tokens
+
+    async def prepare_context(
+        self,
+        transcript: DebateTranscript,
+        phase: DebatePhase,
+        affirmative: DebateModel,
+        negative: DebateModel,
+        timeout: float | None = None,
+        finished: dict[int, PhaseResult] | None = None,
+    ) -> None:
+        """Write the summaries the context policy needs for ``phase``'s request.
+
+        Each speech is summarized at most once, concurrently with the
+        others; phases running at the same time wait on the same summary.
+        Does nothing without a context policy; a summary that fails is
+        skipped, so that speech is sent verbatim.
+        """
+        if self.context_policy is None:
+            return
+        speaker, system_prompt = self._speaker_prompt(
+            transcript, phase.speaker_role, affirmative, negative
+        )
+        visible = self.visible_phases(transcript, phase, finished)
+        messages = build_debater_messages(visible, phase)
+        plan = self._context_plan(visible, speaker, system_prompt, messages)
+        missing = [
+            visible[i]
+            for i, mode in sorted(plan.items())
+            if mode is Condensed.SUMMARY and visible[i].summary is None
+        ]
+        tasks = []
+        for result in missing:
+            task = self._summarizing.get(id(result))
+            if task is None:
+                task = asyncio.ensure_future(
+                    self._summarize(transcript, result, affirmative, negative, timeout)
+                )
+                self._summarizing[id(result)] = task
+
+                def forget(_: asyncio.Future[None], key: int = id(result)) -> None:
+                    self._summarizing.pop(key, None)
+
+                task.add_done_callback(forget)
+            tasks.append(task)
+        # Shielded: a phase that runs out of time must not cancel a summary
+        # another phase is waiting on.
+        await asyncio.gather(*[asyncio.shield(task) for task in tasks])
+
+    async def _summarize(
+        self,
+        transcript: DebateTranscript,
+        result: PhaseResult,
+        affirmative: DebateModel,
+        negative: DebateModel,
+        timeout: float | None,
+    ) -> None:
+        """Summarize one speech onto its PhaseResult."""
+        assert self.context_policy is not None
+        policy = self.context_policy
+        model = policy.summarizer or (
+            affirmative if result.speaker_role == SpeakerRole.AFFIRMATIVE else negative
+        )
+        try:
+            response = await model.generate(
+                system_prompt=SUMMARY_SYSTEM_PROMPT.format(words=policy.summary_words),
+                messages=[Message(role=Role.USER, content=format_speech(result))],
+                max_tokens=policy.summary_words * 2,
+                timeout=timeout,
+            )
+        except Exception as e:
+            if self.verbose:
+                print(f"[Summary of {result.phase.name} failed, sending it verbatim: {e}]")
+            return
+        result.summary = response.content.strip()
+        transcript.summary_tokens += response.input_tokens + response.output_tokens
+        # A speech still waiting for an earlier phase to finish is not in
+        # the journal yet; its summary is simply written again on resume.
+        if self.journal is not None and any(p is result for p in transcript.phases):
+            self.journal.record_summary(transcript, result)
+        if self.verbose:
+            print(f"[Summarized {result.phase.name}: {result.word_count} -> "
+                  f"{count_words(result.summary)} words]")
+
+    def phase_result(
+        self,
+        phase: DebatePhase,
+        speaker: DebateModel,
+        response: ModelResponse,
+        ttft: float | None = None,
+        duration: float | None = None,
+    ) -> PhaseResult:
+        """A finished speech, not yet added to any transcript.
+
+        A speech the output guard did not see while it streamed (e.g. a
+        batch result) is checked and trimmed here instead.
+        """
+        content = response.content
+        # Set by _stopped_response() for speeches the guard cut off mid-stream.
+        reason = response.metadata.get("stopped")
+        tokens_saved = response.metadata.get("tokens_saved", 0)
+        seconds_saved = response.metadata.get("seconds_saved", 0.0)
+        stopped = StopReason(reason) if isinstance(reason, str) else None
+        if stopped is None and self.output_guard is not None:
+            stopped = self.output_guard.check(content, phase.word_limit)
+            if stopped is not None:
+                content = self.output_guard.trim(content, phase.word_limit, stopped)
+        return PhaseResult(
+            phase=phase,
+            speaker_model=speaker.name,
+            speaker_role=phase.speaker_role,
+            content=content,
+            word_count=count_words(content),
+            input_tokens=response.input_tokens,
+            output_tokens=response.output_tokens,
+            ttft_seconds=ttft,
+            duration_seconds=duration,
+            usage=response.usage,
+            stopped=stopped,
+            tokens_saved=tokens_saved if isinstance(tokens_saved, int) else 0,
+            seconds_saved=float(seconds_saved) if isinstance(seconds_saved, int | float) else 0.0,
+        )
+
+    def append_phase(self, transcript: DebateTranscript, result: PhaseResult) -> None:
+        """Append the transcript's next phase (in format order) and journal it."""
+        transcript.phases.append(result)
+        if self.journal is not None:
+            self.journal.record_phase(transcript, result)
+
+    def record_phase(
+        self,
+        transcript: DebateTranscript,
+        phase: DebatePhase,
+        speaker: DebateModel,
+        response: ModelResponse,
+        ttft: float | None = None,
+        duration: float | None = None,
+    ) -> PhaseResult:
+        """Append a finished speech to the transcript (see phase_result())."""
+        result = self.phase_result(phase, speaker, response, ttft, duration)
+        self.append_phase(transcript, result)
+        return result
+
+    async def _run_phase(
+        self,
+        transcript: DebateTranscript,
+        phase: DebatePhase,
+        affirmative: DebateModel,
+        negative: DebateModel,
+        phase_deadline: Deadline | None,
+        finished: dict[int, PhaseResult],
+        echo: bool = True,
+    ) -> PhaseResult:
+        """Generate one speech within its deadline (it is not appended to the transcript).
+
+        With ``echo`` unset the speech is not streamed to the console, so
+        phases running side by side do not interleave their output.
+        """
+        # Summaries count against the phase they are written for.
+        await run_with_deadline(
+            self.prepare_context(
+                transcript,
+                phase,
+                affirmative,
+                negative,
+                timeout=phase_deadline.remaining() if phase_deadline else None,
+                finished=finished,
+            ),
+            phase_deadline,
+        )
+        speaker, system_prompt, messages, max_tokens = self.phase_request(
+            transcript, phase, affirmative, negative, finished
+        )
+
+        if self.verbose and echo:
+            print(f"\n--- {phase.name} ({speaker.name}) ---\n")
+
+        # Generate response
+        response, ttft, duration = await run_with_deadline(
+            self._generate(
+                speaker,
+                phase,
+                system_prompt=system_prompt,
+                messages=messages,
+                max_tokens=max_tokens,
+                timeout=phase_deadline.remaining() if phase_deadline else None,
+                reasoning=self.format.reasoning_for(phase),
+                echo=echo,
+            ),
+            phase_deadline,
+        )
+
+        phase_result = self.phase_result(phase, speaker, response, ttft, duration)
+
+        if self.verbose and echo:
+            timing = f", first token {ttft:.1f}s" if ttft is not None else ""
+            thinking = response.usage.reasoning_tokens
+            thought = f" ({thinking} reasoning)" if thinking else ""
+            cached = response.usage.cache_read_input_tokens
+            reused = f", {cached} input tokens cached" if cached else ""
+            trimmed = (
+                f", trimmed ({phase_result.stopped.value.replace('_', ' ')})"
+                if phase_result.stopped else ""
+            )
+            print(f"\n[{phase_result.word_count} words, {response.output_tokens} tokens"
+                  f"{thought}{reused}, {duration:.1f}s{timing}{trimmed}]")
+
+        return phase_result
+
+    async def _run_node(
+        self,
+        transcript: DebateTranscript,
+        index: int,
+        affirmative: DebateModel,
+        negative: DebateModel,
+        debate_deadline: Deadline | None,
+        finished: dict[int, PhaseResult],
+        echo: bool,
+    ) -> PhaseResult:
+        """One phase of the executor: a shared speech if there is one, else a new one."""
+        phase = self.format.phases[index]
+        budget = self.phase_timeout(phase) if self.phase_timeout else None
+        phase_deadline = child_deadline(debate_deadline, budget, f"phase '{phase.name}'")
+        if phase_deadline is not None:
+            phase_deadline.check()
+        key = self.shared_key(transcript, phase, affirmative, negative, finished)
+        if self.shared is None or key is None:
+            return await self._run_phase(
+                transcript, phase, affirmative, negative, phase_deadline, finished, echo
+            )
+        # Waits while another debate generates the same speech.
+        shared = await run_with_deadline(self.shared.claim(key), phase_deadline)
+        if shared is not None:
+            return shared
+        try:
+            result = await self._run_phase(
+                transcript, phase, affirmative, negative, phase_deadline, finished, echo
+            )
+        except BaseException:
+            self.shared.release(key)
+            raise
+        self.shared.add(key, result, transcript.id)
+        return result
 
     async def run_debate(
         self,
         resolution: str,
         affirmative: DebateModel,
         negative: DebateModel,
+        deadline: Deadline | None = None,
+        transcript: DebateTranscript | None = None,
     ) -> DebateTranscript:
         """Run a complete debate between two models.
 
+        Phases run as soon as the phases they see are done (see
+        DebatePhase.depends_on), so independent phases run concurrently;
+        a sequential format such as Lincoln-Douglas runs one at a time.
+
         Args:
             resolution: The debate resolution/topic.
             affirmative: Model arguing the affirmative position.
             negative: Model arguing the negative position.
+            deadline: Optional outer deadline (e.g. from the matrix runner);
+                the debate and phase budgets never extend past it.
+            transcript: A partial transcript to continue (e.g. restored
+                from a journal); its phases are not run again.
 
         Returns:
             Complete debate transcript.
+
+        Raises:
+            DeadlineExceededError: If the debate or one of its phases runs out
+                of time.
         """
-        debate_id = str(uuid4())[:8]
-        started_at = datetime.now(timezone.utc)
+        if transcript is None:
+            transcript = self.start_transcript(resolution, affirmative, negative)
+        restored = len(transcript.phases)
+        debate_deadline = child_deadline(deadline, self.debate_timeout, "debate")
 
         if self.verbose:
             print(f"\n{'='*60}")
@@ -145,79 +945,75 @@ class DebateEngine:
             print(f"Affirmative: {affirmative.name}")
             print(f"Negative: {negative.name}")
             print(f"Format: {self.format.name}")
+            if transcript.parent_id is not None and restored == transcript.forked_at:
+                print(f"Forked from debate {transcript.parent_id}"
+                      + (f" after {transcript.phases[-1].phase.name}" if restored else "")
+                      + f" ({restored}/{len(self.format.phases)} phases reused)")
+            elif restored:
+                print(f"Resuming after {transcript.phases[-1].phase.name} "
+                      f"({restored}/{len(self.format.phases)} phases journaled)")
             print(f"{'='*60}\n")
 
-        phases: list[PhaseResult] = []
-
-        for phase in self.format.phases:
-            # Determine which model speaks
-            if phase.speaker_role == SpeakerRole.AFFIRMATIVE:
-                speaker = affirmative
-                opponent = negative
-            else:
-                speaker = negative
-                opponent = affirmative
-
-            if self.verbose:
-                print(f"\n--- {phase.name} ({speaker.name}) ---\n")
-
-            # Build the prompt
-            system_prompt = DEBATER_SYSTEM_PROMPT.format(
-                resolution=resolution,
-                position=phase.speaker_role.value,
-                opponent_name=opponent.name,
-                word_limit=phase.word_limit,
-                phase_name=phase.name,
-                phase_instructions=phase.instructions,
-                transcript=format_transcript_for_context(phases),
-            )
-
-            # Generate response
-            messages = [Message(role=Role.USER, content="Please deliver your speech now.")]
-            response = await speaker.generate(
-                system_prompt=system_prompt,
-                messages=messages,
-                max_tokens=phase.word_limit * 2,  # Allow some buffer for tokens vs words
-            )
-
-            word_count = count_words(response.content)
-
-            if self.verbose:
-                print(response.content)
-                print(f"\n[{word_count} words, {response.output_tokens} tokens]")
-
-            # Record the phase result
-            phase_result = PhaseResult(
-                phase=phase,
-                speaker_model=speaker.name,
-                speaker_role=phase.speaker_role,
-                content=response.content,
-                word_count=word_count,
-                input_tokens=response.input_tokens,
-                output_tokens=response.output_tokens,
-            )
-            phases.append(phase_result)
+        # Dependency-aware executor: every phase whose dependencies are done
+        # runs at once. Results are appended in format order, so the
+        # transcript (and the journal) is always a prefix of the format.
+        phases = self.format.phases
+        finished = dict(enumerate(transcript.phases))
+        running: dict[asyncio.Future[PhaseResult], int] = {}
+        echoed: set[int] = set()
+        try:
+            while len(transcript.phases) < len(phases):
+                ready = [
+                    i for i in range(len(phases))
+                    if i not in finished and i not in running.values()
+                    and all(d in finished for d in self.format.dependencies(i))
+                ]
+                # Speeches are streamed to the console only one at a time.
+                echo = not running and len(ready) == 1
+                for i in ready:
+                    if echo:
+                        echoed.add(i)
+                    task = asyncio.ensure_future(self._run_node(
+                        transcript, i, affirmative, negative, debate_deadline, finished, echo
+                    ))
+                    running[task] = i
+                completed, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for node in completed:
+                    finished[running.pop(node)] = node.result()
+                while len(transcript.phases) in finished and len(transcript.phases) < len(phases):
+                    index = len(transcript.phases)
+                    result = finished[index]
+                    self.append_phase(transcript, result)
+                    if self.verbose and (index not in echoed or result.shared_from):
+                        self._print_speech(result)
+        finally:
+            for node in running:
+                node.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
 
-        completed_at = datetime.now(timezone.utc)
+        transcript.completed_at = datetime.now(UTC)
 
         if self.verbose:
+            duration = (transcript.completed_at - transcript.started_at).total_seconds()
             print(f"\n{'='*60}")
             print("DEBATE COMPLETE")
-            print(f"Total words: {sum(p.word_count for p in phases)}")
-            print(f"Total tokens: {sum(p.input_tokens + p.output_tokens for p in phases)}")
-            print(f"Duration: {(completed_at - started_at).total_seconds():.1f}s")
+            print(f"Total words: {transcript.total_words}")
+            print(f"Total tokens: {transcript.total_input_tokens + transcript.total_output_tokens}")
+            stopped = [p for p in transcript.phases if p.stopped]
+            if stopped:
+                print(f"Output guard: {len(stopped)} speech(es) cut short, "
+                      f"~{transcript.guard_tokens_saved} tokens and "
+                      f"~{transcript.guard_seconds_saved:.1f}s saved")
+            if transcript.shared_tokens:
+                print(f"Shared speeches: ~{transcript.shared_tokens} tokens reused "
+                      f"from other debates")
+            if self.context_policy is not None:
+                print(f"Context compression: ~{transcript.context_tokens_saved} input tokens "
+                      f"saved, {transcript.summary_tokens} tokens spent on summaries")
+            print(f"Duration: {duration:.1f}s")
             print(f"{'='*60}\n")
 
-        return DebateTranscript(
-            id=debate_id,
-            resolution=resolution,
-            affirmative_model=affirmative.name,
-            negative_model=negative.name,
-            format_name=self.format.name,
-            phases=phases,
-            started_at=started_at,
-            completed_at=completed_at,
-        )
+        return transcript
 
 
 def transcript_to_markdown(transcript: DebateTranscript) -> str:
@@ -233,11 +1029,21 @@ def transcript_to_markdown(transcript: DebateTranscript) -> str:
         "---",
         "",
     ]
+    if transcript.parent_id is not None:
+        lines.insert(-3, (
+            f"**Forked from:** debate {transcript.parent_id} "
+            f"(first {transcript.forked_at} phases unchanged)"
+        ))
 
     for phase in transcript.phases:
         role_emoji = "🟢" if phase.speaker_role == SpeakerRole.AFFIRMATIVE else "🔴"
         lines.append(f"## {role_emoji} {phase.phase.name}")
-        lines.append(f"*{phase.speaker_model} ({phase.speaker_role.value}) — {phase.word_count} words*")
+        trimmed = f", trimmed at {phase.stopped.value.replace('_', ' ')}" if phase.stopped else ""
+        shared = f", shared with debate {phase.shared_from}" if phase.shared_from else ""
+        lines.append(
+            f"*{phase.speaker_model} ({phase.speaker_role.value}) — "
+            f"{phase.word_count} words{trimmed}{shared}*"
+        )
         lines.append("")
         lines.append(phase.content)
         lines.append("")
@@ -249,6 +1055,20 @@ def transcript_to_markdown(transcript: DebateTranscript) -> str:
     lines.append("")
     lines.append(f"- **Total words:** {transcript.total_words}")
     lines.append(f"- **Total tokens:** {transcript.total_input_tokens + transcript.total_output_tokens}")
+    if transcript.guard_tokens_saved:
+        lines.append(
+            f"- **Output guard:** ~{transcript.guard_tokens_saved} tokens and "
+            f"~{transcript.guard_seconds_saved:.1f}s saved by stopping speeches early"
+        )
+    if transcript.shared_tokens:
+        lines.append(
+            f"- **Shared speeches:** ~{transcript.shared_tokens} tokens reused from other debates"
+        )
+    if transcript.context_tokens_saved or transcript.summary_tokens:
+        lines.append(
+            f"- **Context compression:** ~{transcript.context_tokens_saved} input tokens saved, "
+            f"{transcript.summary_tokens} tokens spent on summaries"
+        )
     if transcript.completed_at:
         duration = (transcript.completed_at - transcript.started_at).total_seconds()
         lines.append(f"- **Duration:** {duration:.1f} seconds")
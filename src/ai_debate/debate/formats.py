@@ -1,18 +1,21 @@
 """Debate format definitions."""
 
-from dataclasses import dataclass
-from enum import Enum
+from collections.abc import Callable
+from dataclasses import dataclass, field, replace
+from enum import StrEnum
 from typing import Literal
 
+from ai_debate.models.base import Reasoning
 
-class SpeakerRole(str, Enum):
+
+class SpeakerRole(StrEnum):
     """Role of the speaker in a debate."""
 
     AFFIRMATIVE = "affirmative"
     NEGATIVE = "negative"
 
 
-class PhaseType(str, Enum):
+class PhaseType(StrEnum):
     """Type of debate phase."""
 
     CONSTRUCTIVE = "constructive"
@@ -29,6 +32,32 @@ class DebatePhase:
     phase_type: PhaseType
     word_limit: int
     instructions: str
+    reasoning: Reasoning | None = None  # Overrides the format's default for this phase type
+    # Names of the earlier phases this phase's speaker sees; None means all
+    # of them. Phases that do not see each other run concurrently.
+    depends_on: tuple[str, ...] | None = None
+
+
+def parse_phase_reasoning(spec: str) -> dict[PhaseType, Reasoning]:
+    """Parse "cross_examination=low,rebuttal=2048" into reasoning per phase type.
+
+    Raises:
+        ValueError: If a phase type or reasoning value is unknown.
+    """
+    result: dict[PhaseType, Reasoning] = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        phase_type, sep, value = item.partition("=")
+        if not sep:
+            raise ValueError(f"Expected PHASE_TYPE=REASONING, got {item!r}")
+        try:
+            key = PhaseType(phase_type.strip().lower())
+        except ValueError:
+            raise ValueError(
+                f"Unknown phase type {phase_type!r}. "
+                f"Available: {', '.join(t.value for t in PhaseType)}"
+            ) from None
+        result[key] = Reasoning.parse(value)
+    return result
 
 
 # Lincoln-Douglas Debate Format
@@ -179,15 +208,153 @@ class DebateFormat:
     name: str
     description: str
     phases: list[DebatePhase]
+    # Thinking effort or budget per phase type; missing types (and a None
+    # judge_reasoning) use the provider's default.
+    reasoning: dict[PhaseType, Reasoning] = field(default_factory=dict)
+    judge_reasoning: Reasoning | None = None
+
+    def __post_init__(self) -> None:
+        seen: set[str] = set()
+        for phase in self.phases:
+            unknown = [name for name in phase.depends_on or () if name not in seen]
+            if unknown:
+                raise ValueError(
+                    f"Phase {phase.name!r} of {self.name!r} depends on {', '.join(unknown)}, "
+                    "which is not an earlier phase"
+                )
+            seen.add(phase.name)
 
     @property
     def total_word_limit(self) -> int:
         """Total word limit across all phases."""
         return sum(phase.word_limit for phase in self.phases)
 
+    def dependencies(self, index: int) -> list[int]:
+        """Indexes of the earlier phases that phase ``index`` sees, in order."""
+        depends_on = self.phases[index].depends_on
+        if depends_on is None:
+            return list(range(index))
+        return [i for i in range(index) if self.phases[i].name in depends_on]
+
+    def waves(self) -> list[list[int]]:
+        """Phase indexes grouped into rounds that can each run concurrently.
+
+        Every phase is in the round after the last of its dependencies, so
+        a strictly sequential format has one phase per round.
+        """
+        level: list[int] = []
+        for i in range(len(self.phases)):
+            level.append(1 + max((level[d] for d in self.dependencies(i)), default=-1))
+        return [
+            [i for i, n in enumerate(level) if n == wave]
+            for wave in range(max(level, default=-1) + 1)
+        ]
+
+    def critical_path(self, cost: Callable[[DebatePhase], float] | None = None) -> float:
+        """Length of the longest chain of dependent phases.
+
+        Args:
+            cost: Cost of one phase; defaults to its word limit, a proxy
+                for generation time.
+        """
+        cost = cost or (lambda phase: phase.word_limit)
+        finish: list[float] = []
+        for i, phase in enumerate(self.phases):
+            start = max((finish[d] for d in self.dependencies(i)), default=0.0)
+            finish.append(start + cost(phase))
+        return max(finish, default=0.0)
+
+    def reasoning_for(self, phase: DebatePhase) -> Reasoning | None:
+        """Reasoning for a phase: its own setting, else its phase type's."""
+        if phase.reasoning is not None:
+            return phase.reasoning
+        return self.reasoning.get(phase.phase_type)
+
+    def with_reasoning(
+        self,
+        phases: dict[PhaseType, Reasoning] | None = None,
+        judge: Reasoning | None = None,
+    ) -> "DebateFormat":
+        """Copy of this format with per-phase-type and judge reasoning overridden.
+
+        Args:
+            phases: Reasoning per phase type, merged over the format's own.
+            judge: Reasoning for judges (unchanged if None).
+        """
+        return replace(
+            self,
+            reasoning={**self.reasoning, **(phases or {})},
+            judge_reasoning=judge if judge is not None else self.judge_reasoning,
+        )
+
 
 LINCOLN_DOUGLAS = DebateFormat(
     name="Lincoln-Douglas",
     description="One-on-one value debate format emphasizing philosophy and logic",
     phases=LD_FORMAT,
 )
+
+
+def _blind(phase: DebatePhase, *depends_on: str) -> DebatePhase:
+    return replace(phase, depends_on=depends_on)
+
+
+_LD = {phase.name: phase for phase in LD_FORMAT}
+_CONSTRUCTIVES = ("Affirmative Constructive", "Negative Constructive")
+
+# Both constructives are written without seeing the other side, so they run
+# in parallel, and so do the two cross-examinations that follow.
+SIMULTANEOUS_FORMAT: list[DebatePhase] = [
+    _blind(_LD["Affirmative Constructive"]),
+    DebatePhase(
+        name="Negative Constructive",
+        speaker_role=SpeakerRole.NEGATIVE,
+        phase_type=PhaseType.CONSTRUCTIVE,
+        word_limit=800,
+        depends_on=(),
+        instructions="""Present your constructive case for the negative position.
+
+The affirmative is writing their case at the same time, so you have not heard it yet. You should:
+1. Define key terms in the resolution if needed
+2. Present your value premise (the core value you're upholding)
+3. Present your value criterion (the standard for measuring the value)
+4. Provide 2-3 contentions (main arguments) against the resolution
+5. Briefly anticipate the strongest affirmative arguments
+
+Structure your speech clearly with signposting (e.g., "My first contention is...").
+Be persuasive but intellectually honest.""",
+    ),
+    _blind(_LD["Cross-Examination (by Negative)"], *_CONSTRUCTIVES),
+    _blind(_LD["Cross-Examination (by Affirmative)"], *_CONSTRUCTIVES),
+    _blind(_LD["Affirmative Answers"], *_CONSTRUCTIVES, "Cross-Examination (by Negative)"),
+    _blind(_LD["Negative Answers"], *_CONSTRUCTIVES, "Cross-Examination (by Affirmative)"),
+    _LD["Affirmative Rebuttal"],
+    _LD["Negative Rebuttal"],
+    _LD["Affirmative Rejoinder"],
+]
+
+SIMULTANEOUS_OPENINGS = DebateFormat(
+    name="Simultaneous Openings",
+    description="Lincoln-Douglas with both constructives, then both cross-examinations, "
+                "written blind and in parallel",
+    phases=SIMULTANEOUS_FORMAT,
+)
+
+FORMATS: dict[str, DebateFormat] = {
+    "lincoln-douglas": LINCOLN_DOUGLAS,
+    "simultaneous": SIMULTANEOUS_OPENINGS,
+}
+
+
+def format_critical_path(
+    debate_format: DebateFormat,
+    baseline: DebateFormat = LINCOLN_DOUGLAS,
+) -> str:
+    """One line comparing a format's critical path (in words) with ``baseline``'s."""
+    words = debate_format.critical_path()
+    line = f"critical path {words:,.0f} words in {len(debate_format.waves())} rounds"
+    if debate_format.name != baseline.name:
+        base = baseline.critical_path()
+        line += (f"; {1 - words / base:.0%} shorter than {baseline.name}'s "
+                 f"{base:,.0f} words in {len(baseline.waves())} rounds")
+    return line
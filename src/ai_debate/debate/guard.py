@@ -0,0 +1,155 @@
+"""Stop a streamed speech that overruns its word limit or starts looping.
+
+``max_tokens`` is only a backstop (twice the word limit), so a verbose
+model can spend up to double the budget, in tokens and latency, on text
+that breaks the format anyway. An OutputGuard watches the deltas as they
+arrive and calls a stop when the speech passes its word limit plus
+``word_tolerance``, or when the same ``repeat_ngram`` words have come
+round ``max_repeats`` times, the signature of a degenerate loop. The
+engine then closes the stream and keeps the speech trimmed back to a
+sentence boundary.
+
+Speeches that were not streamed (batch and lockstep requests) get the same
+trimming after the fact, without any saving.
+"""
+
+import re
+from dataclasses import dataclass, field
+from enum import StrEnum
+
+_WORD = re.compile(r"\S+")
+_SENTENCE_END = re.compile(r"[.!?][\"'”’)\]]*$")
+
+
+class StopReason(StrEnum):
+    """Why a speech was cut short."""
+
+    WORD_LIMIT = "word_limit"
+    REPETITION = "repetition"
+
+
+def _normalize(word: str) -> str:
+    return word.strip(".,;:!?\"'()[]“”‘’").lower()
+
+
+@dataclass
+class _RepeatCounter:
+    """Non-overlapping occurrences of every n-gram seen so far."""
+
+    n: int
+    _starts: dict[tuple[str, ...], list[int]] = field(default_factory=dict)
+
+    def add(self, start: int, gram: tuple[str, ...]) -> list[int]:
+        """Record the n-gram starting at word ``start``; return its occurrences."""
+        starts = self._starts.setdefault(gram, [])
+        if not starts or start >= starts[-1] + self.n:
+            starts.append(start)
+        return starts
+
+
+@dataclass(frozen=True)
+class OutputGuard:
+    """Limits enforced on every speech while it is generated.
+
+    Attributes:
+        word_tolerance: Share of the word limit a speech may run over
+            before it is stopped.
+        repeat_ngram: Length of the word sequence tracked for loops.
+        max_repeats: Non-overlapping occurrences of one such sequence that
+            count as a loop (for both stopping and trimming).
+    """
+
+    word_tolerance: float = 0.1
+    repeat_ngram: int = 10
+    max_repeats: int = 3
+
+    def word_cap(self, word_limit: int) -> int:
+        """Most words a speech may reach before it is stopped."""
+        return int(word_limit * (1 + self.word_tolerance))
+
+    def watch(self, word_limit: int) -> "SpeechWatch":
+        """A watcher for one streamed speech."""
+        return SpeechWatch(self, word_limit)
+
+    def check(self, text: str, word_limit: int) -> StopReason | None:
+        """Why a finished ``text`` breaks the limits, if it does."""
+        watch = self.watch(word_limit)
+        return watch.feed(text, final=True)
+
+    def trim(self, text: str, word_limit: int, reason: StopReason) -> str:
+        """``text`` cut back to a sentence boundary within the limits.
+
+        Loops are cut before the second occurrence of the first word sequence
+        to come round ``max_repeats`` times; overruns at the word limit.
+        Either way the cut moves back to the last sentence end, unless that
+        would drop more than half the text.
+        """
+        spans = [m.span() for m in _WORD.finditer(text)]
+        keep = word_limit
+        if reason is StopReason.REPETITION:
+            keep = min(keep, self._first_repeat(text, spans))
+        if keep >= len(spans):
+            return text.strip()
+        words = spans[:keep]
+        for i in range(len(words) - 1, keep // 2 - 1, -1):
+            if _SENTENCE_END.search(text[words[i][0]:words[i][1]]):
+                return text[: words[i][1]].strip()
+        return text[: words[-1][1]].rstrip(",;:—-") + "…"
+
+    def _first_repeat(self, text: str, spans: list[tuple[int, int]]) -> int:
+        """Index of the word that starts the first repeat of a looping n-gram."""
+        words = [_normalize(text[start:end]) for start, end in spans]
+        n = self.repeat_ngram
+        counter = _RepeatCounter(n)
+        for i in range(len(words) - n + 1):
+            starts = counter.add(i, tuple(words[i : i + n]))
+            if len(starts) >= self.max_repeats:
+                return starts[1] if len(starts) > 1 else len(words)
+        return len(words)
+
+
+# Shared default for the engine and runner; pass None to disable the guard.
+DEFAULT_GUARD = OutputGuard()
+
+
+@dataclass
+class SpeechWatch:
+    """Incremental OutputGuard check over one stream of text deltas.
+
+    Only the new delta is split on each call; complete words are kept in a
+    running list, so a speech costs linear time however it is chunked.
+    """
+
+    guard: OutputGuard
+    word_limit: int
+    _words: list[str] = field(default_factory=list)  # Complete, normalized
+    _partial: str = ""  # Trailing word that may continue in the next delta
+    _checked: int = 0  # Words covered by the n-grams counted so far
+    _repeats: _RepeatCounter = field(init=False)
+
+    def __post_init__(self) -> None:
+        self._repeats = _RepeatCounter(self.guard.repeat_ngram)
+
+    def feed(self, delta: str, final: bool = False) -> StopReason | None:
+        """Add a delta; return a reason to stop, or None to keep going.
+
+        The last word of a delta may be incomplete, so it is only counted
+        once the next delta arrives (or when ``final`` is set).
+        """
+        pending = self._partial + delta
+        parts = pending.split()
+        self._partial = "" if not parts or pending[-1].isspace() else parts.pop()
+        if final and self._partial:
+            parts.append(self._partial)
+            self._partial = ""
+        self._words.extend(_normalize(w) for w in parts)
+        if len(self._words) + bool(self._partial) > self.guard.word_cap(self.word_limit):
+            return StopReason.WORD_LIMIT
+        n = self.guard.repeat_ngram
+        for end in range(max(self._checked + 1, n), len(self._words) + 1):
+            starts = self._repeats.add(end - n, tuple(self._words[end - n : end]))
+            if len(starts) >= self.guard.max_repeats:
+                self._checked = end
+                return StopReason.REPETITION
+        self._checked = max(self._checked, len(self._words))
+        return None
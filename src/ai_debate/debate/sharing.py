@@ -0,0 +1,90 @@
+"""Speeches shared across the debates of a matrix.
+
+A speech whose request never includes anything from the opponent (in
+Lincoln-Douglas, the Affirmative Constructive: there is nothing to answer
+yet) only varies with the opponent's name in the system prompt. When
+speeches are shared, that name is left out of every prompt, so such a
+speech is the same request in each of a model's debates on that side. It
+is generated once per (resolution, phase, speaker, earlier speeches) and
+copied into every other debate that needs it, which also gives every
+opponent the very same case to answer.
+
+The engine decides which phases qualify (DebateEngine.shared_key) from the
+speeches the request would contain.
+"""
+
+import asyncio
+from collections.abc import Hashable
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING
+
+from ai_debate.models.base import Usage
+
+if TYPE_CHECKING:
+    from ai_debate.debate.engine import PhaseResult
+
+
+@dataclass
+class SharedSpeeches:
+    """Opponent-independent speeches, each generated by the first debate that needs it.
+
+    Attributes:
+        reused: Number of speeches copied into a debate instead of generated.
+    """
+
+    reused: int = 0
+    _speeches: dict[Hashable, tuple["PhaseResult", str]] = field(default_factory=dict)
+    _pending: dict[Hashable, asyncio.Event] = field(default_factory=dict)
+
+    def get(self, key: Hashable) -> "PhaseResult | None":
+        """A copy of the shared speech for ``key``, if it exists yet.
+
+        The copy spends no tokens: its counts, usage and output-guard
+        savings are zeroed (they stay with the original) and the tokens it
+        did not spend are in ``shared_tokens_saved``.
+        """
+        if key not in self._speeches:
+            return None
+        result, transcript_id = self._speeches[key]
+        self.reused += 1
+        return replace(
+            result,
+            summary=None,
+            input_tokens=0,
+            output_tokens=0,
+            usage=Usage(),
+            tokens_saved=0,
+            seconds_saved=0.0,
+            shared_from=transcript_id,
+            # A speech restored from the journal may itself be a copy.
+            shared_tokens_saved=(
+                result.input_tokens + result.output_tokens + result.shared_tokens_saved
+            ),
+        )
+
+    async def claim(self, key: Hashable) -> "PhaseResult | None":
+        """The shared speech for ``key``, or None if the caller must generate it.
+
+        While another debate is generating the speech this waits for it. A
+        caller that gets None must call add() or release() once it is done.
+        """
+        while True:
+            result = self.get(key)
+            if result is not None:
+                return result
+            pending = self._pending.get(key)
+            if pending is None:
+                self._pending[key] = asyncio.Event()
+                return None
+            await pending.wait()
+
+    def add(self, key: Hashable, result: "PhaseResult", transcript_id: str) -> None:
+        """Share a speech generated for (or restored into) ``transcript_id``."""
+        self._speeches.setdefault(key, (result, transcript_id))
+        self.release(key)
+
+    def release(self, key: Hashable) -> None:
+        """Give up a claim; a waiting debate generates the speech instead."""
+        pending = self._pending.pop(key, None)
+        if pending is not None:
+            pending.set()
@@ -1,20 +1,31 @@
 """Judging system and scoring."""
 
-from ai_debate.judging.judge import JudgePanel, format_blind_transcript
+from ai_debate.judging.batch import BatchJudging
+from ai_debate.judging.judge import (
+    JudgePanel,
+    MalformedDecisionError,
+    PanelFailedError,
+    format_blind_transcript,
+)
 from ai_debate.judging.scoring import (
     AggregateScores,
     DebateResult,
     DebaterScores,
     JudgeDecision,
+    JudgeSubstitution,
     ScoringCategory,
 )
 
 __all__ = [
     "AggregateScores",
+    "BatchJudging",
     "DebateResult",
     "DebaterScores",
     "JudgeDecision",
     "JudgePanel",
+    "JudgeSubstitution",
+    "MalformedDecisionError",
+    "PanelFailedError",
     "ScoringCategory",
     "format_blind_transcript",
 ]
@@ -0,0 +1,187 @@
+"""Batch-API judging across a whole matrix.
+
+Judging needs no interactive answer, so BatchJudging collects every judge
+request for a set of debates and submits them as provider batch jobs, which
+are billed at a discount. Anthropic judges go through Message Batches,
+OpenAI judges through the Batch API, and every other provider through
+LocalBatchServer, an in-process stand-in that calls the model's generate()
+in the background. The local server also makes the mode testable offline
+with MockModel judges.
+
+The batch plumbing itself lives in ai_debate.models.batch. Results are
+polled asynchronously and fed back through
+parse_judge_response / extract_decision. A request that fails inside the
+batch (or returns unparseable JSON) is judged interactively by the debate's
+JudgePanel, which fails over to substitutes the same way it does outside
+batch mode. Decisions are journaled as they are parsed, and seats already
+journaled by an earlier run are not submitted again.
+"""
+
+import asyncio
+
+from ai_debate.debate.engine import DebateTranscript
+from ai_debate.models.base import DebateModel, Reasoning
+from ai_debate.models.batch import (
+    BatchBackend,
+    BatchDispatcher,
+    BatchRequest,
+    BatchResult,
+    LocalBatchBackend,
+)
+
+from .judge import (
+    JUDGE_MAX_TOKENS,
+    JudgePanel,
+    MalformedDecisionError,
+    build_judge_request,
+    build_result,
+    decision_from_response,
+)
+from .scoring import DebateResult, JudgeDecision, JudgeSubstitution
+
+
+class BatchJudging:
+    """Collects judge requests for many debates and runs them as batch jobs."""
+
+    def __init__(
+        self,
+        backends: dict[str, BatchBackend] | None = None,
+        local: LocalBatchBackend | None = None,
+        verbose: bool = True,
+        poll_interval: float = 30.0,
+        timeout: float | None = None,
+        reasoning: Reasoning | None = None,
+    ):
+        """Initialize batch judging.
+
+        Args:
+            backends: Backend per provider name. Defaults to the hosted batch
+                APIs for Anthropic and OpenAI.
+            local: Backend for every other provider (default: a fresh
+                LocalBatchServer).
+            verbose: Whether to print progress.
+            poll_interval: Seconds between status checks on hosted jobs.
+            timeout: Seconds to wait for the batch jobs of each run() before
+                giving up.
+            reasoning: Thinking effort or budget for every judge request.
+        """
+        self.dispatcher = BatchDispatcher(
+            backends=backends,
+            local=local,
+            verbose=verbose,
+            poll_interval=poll_interval,
+            timeout=timeout,
+            label="batch judging",
+        )
+        self.verbose = verbose
+        self.reasoning = reasoning
+        self._pending: list[tuple[DebateTranscript, JudgePanel]] = []
+
+    def add(self, transcript: DebateTranscript, panel: JudgePanel) -> None:
+        """Queue a debate for judging by ``panel``.
+
+        The panel's judges are batched; its backups, alternates and journal
+        are used for seats whose batch request fails.
+        """
+        self._pending.append((transcript, panel))
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    async def _judge_seat(
+        self,
+        transcript: DebateTranscript,
+        panel: JudgePanel,
+        judge: DebateModel,
+        result: BatchResult | None,
+        claimed: set[str],
+        substitutions: list[JudgeSubstitution],
+    ) -> JudgeDecision | None:
+        """The seat's decision from its batch result, or from the panel's failover."""
+        if result is not None and result.response is not None:
+            try:
+                decision = decision_from_response(judge, result.response)
+            except MalformedDecisionError as e:
+                reason = str(e)
+            else:
+                if panel.journal is not None:
+                    panel.journal.record_decision(transcript.id, judge.name, decision, [])
+                return decision
+        else:
+            reason = result.error if result and result.error else "no result returned"
+        if self.verbose:
+            print(f"  {judge.name}: batch judging of {transcript.id} failed "
+                  f"({reason[:80]}); judging interactively")
+        return await panel.judge_seat(judge, transcript, None, claimed, substitutions)
+
+    async def _judge_debate(
+        self,
+        transcript: DebateTranscript,
+        panel: JudgePanel,
+        results: dict[str, BatchResult],
+    ) -> DebateResult | None:
+        claimed = {judge.name for judge in panel.judges}
+        substitutions: list[JudgeSubstitution] = []
+        seats = await asyncio.gather(*[
+            self._judge_seat(
+                transcript,
+                panel,
+                judge,
+                results.get(f"{transcript.id}-{index}"),
+                claimed,
+                substitutions,
+            )
+            if panel.journal is None or panel.journal.decision(transcript.id, judge.name) is None
+            # Journaled by an earlier run: the panel restores it.
+            else panel.judge_seat(judge, transcript, None, claimed, substitutions)
+            for index, judge in enumerate(panel.judges)
+        ])
+        decisions = [seat for seat in seats if seat is not None]
+        if not decisions:
+            if self.verbose:
+                reasons = [f"{s.original_judge}: {s.reason}" for s in substitutions]
+                print(f"  No judge could decide debate {transcript.id}: " + "; ".join(reasons))
+            return None
+        return build_result(
+            transcript,
+            decisions,
+            verbose=self.verbose,
+            substitutions=substitutions,
+            panel_size=len(panel.judges),
+        )
+
+    async def run(self) -> dict[str, DebateResult]:
+        """Submit everything queued so far and return results by transcript id.
+
+        Debates that no seat could decide, even after failing over to the
+        panel's substitutes, are missing from the result.
+
+        Raises:
+            DeadlineExceededError: If ``timeout`` passes before the jobs finish.
+        """
+        pending, self._pending = self._pending, []
+        requests: list[BatchRequest] = []
+        for transcript, panel in pending:
+            system_prompt, messages = build_judge_request(transcript)
+            for index, judge in enumerate(panel.judges):
+                if panel.journal and panel.journal.decision(transcript.id, judge.name):
+                    continue
+                requests.append(BatchRequest(
+                    custom_id=f"{transcript.id}-{index}",
+                    model=judge,
+                    system_prompt=system_prompt,
+                    messages=messages,
+                    max_tokens=JUDGE_MAX_TOKENS,
+                    reasoning=self.reasoning,
+                ))
+
+        results = await self.dispatcher.submit(requests) if requests else {}
+
+        judged = await asyncio.gather(*[
+            self._judge_debate(transcript, panel, results) for transcript, panel in pending
+        ])
+        return {
+            transcript.id: result
+            for (transcript, _), result in zip(pending, judged)
+            if result is not None
+        }
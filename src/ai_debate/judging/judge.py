@@ -3,10 +3,17 @@
 import asyncio
 import json
 import re
+from typing import TYPE_CHECKING
 
 from ai_debate.debate.engine import DebateTranscript, PhaseResult
 from ai_debate.debate.formats import SpeakerRole
-from ai_debate.models.base import DebateModel, Message, Role
+from ai_debate.models.base import DebateModel, Message, ModelResponse, Reasoning, Role
+from ai_debate.models.cache import CacheMissError
+from ai_debate.models.deadline import Deadline, child_deadline, run_with_deadline
+from ai_debate.models.resilience import is_provider_error, is_provider_healthy
+
+if TYPE_CHECKING:
+    from ai_debate.storage.journal import RunJournal
 
 from .rubric import build_judge_system_prompt
 from .scoring import (
@@ -14,6 +21,7 @@ from .scoring import (
     DebateResult,
     DebaterScores,
     JudgeDecision,
+    JudgeSubstitution,
     aggregate_scores,
     determine_winner,
 )
@@ -114,33 +122,29 @@ def extract_decision(
     )
 
 
-class JudgePanel:
-    """Runs multiple judges against a debate transcript."""
+JUDGE_MAX_TOKENS = 2048
+# Times a judge is asked for its decision when the reply does not parse.
+JUDGE_PARSE_ATTEMPTS = 2
 
-    def __init__(self, judges: list[DebateModel], verbose: bool = True):
-        self.judges = judges
-        self.verbose = verbose
 
-    async def _run_single_judge(
-        self,
-        judge: DebateModel,
-        transcript: DebateTranscript,
-    ) -> JudgeDecision:
-        """Run a single judge on the transcript."""
-        blind = format_blind_transcript(transcript)
-        system_prompt = build_judge_system_prompt()
+class MalformedDecisionError(ValueError):
+    """A judge's reply is not a complete, valid decision."""
 
-        messages = [Message(role=Role.USER, content=blind)]
 
-        if self.verbose:
-            print(f"  Judging: {judge.name}...")
+def build_judge_request(transcript: DebateTranscript) -> tuple[str, list[Message]]:
+    """System prompt and messages sent to every judge of a debate."""
+    blind = format_blind_transcript(transcript)
+    return build_judge_system_prompt(), [Message(role=Role.USER, content=blind)]
 
-        response = await judge.generate(
-            system_prompt=system_prompt,
-            messages=messages,
-            max_tokens=2048,
-        )
 
+def decision_from_response(judge: DebateModel, response: ModelResponse) -> JudgeDecision:
+    """Parse and validate one judge's raw response.
+
+    Raises:
+        MalformedDecisionError: If the reply is not valid JSON, or a field is
+            missing or out of range.
+    """
+    try:
         parsed = parse_judge_response(response.content)
         decision = extract_decision(
             parsed=parsed,
@@ -151,52 +155,268 @@ class JudgePanel:
             input_tokens=response.input_tokens,
             output_tokens=response.output_tokens,
         )
+    except (ValueError, KeyError, TypeError, AttributeError) as e:
+        raise MalformedDecisionError(f"{type(e).__name__}: {e}") from e
+    decision.usage = response.usage
+    return decision
 
-        if self.verbose:
-            print(f"  {judge.name} picks: Debater {decision.winner} "
-                  f"({decision.scores_a.total} vs {decision.scores_b.total})")
 
-        return decision
+class PanelFailedError(RuntimeError):
+    """Every seat on a judge panel failed and no substitute could fill it."""
+
+
+def build_result(
+    transcript: DebateTranscript,
+    decisions: list[JudgeDecision],
+    verbose: bool = False,
+    substitutions: list[JudgeSubstitution] | None = None,
+    panel_size: int | None = None,
+) -> DebateResult:
+    """Aggregate judge decisions into the debate's result.
+
+    ``panel_size`` is the number of seats; with fewer decisions the result
+    is short-handed. Defaults to one seat per decision.
+    """
+    agg_a = aggregate_scores(decisions, "a")
+    agg_b = aggregate_scores(decisions, "b")
+    winner_code, margin = determine_winner(decisions, agg_a, agg_b)
+
+    winner_side = "affirmative" if winner_code == "A" else "negative"
+    winner_model = (
+        transcript.affirmative_model
+        if winner_code == "A"
+        else transcript.negative_model
+    )
+
+    result = DebateResult(
+        debate_id=transcript.id,
+        resolution=transcript.resolution,
+        affirmative_model=transcript.affirmative_model,
+        negative_model=transcript.negative_model,
+        decisions=decisions,
+        aggregate_a=agg_a,
+        aggregate_b=agg_b,
+        winner_side=winner_side,
+        winner_model=winner_model,
+        margin=margin,
+        substitutions=substitutions or [],
+        panel_size=len(decisions) if panel_size is None else panel_size,
+    )
+
+    if verbose:
+        label = result.decision_label.upper()
+        print(f"\n  Result: {result.winner_model} wins ({winner_side}) — {label}")
+        print(f"  Aggregate: A={agg_a.total:.1f} vs B={agg_b.total:.1f} (margin: {margin:.1f})")
+
+    return result
+
+
+class JudgePanel:
+    """Runs multiple judges against a debate transcript.
+
+    A judge whose provider's circuit breaker is open, or whose call fails
+    (including running out of time), is replaced by a substitute: its entry
+    in ``backups`` first (e.g. another model ID from the same provider),
+    then the first free model in ``alternates``. Substitutes on unhealthy
+    providers are skipped. A reply that does not parse is asked for again
+    from the same judge, up to JUDGE_PARSE_ATTEMPTS times, before the seat
+    fails over; any other error is a bug and propagates.
+
+    A seat with no substitute left is dropped. The debate is still judged
+    as long as one seat produces a decision, but the result is marked
+    short-handed, which keeps it out of unanimity and Elo.
+
+    ``reasoning`` sets every judge's thinking effort or budget, separately
+    from the debaters' (typically DebateFormat.judge_reasoning).
+
+    With a ``journal``, each seat's decision is journaled as soon as it is
+    made, and a seat that already has a journaled decision for the debate
+    is not asked again.
+    """
+
+    def __init__(
+        self,
+        judges: list[DebateModel],
+        verbose: bool = True,
+        judge_timeout: float | None = 180.0,
+        alternates: list[DebateModel] | None = None,
+        backups: dict[str, DebateModel] | None = None,
+        reasoning: Reasoning | None = None,
+        journal: "RunJournal | None" = None,
+    ):
+        self.judges = judges
+        self.verbose = verbose
+        self.judge_timeout = judge_timeout
+        self.alternates = alternates or []
+        self.backups = backups or {}
+        self.reasoning = reasoning
+        self.journal = journal
+
+    def _next_substitute(self, judge: DebateModel, claimed: set[str]) -> DebateModel | None:
+        """First healthy candidate for ``judge``'s seat not already on the panel."""
+        candidates = [self.backups.get(judge.name), *self.alternates]
+        for candidate in candidates:
+            if candidate is None or candidate.name in claimed:
+                continue
+            if not is_provider_healthy(candidate.provider):
+                continue
+            return candidate
+        return None
+
+    async def judge_seat(
+        self,
+        judge: DebateModel,
+        transcript: DebateTranscript,
+        deadline: Deadline | None,
+        claimed: set[str],
+        substitutions: list[JudgeSubstitution],
+    ) -> JudgeDecision | None:
+        """Fill one panel seat, failing over until a judge succeeds.
+
+        Returns:
+            The seat's decision, or None if every candidate failed.
+
+        Raises:
+            DeadlineExceededError: If the outer ``deadline`` runs out.
+        """
+        journaled = self.journal.decision(transcript.id, judge.name) if self.journal else None
+        if journaled is not None:
+            decision, taken = journaled
+            substitutions.extend(taken)
+            claimed.update(s.substitute_judge for s in taken if s.substitute_judge)
+            if self.verbose:
+                print(f"  {decision.judge_name} picks: Debater {decision.winner} (journaled)")
+            return decision
+
+        seat_substitutions: list[JudgeSubstitution] = []
+        current = judge
+        while True:
+            if not is_provider_healthy(current.provider):
+                reason = f"{current.provider} unhealthy (circuit open)"
+            else:
+                try:
+                    decision = await self._run_single_judge(current, transcript, deadline)
+                except Exception as e:
+                    if deadline is not None and deadline.expired:
+                        raise
+                    failed = is_provider_error(e) or isinstance(e, CacheMissError)
+                    if not (failed or isinstance(e, MalformedDecisionError)):
+                        raise
+                    reason = f"{type(e).__name__}: {e}"[:160]
+                else:
+                    if self.journal is not None:
+                        self.journal.record_decision(
+                            transcript.id, judge.name, decision, seat_substitutions
+                        )
+                    return decision
+
+            substitute = self._next_substitute(judge, claimed)
+            substitution = JudgeSubstitution(
+                original_judge=current.name,
+                substitute_judge=substitute.name if substitute else None,
+                reason=reason,
+            )
+            substitutions.append(substitution)
+            seat_substitutions.append(substitution)
+            if self.verbose:
+                replacement = substitute.name if substitute else "no substitute, seat dropped"
+                print(f"  {current.name} failed ({reason}); {replacement}")
+            if substitute is None:
+                return None
+            claimed.add(substitute.name)
+            current = substitute
+
+    async def _run_single_judge(
+        self,
+        judge: DebateModel,
+        transcript: DebateTranscript,
+        deadline: Deadline | None = None,
+    ) -> JudgeDecision:
+        """Run a single judge on the transcript.
+
+        A reply that does not parse is shown back to the judge with the
+        error, and the judge is asked again (all within ``judge_timeout``).
+
+        Raises:
+            MalformedDecisionError: If the last reply still does not parse.
+        """
+        system_prompt, messages = build_judge_request(transcript)
 
-    async def judge_debate(self, transcript: DebateTranscript) -> DebateResult:
-        """Judge a debate with all panel members in parallel."""
         if self.verbose:
-            print(f"\nJudging debate {transcript.id}...")
+            print(f"  Judging: {judge.name}...")
 
-        decisions = await asyncio.gather(
-            *[self._run_single_judge(j, transcript) for j in self.judges]
-        )
+        judge_deadline = child_deadline(deadline, self.judge_timeout, f"judge {judge.name}")
+        for attempt in range(1, JUDGE_PARSE_ATTEMPTS + 1):
+            response = await run_with_deadline(
+                judge.generate(
+                    system_prompt=system_prompt,
+                    messages=messages,
+                    max_tokens=JUDGE_MAX_TOKENS,
+                    timeout=judge_deadline.remaining() if judge_deadline else None,
+                    reasoning=self.reasoning,
+                ),
+                judge_deadline,
+            )
+            try:
+                decision = decision_from_response(judge, response)
+                break
+            except MalformedDecisionError as e:
+                if attempt == JUDGE_PARSE_ATTEMPTS:
+                    raise
+                if self.verbose:
+                    print(f"  {judge.name}: malformed decision ({str(e)[:80]}); asking again")
+                messages = [
+                    *messages,
+                    Message(role=Role.ASSISTANT, content=response.content),
+                    Message(
+                        role=Role.USER,
+                        content=f"That reply could not be used ({str(e)[:200]}). "
+                        "Respond again with only the JSON object described above.",
+                    ),
+                ]
 
-        agg_a = aggregate_scores(list(decisions), "a")
-        agg_b = aggregate_scores(list(decisions), "b")
-        winner_code, margin = determine_winner(list(decisions), agg_a, agg_b)
+        if self.verbose:
+            print(f"  {judge.name} picks: Debater {decision.winner} "
+                  f"({decision.scores_a.total} vs {decision.scores_b.total})")
 
-        winner_side = "affirmative" if winner_code == "A" else "negative"
-        winner_model = (
-            transcript.affirmative_model
-            if winner_code == "A"
-            else transcript.negative_model
-        )
+        return decision
 
-        result = DebateResult(
-            debate_id=transcript.id,
-            resolution=transcript.resolution,
-            affirmative_model=transcript.affirmative_model,
-            negative_model=transcript.negative_model,
-            decisions=list(decisions),
-            aggregate_a=agg_a,
-            aggregate_b=agg_b,
-            winner_side=winner_side,
-            winner_model=winner_model,
-            margin=margin,
-        )
+    async def judge_debate(
+        self,
+        transcript: DebateTranscript,
+        deadline: Deadline | None = None,
+    ) -> DebateResult:
+        """Judge a debate with all panel members in parallel.
 
+        Each judge gets ``judge_timeout`` seconds, capped by ``deadline``.
+
+        Raises:
+            PanelFailedError: If no seat produced a decision.
+            DeadlineExceededError: If ``deadline`` runs out.
+        """
         if self.verbose:
-            unanimous = "UNANIMOUS" if result.is_unanimous else "SPLIT"
-            print(f"\n  Result: {result.winner_model} wins ({winner_side}) — {unanimous}")
-            print(f"  Aggregate: A={agg_a.total:.1f} vs B={agg_b.total:.1f} (margin: {margin:.1f})")
+            print(f"\nJudging debate {transcript.id}...")
 
-        return result
+        claimed = {judge.name for judge in self.judges}
+        substitutions: list[JudgeSubstitution] = []
+        seats = await asyncio.gather(*[
+            self.judge_seat(j, transcript, deadline, claimed, substitutions)
+            for j in self.judges
+        ])
+        decisions = [decision for decision in seats if decision is not None]
+        if not decisions:
+            raise PanelFailedError(
+                f"No judge could decide debate {transcript.id}: "
+                + "; ".join(f"{s.original_judge}: {s.reason}" for s in substitutions)
+            )
+
+        return build_result(
+            transcript,
+            decisions,
+            verbose=self.verbose,
+            substitutions=substitutions,
+            panel_size=len(self.judges),
+        )
 
 
 def result_to_markdown(transcript: DebateTranscript, result: DebateResult) -> str:
@@ -208,7 +428,7 @@ def result_to_markdown(transcript: DebateTranscript, result: DebateResult) -> st
         "## Judging Results",
         "",
         f"**Winner: {result.winner_model}** ({result.winner_side})",
-        f"**Decision: {'Unanimous' if result.is_unanimous else 'Split'}**",
+        f"**Decision: {result.decision_label}**",
         f"**Margin: {result.margin:.1f} points**",
         "",
         "### Aggregate Scores",
@@ -236,4 +456,12 @@ def result_to_markdown(transcript: DebateTranscript, result: DebateResult) -> st
         lines.append(f"- **Reasoning:** {d.reasoning}")
         lines.append("")
 
+    if result.substitutions:
+        lines.append("### Judge Substitutions")
+        lines.append("")
+        for sub in result.substitutions:
+            replacement = sub.substitute_judge or "seat dropped"
+            lines.append(f"- {sub.original_judge} → {replacement} ({sub.reason})")
+        lines.append("")
+
     return "\n".join(lines)
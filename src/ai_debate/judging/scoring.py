@@ -1,10 +1,12 @@
 """Scoring data types and aggregation for debate judging."""
 
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import StrEnum
 
+from ai_debate.models.base import Usage
 
-class ScoringCategory(str, Enum):
+
+class ScoringCategory(StrEnum):
     """Categories used for scoring debates."""
 
     ARGUMENTATION = "argumentation"
@@ -58,6 +60,7 @@ class JudgeDecision:
     raw_response: str
     input_tokens: int = 0
     output_tokens: int = 0
+    usage: Usage = field(default_factory=Usage)
 
 
 @dataclass
@@ -81,6 +84,15 @@ class AggregateScores:
         )
 
 
+@dataclass
+class JudgeSubstitution:
+    """A panel seat whose judge failed over to another model."""
+
+    original_judge: str
+    substitute_judge: str | None  # None: no eligible substitute, seat left empty
+    reason: str
+
+
 @dataclass
 class DebateResult:
     """Complete judging result for a debate."""
@@ -95,14 +107,29 @@ class DebateResult:
     winner_side: str  # "affirmative" or "negative"
     winner_model: str
     margin: float
+    substitutions: list[JudgeSubstitution] = field(default_factory=list)
+    panel_size: int = 0  # Seats on the panel; 0 means every seat decided
+
+    @property
+    def short_handed(self) -> bool:
+        """Whether some seat could not be filled, even by a substitute."""
+        return len(self.decisions) < self.panel_size
 
     @property
     def is_unanimous(self) -> bool:
-        if not self.decisions:
-            return True
+        """Whether a full panel agreed; a short-handed panel never counts."""
+        if not self.decisions or self.short_handed:
+            return False
         first = self.decisions[0].winner
         return all(d.winner == first for d in self.decisions)
 
+    @property
+    def decision_label(self) -> str:
+        """The decision as reported: unanimous, split or short-handed."""
+        if self.short_handed:
+            return f"Short-handed ({len(self.decisions)}/{self.panel_size} judges)"
+        return "Unanimous" if self.is_unanimous else "Split"
+
 
 def aggregate_scores(decisions: list[JudgeDecision], side: str) -> AggregateScores:
     """Average scores across judges for a given side ('a' or 'b')."""
@@ -2,7 +2,13 @@
 
 from .markdown import leaderboard_to_markdown, matrix_to_markdown
 from .runner import MatrixRunner
-from .scheduler import build_matrix_schedule, estimate_matrix_cost
+from .scheduler import (
+    build_matrix_schedule,
+    estimate_debate_seconds,
+    estimate_matrix_cost,
+    estimate_matrix_duration,
+    suggest_concurrency,
+)
 from .serialization import matrix_result_to_json
 from .types import (
     CategoryAverages,
@@ -18,7 +24,10 @@ from .types import (
 __all__ = [
     "MatrixRunner",
     "build_matrix_schedule",
+    "estimate_debate_seconds",
     "estimate_matrix_cost",
+    "estimate_matrix_duration",
+    "suggest_concurrency",
     "matrix_to_markdown",
     "leaderboard_to_markdown",
     "matrix_result_to_json",
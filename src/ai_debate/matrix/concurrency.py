@@ -0,0 +1,51 @@
+"""Coordination primitives for running matrix debates concurrently."""
+
+import asyncio
+from collections import Counter
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+DEBATING = "debating"
+JUDGING = "judging"
+
+
+class ModelActivity:
+    """Tracks which role each model is playing across concurrent debates.
+
+    With ``exclusive=True`` a model may be in several debates at once, or on
+    several judge panels at once, but never debating and judging at the
+    same moment (the rule run_match.py enforces by running sequentially).
+
+    All models for a stage are acquired together under one condition, so
+    a debate never holds some of its models while waiting for the rest.
+    """
+
+    def __init__(self, exclusive: bool = True):
+        self.exclusive = exclusive
+        self._active: dict[str, Counter[str]] = {}
+        self._condition = asyncio.Condition()
+
+    def _available(self, name: str, role: str) -> bool:
+        if not self.exclusive:
+            return True
+        counts = self._active.get(name)
+        if not counts:
+            return True
+        return all(count == 0 for other, count in counts.items() if other != role)
+
+    @asynccontextmanager
+    async def hold(self, names: list[str], role: str) -> AsyncIterator[None]:
+        """Mark ``names`` as playing ``role`` for the duration of the block."""
+        async with self._condition:
+            await self._condition.wait_for(
+                lambda: all(self._available(n, role) for n in names)
+            )
+            for name in names:
+                self._active.setdefault(name, Counter())[role] += 1
+        try:
+            yield
+        finally:
+            async with self._condition:
+                for name in names:
+                    self._active[name][role] -= 1
+                self._condition.notify_all()
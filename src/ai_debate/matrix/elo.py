@@ -34,12 +34,17 @@ def compute_elo_ratings(
     model_names: list[str],
     k: float = DEFAULT_K,
 ) -> dict[str, EloRating]:
-    """Compute Elo ratings from debate results in schedule order."""
+    """Compute Elo ratings from debate results in schedule order.
+
+    Debates judged by a short-handed panel are skipped.
+    """
     ratings = {
         name: EloRating(model_name=name) for name in model_names
     }
 
     for result in debate_results:
+        if result.short_handed:
+            continue
         winner = result.winner_model
         loser = result.loser_model
 
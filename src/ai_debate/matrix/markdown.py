@@ -131,7 +131,10 @@ def _debate_summaries(result: MatrixResult) -> str:
     ]
 
     for dr in result.debate_results:
-        decision = "Unanimous" if dr.is_unanimous else "Split"
+        if dr.short_handed:
+            decision = "Short-handed"
+        else:
+            decision = "Unanimous" if dr.is_unanimous else "Split"
         lines.append(f"### Debate {dr.debate_index + 1}: {dr.affirmative_model} (AFF) vs {dr.negative_model} (NEG)")
         lines.append(f"- **Winner:** {dr.winner_model} ({dr.winner_side})")
         lines.append(f"- **Decision:** {decision} | Margin: {dr.margin:.1f}")
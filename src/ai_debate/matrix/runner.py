@@ -1,18 +1,46 @@
 """Matrix tournament runner — orchestrates round-robin debates."""
 
+import asyncio
 from collections.abc import Callable
-from datetime import datetime, timezone
+from dataclasses import asdict
+from datetime import UTC, datetime
 from uuid import uuid4
 
-from ai_debate.debate.engine import DebateEngine, DebateTranscript
-from ai_debate.judging.judge import JudgePanel
+from ai_debate.debate.context import ContextPolicy
+from ai_debate.debate.engine import DebateEngine, DebateTranscript, PhaseResult, PhaseStreamError
+from ai_debate.debate.formats import LINCOLN_DOUGLAS, DebateFormat
+from ai_debate.debate.guard import DEFAULT_GUARD, OutputGuard
+from ai_debate.debate.sharing import SharedSpeeches
+from ai_debate.judging.batch import BatchJudging
+from ai_debate.judging.judge import JudgePanel, PanelFailedError
 from ai_debate.judging.scoring import AggregateScores, DebateResult
 from ai_debate.models.base import DebateModel
+from ai_debate.models.batch import DEFAULT_STRAGGLER_TIMEOUT, BatchDispatcher, BatchRequest
+from ai_debate.models.cache import CacheMissError
+from ai_debate.models.deadline import (
+    Deadline,
+    DeadlineExceededError,
+    child_deadline,
+    run_with_deadline,
+)
+from ai_debate.models.profile import ModelProfile
+from ai_debate.models.resilience import is_provider_error
+from ai_debate.models.wrapper import ConcurrencyLimitedModel
+from ai_debate.storage.journal import RunJournal
 
+from .concurrency import DEBATING, JUDGING, ModelActivity
+from .scheduler import estimate_debate_seconds
 from .stats import compute_matrix_stats
 from .types import MatrixDebateEntry, MatrixDebateResult, MatrixResult
 
 
+def _is_call_failure(error: BaseException) -> bool:
+    """Whether ``error`` ends a debate (a provider call failed) or is a bug."""
+    if isinstance(error, PhaseStreamError) and error.__cause__ is not None:
+        error = error.__cause__
+    return is_provider_error(error) or isinstance(error, CacheMissError)
+
+
 def _build_category_scores(
     aff_model: str,
     neg_model: str,
@@ -27,6 +55,78 @@ def _build_category_scores(
     }
 
 
+def _usage_records(
+    transcript: DebateTranscript,
+    result: DebateResult,
+) -> list[dict[str, object]]:
+    """Per-call usage for a judged debate, speeches first, then judges."""
+    records: list[dict[str, object]] = []
+    for phase in transcript.phases:
+        records.append({
+            "step": phase.phase.name,
+            "phase_type": phase.phase.phase_type.value,
+            "model": phase.speaker_model,
+            "input_tokens": phase.input_tokens,
+            "output_tokens": phase.output_tokens,
+            **asdict(phase.usage),
+            "stopped": phase.stopped.value if phase.stopped else None,
+            "tokens_saved": phase.tokens_saved,
+            "seconds_saved": phase.seconds_saved,
+            "shared_from": phase.shared_from,
+            "shared_tokens_saved": phase.shared_tokens_saved,
+        })
+    for decision in result.decisions:
+        records.append({
+            "step": "Judging",
+            "model": decision.judge_name,
+            "input_tokens": decision.input_tokens,
+            "output_tokens": decision.output_tokens,
+            **asdict(decision.usage),
+        })
+    return records
+
+
+def _build_matrix_result(
+    entry: MatrixDebateEntry,
+    transcript: DebateTranscript,
+    result: DebateResult,
+) -> MatrixDebateResult:
+    """Flatten a judged debate into a MatrixDebateResult."""
+    loser = (
+        transcript.negative_model
+        if result.winner_side == "affirmative"
+        else transcript.affirmative_model
+    )
+
+    category_scores = _build_category_scores(
+        transcript.affirmative_model,
+        transcript.negative_model,
+        result.aggregate_a,
+        result.aggregate_b,
+    )
+
+    return MatrixDebateResult(
+        debate_index=entry.debate_index,
+        affirmative_model=transcript.affirmative_model,
+        negative_model=transcript.negative_model,
+        winner_model=result.winner_model,
+        loser_model=loser,
+        winner_side=result.winner_side,
+        margin=result.margin,
+        is_unanimous=result.is_unanimous,
+        aggregate_aff_total=result.aggregate_a.total,
+        aggregate_neg_total=result.aggregate_b.total,
+        category_scores=category_scores,
+        judge_names=[d.judge_name for d in result.decisions],
+        transcript_id=transcript.id,
+        usage=_usage_records(transcript, result),
+        judge_substitutions=[asdict(sub) for sub in result.substitutions],
+        short_handed=result.short_handed,
+        context_tokens_saved=transcript.context_tokens_saved,
+        summary_tokens=transcript.summary_tokens,
+    )
+
+
 class MatrixRunner:
     """Orchestrates a full round-robin matrix tournament."""
 
@@ -35,6 +135,22 @@ class MatrixRunner:
         models: dict[str, DebateModel],
         verbose: bool = True,
         on_debate_complete: Callable[[int, MatrixDebateResult, DebateTranscript, DebateResult], None] | None = None,
+        max_concurrent_debates: int = 1,
+        per_model_limit: int | None = None,
+        exclusive_judging: bool = True,
+        matrix_timeout: float | None = None,
+        debate_timeout: float | None = None,
+        max_attempts: int = 2,
+        batch_judging: BatchJudging | None = None,
+        lockstep: BatchDispatcher | None = None,
+        straggler_timeout: float | None = DEFAULT_STRAGGLER_TIMEOUT,
+        judge_backups: dict[str, DebateModel] | None = None,
+        debate_format: DebateFormat = LINCOLN_DOUGLAS,
+        profiles: dict[str, ModelProfile] | None = None,
+        context_policy: ContextPolicy | None = None,
+        journal: RunJournal | None = None,
+        output_guard: OutputGuard | None = DEFAULT_GUARD,
+        share_openings: bool = False,
     ):
         """Initialize the matrix runner.
 
@@ -43,104 +159,567 @@ class MatrixRunner:
             verbose: Whether to print progress.
             on_debate_complete: Optional callback after each debate finishes.
                 Receives (debate_index, matrix_result, transcript, debate_result).
+                In concurrent mode it fires in completion order, not schedule order.
+            max_concurrent_debates: Number of scheduled debates allowed to run
+                at once. 1 keeps the original sequential behaviour.
+            per_model_limit: Optional cap on in-flight generate() calls per
+                model, shared across every debate and panel it appears in.
+            exclusive_judging: Never let a model debate and judge at the
+                same moment (only relevant when debates run concurrently).
+            matrix_timeout: Seconds allowed for the whole matrix. Debates
+                not finished by then are reported in failed_debates.
+            debate_timeout: Seconds allowed per debate, including judging.
+            max_attempts: How many times a debate that runs out of time is
+                scheduled before it is given up on.
+            batch_judging: Defer judging until every debate has finished and
+                submit all judge requests as provider batch jobs. Results
+                (and on_debate_complete calls) then arrive at the end.
+            lockstep: Advance every debate one phase at a time and submit
+                phase k of all debates through this dispatcher, i.e. one
+                batch job per provider and model. Requests that fail in the
+                batch, or are still pending after straggler_timeout, are
+                retried interactively.
+            straggler_timeout: Seconds to wait for a lockstep batch job
+                before cancelling it and retrying its unfinished requests
+                interactively (default: an hour, the usual batch turnaround;
+                None waits for the job to end).
+            judge_backups: Stand-in judge per model name (typically a backup
+                model ID from the same provider). A failing judge is replaced
+                by its own backup, else by the backup of another model not in
+                the debate; substitutions are recorded in the DebateResult.
+            debate_format: Format every debate follows; its per-phase and
+                judge reasoning settings apply to all models.
+            profiles: Measured performance per model name (see
+                scripts/preflight.py); used to print an ETA that counts
+                down as debates finish.
+            context_policy: Condense older speeches in the debaters'
+                context (see ContextPolicy); None sends every speech in full.
+            journal: Write-ahead journal of every speech, judge decision and
+                result. A journal reopened from an earlier run is resumed:
+                judged debates are restored without any API calls, and
+                unfinished debates continue from their last journaled phase.
+            output_guard: Cuts speeches short at their word limit (plus
+                tolerance) or when they loop (see OutputGuard); None keeps
+                every speech as generated.
+            share_openings: Generate each speech that does not depend on the
+                opponent (the opening constructive) once per model and side,
+                and reuse it in all of that model's debates on that side.
+                Prompts then leave out the opponent's name, so every pairing
+                sees the same prompt.
         """
         names = list(models.keys())
         if len(names) != len(set(names)):
             raise ValueError("Model names must be unique")
         if len(names) < 2:
             raise ValueError("Need at least 2 models for a matrix tournament")
+        if max_concurrent_debates < 1:
+            raise ValueError("max_concurrent_debates must be at least 1")
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+        if per_model_limit is not None:
+            models = {
+                name: ConcurrencyLimitedModel(model, per_model_limit)
+                for name, model in models.items()
+            }
 
         self.models = models
         self.verbose = verbose
         self.on_debate_complete = on_debate_complete
+        self.max_concurrent_debates = max_concurrent_debates
+        self.per_model_limit = per_model_limit
+        self.exclusive_judging = exclusive_judging
+        self.matrix_timeout = matrix_timeout
+        self.debate_timeout = debate_timeout
+        self.max_attempts = max_attempts
+        self.batch_judging = batch_judging
+        self.lockstep = lockstep
+        self.straggler_timeout = straggler_timeout
+        self.judge_backups = judge_backups or {}
+        self.debate_format = debate_format
+        self.profiles = profiles or {}
+        self.context_policy = context_policy
+        self.journal = journal
+        self.output_guard = output_guard
+        self.share_openings = share_openings
+        self._estimates: dict[int, float] = {}
         self._full_results: list[tuple[DebateTranscript, DebateResult]] = []
+        self._outcomes: list[tuple[MatrixDebateResult, DebateTranscript, DebateResult]] = []
+        self._deferred: list[tuple[MatrixDebateEntry, DebateTranscript]] = []
+        self._errored: list[MatrixDebateEntry] = []
 
     @property
     def full_results(self) -> list[tuple[DebateTranscript, DebateResult]]:
         """Full debate transcripts and results for saving individual files."""
         return self._full_results
 
-    async def run_matrix(
+    async def _run_entry(
         self,
+        engine: DebateEngine,
         resolution: str,
-        schedule: list[MatrixDebateEntry],
-    ) -> MatrixResult:
-        """Run all debates in the matrix sequentially.
-
-        Judges within each debate run in parallel via JudgePanel.
-        """
-        started_at = datetime.now(timezone.utc)
-        model_names = list(self.models.keys())
-        engine = DebateEngine(verbose=self.verbose)
-        debate_results: list[MatrixDebateResult] = []
-        self._full_results = []
+        entry: MatrixDebateEntry,
+        total: int,
+        activity: ModelActivity | None = None,
+        deadline: Deadline | None = None,
+    ) -> None:
+        """Run and judge (or queue for batch judging) a single scheduled debate."""
+        if self.verbose:
+            print(f"\n{'#' * 60}")
+            print(f"# MATRIX DEBATE {entry.debate_index + 1}/{total}")
+            print(f"# {entry.affirmative_name} (AFF) vs {entry.negative_name} (NEG)")
+            print(f"# Judges: {', '.join(entry.judge_names)}")
+            print(f"{'#' * 60}")
 
-        for entry in schedule:
-            if self.verbose:
-                print(f"\n{'#' * 60}")
-                print(f"# MATRIX DEBATE {entry.debate_index + 1}/{len(schedule)}")
-                print(f"# {entry.affirmative_name} (AFF) vs {entry.negative_name} (NEG)")
-                print(f"# Judges: {', '.join(entry.judge_names)}")
-                print(f"{'#' * 60}")
-
-            affirmative = self.models[entry.affirmative_name]
-            negative = self.models[entry.negative_name]
-            judges = [self.models[name] for name in entry.judge_names]
+        affirmative = self.models[entry.affirmative_name]
+        negative = self.models[entry.negative_name]
+        judges = [self.models[name] for name in entry.judge_names]
+        debate_deadline = child_deadline(
+            deadline, self.debate_timeout, f"debate {entry.debate_index + 1}"
+        )
 
-            # Run debate
+        # Run debate, continuing its journaled phases if there are any
+        transcript = self._journaled_transcript(entry)
+        if transcript is None:
+            transcript = engine.start_transcript(
+                resolution, affirmative, negative, entry.debate_index
+            )
+        debaters = [entry.affirmative_name, entry.negative_name]
+        if activity is None:
             transcript = await engine.run_debate(
                 resolution=resolution,
                 affirmative=affirmative,
                 negative=negative,
+                deadline=debate_deadline,
+                transcript=transcript,
             )
+        else:
+            async with activity.hold(debaters, DEBATING):
+                transcript = await engine.run_debate(
+                    resolution=resolution,
+                    affirmative=affirmative,
+                    negative=negative,
+                    deadline=debate_deadline,
+                    transcript=transcript,
+                )
 
-            # Judge debate (parallel within panel)
-            panel = JudgePanel(judges=judges, verbose=self.verbose)
-            result = await panel.judge_debate(transcript)
-            self._full_results.append((transcript, result))
+        await self._judge_entry(entry, transcript, judges, activity, debate_deadline)
 
-            # Build flat result
-            loser = (
-                transcript.negative_model
-                if result.winner_side == "affirmative"
-                else transcript.affirmative_model
-            )
+    async def _judge_entry(
+        self,
+        entry: MatrixDebateEntry,
+        transcript: DebateTranscript,
+        judges: list[DebateModel],
+        activity: ModelActivity | None = None,
+        deadline: Deadline | None = None,
+    ) -> None:
+        """Judge a finished debate, or queue it for batch judging."""
+        # Judge debate (parallel within panel). Backups of models outside the
+        # debate are the only eligible substitutes: every other model already
+        # sits on the panel.
+        debaters = {entry.affirmative_name, entry.negative_name}
+        panel = JudgePanel(
+            judges=judges,
+            verbose=self.verbose,
+            alternates=[
+                backup for name, backup in self.judge_backups.items() if name not in debaters
+            ],
+            backups=self.judge_backups,
+            reasoning=self.debate_format.judge_reasoning,
+            journal=self.journal,
+        )
+        if self.batch_judging is not None:
+            self.batch_judging.add(transcript, panel)
+            self._deferred.append((entry, transcript))
+            return
 
-            category_scores = _build_category_scores(
-                transcript.affirmative_model,
-                transcript.negative_model,
-                result.aggregate_a,
-                result.aggregate_b,
-            )
+        if activity is None:
+            result = await panel.judge_debate(transcript, deadline)
+        else:
+            async with activity.hold(entry.judge_names, JUDGING):
+                result = await panel.judge_debate(transcript, deadline)
+
+        self._complete_entry(entry, transcript, result)
+
+    def _complete_entry(
+        self,
+        entry: MatrixDebateEntry,
+        transcript: DebateTranscript,
+        result: DebateResult,
+    ) -> None:
+        """Record a judged debate and notify the callback."""
+        if self.journal is not None and self.journal.result(entry.debate_index) is None:
+            self.journal.record_result(transcript, result)
+        matrix_result = _build_matrix_result(entry, transcript, result)
+        self._outcomes.append((matrix_result, transcript, result))
+
+        self._estimates.pop(entry.debate_index, None)
+        if self.verbose:
+            print(f"\n  Debate {entry.debate_index + 1} winner: {result.winner_model}")
+            if self._estimates:
+                left = sum(self._estimates.values()) / self.max_concurrent_debates
+                print(f"  ~{left / 60:.1f} min left (estimated from model profiles)")
+
+        if self.on_debate_complete:
+            self.on_debate_complete(entry.debate_index, matrix_result, transcript, result)
+
+    def _journaled_transcript(self, entry: MatrixDebateEntry) -> DebateTranscript | None:
+        """The unfinished transcript journaled for ``entry``, if it has one."""
+        if self.journal is None:
+            return None
+        transcript = self.journal.transcript(entry.debate_index)
+        if transcript is None or (
+            transcript.affirmative_model != self.models[entry.affirmative_name].name
+            or transcript.negative_model != self.models[entry.negative_name].name
+        ):
+            return None
+        return transcript
+
+    async def _try_entry(
+        self,
+        engine: DebateEngine,
+        resolution: str,
+        entry: MatrixDebateEntry,
+        total: int,
+        activity: ModelActivity | None,
+        deadline: Deadline | None,
+    ) -> bool:
+        """Like _run_entry, but returns False when the debate runs out of time.
+
+        An API failure the model wrappers gave up on ends the debate without
+        failing the rest of the matrix; it is reported in failed_debates and
+        not rescheduled. Any other error is a bug and propagates.
+        """
+        try:
+            await self._run_entry(engine, resolution, entry, total, activity, deadline)
+        except DeadlineExceededError as e:
+            if self.verbose:
+                print(f"\n  Debate {entry.debate_index + 1} timed out: {e}")
+            return False
+        except PanelFailedError as e:
+            if self.verbose:
+                print(f"\n  Debate {entry.debate_index + 1} could not be judged: {e}")
+            return False
+        except Exception as e:
+            if not _is_call_failure(e):
+                raise
+            self._errored.append(entry)
+            if self.verbose:
+                print(f"\n  Debate {entry.debate_index + 1} failed: {type(e).__name__}: {e}")
+        return True
 
-            matrix_result = MatrixDebateResult(
-                debate_index=entry.debate_index,
-                affirmative_model=transcript.affirmative_model,
-                negative_model=transcript.negative_model,
-                winner_model=result.winner_model,
-                loser_model=loser,
-                winner_side=result.winner_side,
-                margin=result.margin,
-                is_unanimous=result.is_unanimous,
-                aggregate_aff_total=result.aggregate_a.total,
-                aggregate_neg_total=result.aggregate_b.total,
-                category_scores=category_scores,
-                judge_names=[d.judge_name for d in result.decisions],
-                transcript_id=transcript.id,
+    async def _run_lockstep(
+        self,
+        engine: DebateEngine,
+        resolution: str,
+        entries: list[MatrixDebateEntry],
+        deadline: Deadline | None,
+    ) -> list[MatrixDebateEntry]:
+        """Run ``entries`` in lockstep, batching each round of phases across debates.
+
+        A round is every phase whose dependencies are done (see
+        DebateFormat.waves), so a format with independent phases needs
+        fewer batch rounds than it has phases.
+
+        Returns:
+            The entries that did not finish (a speech failed even when
+            retried interactively, or a deadline ran out).
+        """
+        assert self.lockstep is not None
+        live: dict[str, tuple[MatrixDebateEntry, DebateTranscript, Deadline | None]] = {}
+        # Finished speeches by phase index; appended to the transcript in order.
+        finished: dict[str, dict[int, PhaseResult]] = {}
+        transcript_ids: dict[str, str] = {}
+        for entry in entries:
+            transcript = self._journaled_transcript(entry) or engine.start_transcript(
+                resolution,
+                self.models[entry.affirmative_name],
+                self.models[entry.negative_name],
+                entry.debate_index,
             )
-            debate_results.append(matrix_result)
+            debate_deadline = child_deadline(
+                deadline, self.debate_timeout, f"debate {entry.debate_index + 1}"
+            )
+            key = f"d{entry.debate_index}"
+            live[key] = (entry, transcript, debate_deadline)
+            finished[key] = dict(enumerate(transcript.phases))
+            transcript_ids[key] = transcript.id
+        failed: list[MatrixDebateEntry] = []
+        phases = engine.format.phases
+
+        def drop(key: str, reason: str) -> None:
+            entry = live.pop(key)[0]
+            failed.append(entry)
+            if self.verbose:
+                print(f"\n  Debate {entry.debate_index + 1} dropped: {reason}")
+
+        def finish(key: str, index: int, result: PhaseResult) -> None:
+            transcript = live[key][1]
+            done = finished[key]
+            done[index] = result
+            while len(transcript.phases) in done and len(transcript.phases) < len(phases):
+                engine.append_phase(transcript, done[len(transcript.phases)])
+
+        for number, wave in enumerate(engine.format.waves(), start=1):
+            budget = None
+            if engine.phase_timeout is not None:
+                timeouts = [engine.phase_timeout(phases[i]) for i in wave]
+                budgets = [seconds for seconds in timeouts if seconds is not None]
+                # Any phase without a timeout leaves the whole round unbounded.
+                budget = max(budgets) if len(budgets) == len(timeouts) else None
+            for key, (entry, transcript, debate_deadline) in list(live.items()):
+                if debate_deadline is not None and debate_deadline.expired:
+                    drop(key, f"{debate_deadline.scope} deadline exceeded")
+            # Debates resumed from the journal skip the phases they already have.
+            due = [(key, index) for key in live for index in wave if index not in finished[key]]
+            # Summaries for every debate's context are written interactively,
+            # together, before the round is submitted.
+            try:
+                prepared = await run_with_deadline(
+                    asyncio.gather(*[
+                        engine.prepare_context(
+                            live[key][1],
+                            phases[index],
+                            self.models[live[key][0].affirmative_name],
+                            self.models[live[key][0].negative_name],
+                            timeout=budget,
+                            finished=finished[key],
+                        )
+                        for key, index in due
+                    ], return_exceptions=True),
+                    deadline,
+                )
+            except DeadlineExceededError as e:
+                for key in list(live):
+                    drop(key, str(e))
+                return failed
+            for (key, index), outcome in zip(due, prepared):
+                if isinstance(outcome, BaseException):
+                    if not _is_call_failure(outcome):
+                        raise outcome
+                    if key in live:
+                        drop(key, f"{phases[index].name} context failed ({outcome})")
+            due = [(key, index) for key, index in due if key in live]
+            requests: list[BatchRequest] = []
+            speakers: dict[str, DebateModel] = {}
+            # Debates needing the same shared speech wait on the one request
+            # submitted for it (keyed by the request's custom ID).
+            shared_keys: dict[str, tuple[str, ...]] = {}
+            followers: dict[str, list[tuple[str, int]]] = {}
+            leaders: dict[tuple[str, ...], str] = {}
+            for key, index in due:
+                entry, transcript, _ = live[key]
+                phase = phases[index]
+                affirmative = self.models[entry.affirmative_name]
+                negative = self.models[entry.negative_name]
+                custom_id = f"{key}-p{index + 1}"
+                shared_key = engine.shared_key(
+                    transcript, phase, affirmative, negative, finished[key]
+                )
+                if engine.shared is not None and shared_key is not None:
+                    shared = engine.shared.get(shared_key)
+                    if shared is not None:
+                        finish(key, index, shared)
+                        continue
+                    if shared_key in leaders:
+                        followers[leaders[shared_key]].append((key, index))
+                        continue
+                    leaders[shared_key] = custom_id
+                    shared_keys[custom_id] = shared_key
+                    followers[custom_id] = []
+                speaker, system_prompt, messages, max_tokens = engine.phase_request(
+                    transcript, phase, affirmative, negative, finished[key]
+                )
+                speakers[custom_id] = speaker
+                requests.append(BatchRequest(
+                    custom_id=custom_id,
+                    model=speaker,
+                    system_prompt=system_prompt,
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    reasoning=engine.format.reasoning_for(phase),
+                ))
+            if not requests:
+                if live:
+                    continue
+                break
 
             if self.verbose:
-                print(f"\n  Debate {entry.debate_index + 1} winner: {result.winner_model}")
+                names = ", ".join(phases[i].name for i in wave)
+                sharers = sum(len(nodes) for nodes in followers.values())
+                sharing = f", {sharers} more sharing these speeches" if sharers else ""
+                print(f"\n--- Round {number}/{len(engine.format.waves())}: {names} "
+                      f"({len(requests)} requests{sharing}) ---")
+            try:
+                results = await run_with_deadline(
+                    self.lockstep.complete(
+                        requests, self.straggler_timeout, fallback_timeout=budget
+                    ),
+                    deadline,
+                )
+            except DeadlineExceededError as e:
+                for key in list(live):
+                    drop(key, str(e))
+                return failed
+
+            for request in requests:
+                key, phase_number = request.custom_id.rsplit("-p", 1)
+                index = int(phase_number) - 1
+                result = results[request.custom_id]
+                waiting = [(key, index), *followers.get(request.custom_id, [])]
+                if result.response is None:
+                    for failed_key, _ in waiting:
+                        if failed_key in live:
+                            drop(failed_key, f"{phases[index].name} failed ({result.error})")
+                    continue
+                phase_result = engine.phase_result(
+                    phases[index], speakers[request.custom_id], result.response
+                )
+                if key in live:
+                    finish(key, index, phase_result)
+                # Followers get a shared speech even when the debate that
+                # requested it was dropped earlier in this round.
+                if engine.shared is not None and request.custom_id in shared_keys:
+                    shared_key = shared_keys[request.custom_id]
+                    engine.shared.add(shared_key, phase_result, transcript_ids[key])
+                    for follower, follower_index in followers[request.custom_id]:
+                        copy = engine.shared.get(shared_key) if follower in live else None
+                        if copy is not None:
+                            finish(follower, follower_index, copy)
+
+        now = datetime.now(UTC)
+        for _, transcript, _ in live.values():
+            transcript.completed_at = transcript.completed_at or now
+
+        slots = asyncio.Semaphore(self.max_concurrent_debates)
+
+        async def judge(key: str) -> None:
+            entry, transcript, debate_deadline = live[key]
+            judges = [self.models[name] for name in entry.judge_names]
+            async with slots:
+                try:
+                    await self._judge_entry(entry, transcript, judges, deadline=debate_deadline)
+                except (DeadlineExceededError, PanelFailedError) as e:
+                    drop(key, str(e))
+                except Exception as e:
+                    if not _is_call_failure(e):
+                        raise
+                    drop(key, f"{type(e).__name__}: {e}")
+
+        await asyncio.gather(*[judge(key) for key in list(live)])
+        return failed
+
+    async def run_matrix(
+        self,
+        resolution: str,
+        schedule: list[MatrixDebateEntry],
+    ) -> MatrixResult:
+        """Run all debates in the matrix.
+
+        Debates run sequentially unless max_concurrent_debates > 1. Judges
+        within each debate always run in parallel via JudgePanel. Results
+        are returned in debate_index order either way, so stats and Elo
+        do not depend on completion order.
+
+        With ``lockstep`` set, all debates advance together one phase at a
+        time and each phase is submitted as batch jobs instead.
+
+        A debate that exceeds its deadline is rescheduled after the rest of
+        the pass, up to max_attempts times; debates that never finish (or
+        are cut off by matrix_timeout) are listed in failed_debates.
+        """
+        started_at = datetime.now(UTC)
+        model_names = list(self.models.keys())
+        self._estimates = {}
+        for entry in schedule:
+            seconds = estimate_debate_seconds(entry, self.profiles, self.debate_format)
+            if seconds is not None:
+                self._estimates[entry.debate_index] = seconds
+        # Concurrent debates would interleave streamed speeches on stdout,
+        # so only the runner's own progress lines are printed in that mode.
+        engine = DebateEngine(
+            format=self.debate_format,
+            context_policy=self.context_policy,
+            journal=self.journal,
+            output_guard=self.output_guard,
+            shared=SharedSpeeches() if self.share_openings else None,
+            verbose=(
+                self.verbose and self.max_concurrent_debates == 1 and self.lockstep is None
+            ),
+        )
+        deadline = child_deadline(None, self.matrix_timeout, "matrix")
+        self._outcomes = []
+        self._deferred = []
+        self._errored = []
+        pending = list(schedule)
+
+        if self.journal is not None:
+            resumed = self.journal.records > 0
+            self.journal.record_run(resolution, model_names)
+            restored = [
+                (entry, journaled)
+                for entry in pending
+                if (journaled := self.journal.result(entry.debate_index)) is not None
+            ]
+            restored_indices = {entry.debate_index for entry, _ in restored}
+            pending = [entry for entry in pending if entry.debate_index not in restored_indices]
+            if self.verbose and resumed:
+                print(f"Run {self.journal.run_id}: {len(restored)} debate(s) restored "
+                      f"from the journal, {len(pending)} to go")
+            for entry, (transcript, result) in restored:
+                self._complete_entry(entry, transcript, result)
+            for transcript in self.journal.transcripts:
+                engine.share_transcript(transcript)
+
+        for attempt in range(self.max_attempts):
+            if not pending or (deadline is not None and deadline.expired):
+                break
+            if attempt > 0 and self.verbose:
+                print(f"\nRescheduling {len(pending)} timed-out debate(s)...")
+
+            if self.lockstep is not None:
+                failed = await self._run_lockstep(engine, resolution, pending, deadline)
+                finished = [entry not in failed for entry in pending]
+            elif self.max_concurrent_debates == 1:
+                finished = [
+                    await self._try_entry(
+                        engine, resolution, entry, len(schedule), None, deadline
+                    )
+                    for entry in pending
+                ]
+            else:
+                slots = asyncio.Semaphore(self.max_concurrent_debates)
+                activity = ModelActivity(exclusive=self.exclusive_judging)
+
+                async def run_slot(
+                    entry: MatrixDebateEntry,
+                ) -> bool:
+                    async with slots:
+                        return await self._try_entry(
+                            engine, resolution, entry, len(schedule), activity, deadline
+                        )
+
+                finished = list(await asyncio.gather(*[run_slot(e) for e in pending]))
+
+            pending = [entry for entry, ok in zip(pending, finished) if not ok]
+
+        if self.batch_judging is not None and self._deferred:
+            results = await self.batch_judging.run()
+            for entry, transcript in self._deferred:
+                if transcript.id in results:
+                    self._complete_entry(entry, transcript, results[transcript.id])
+                else:
+                    self._errored.append(entry)
+
+        outcomes = sorted(self._outcomes, key=lambda outcome: outcome[0].debate_index)
 
-            if self.on_debate_complete:
-                self.on_debate_complete(entry.debate_index, matrix_result, transcript, result)
+        debate_results = [matrix_result for matrix_result, _, _ in outcomes]
+        self._full_results = [(transcript, result) for _, transcript, result in outcomes]
 
-        completed_at = datetime.now(timezone.utc)
+        completed_at = datetime.now(UTC)
         stats = compute_matrix_stats(debate_results, model_names)
 
         return MatrixResult(
-            id=uuid4().hex[:8],
+            id=self.journal.run_id if self.journal is not None else uuid4().hex[:8],
             resolution=resolution,
             model_names=model_names,
             total_debates=len(debate_results),
@@ -148,4 +727,5 @@ class MatrixRunner:
             stats=stats,
             started_at=started_at,
             completed_at=completed_at,
+            failed_debates=sorted(entry.debate_index for entry in [*pending, *self._errored]),
         )
@@ -1,7 +1,17 @@
 """Round-robin schedule generation for matrix tournaments."""
 
+import math
+
+from ai_debate.debate.formats import LINCOLN_DOUGLAS, DebateFormat, SpeakerRole
+from ai_debate.models.profile import ModelProfile
+
 from .types import MatrixDebateEntry
 
+TOKENS_PER_WORD = 1.3
+DEBATER_PROMPT_TOKENS = 600  # System prompt and instructions before the transcript
+JUDGE_PROMPT_TOKENS = 1500  # Rubric and instructions before the transcript
+JUDGE_OUTPUT_TOKENS = 800
+
 
 def build_matrix_schedule(models: list[str]) -> list[MatrixDebateEntry]:
     """Build a full round-robin schedule where every model debates every other.
@@ -55,3 +65,118 @@ def estimate_matrix_cost(
         "estimated_judge_tokens": judge_tokens,
         "estimated_total_tokens": total_tokens,
     }
+
+
+def _debate_calls(
+    entry: MatrixDebateEntry,
+    debate_format: DebateFormat,
+) -> list[tuple[str, int, int]]:
+    """(model name, input tokens, output tokens) of every call, speeches first."""
+    speakers = {
+        SpeakerRole.AFFIRMATIVE: entry.affirmative_name,
+        SpeakerRole.NEGATIVE: entry.negative_name,
+    }
+    calls = []
+    speeches = [int(phase.word_limit * TOKENS_PER_WORD) for phase in debate_format.phases]
+    for i, phase in enumerate(debate_format.phases):
+        seen = sum(speeches[d] for d in debate_format.dependencies(i))
+        reasoning = debate_format.reasoning_for(phase)
+        thinking = reasoning.tokens if reasoning else 0
+        calls.append((speakers[phase.speaker_role], DEBATER_PROMPT_TOKENS + seen,
+                      speeches[i] + thinking))
+    transcript = sum(speeches)
+    judge_thinking = debate_format.judge_reasoning.tokens if debate_format.judge_reasoning else 0
+    for judge in entry.judge_names:
+        calls.append(
+            (judge, JUDGE_PROMPT_TOKENS + transcript, JUDGE_OUTPUT_TOKENS + judge_thinking)
+        )
+    return calls
+
+
+def estimate_debate_seconds(
+    entry: MatrixDebateEntry,
+    profiles: dict[str, ModelProfile],
+    debate_format: DebateFormat = LINCOLN_DOUGLAS,
+) -> float | None:
+    """Expected wall time of one debate from measured model profiles.
+
+    Speeches run one after another, except phases that do not depend on
+    each other, so the debate takes its critical path; judges run in
+    parallel, so only the slowest counts. Returns None if a debater has no
+    usable profile.
+    """
+    calls = _debate_calls(entry, debate_format)
+    speeches, judging = calls[: len(debate_format.phases)], calls[len(debate_format.phases):]
+    phase_seconds: dict[str, float] = {}
+    for phase, (name, input_tokens, output_tokens) in zip(debate_format.phases, speeches):
+        profile = profiles.get(name)
+        if profile is None or not profile.ok:
+            return None
+        phase_seconds[phase.name] = profile.call_seconds(input_tokens, output_tokens)
+    seconds = debate_format.critical_path(lambda phase: phase_seconds[phase.name])
+    judge_seconds = [
+        profiles[name].call_seconds(input_tokens, output_tokens)
+        for name, input_tokens, output_tokens in judging
+        if name in profiles and profiles[name].ok
+    ]
+    return seconds + max(judge_seconds, default=0.0)
+
+
+def estimate_matrix_duration(
+    schedule: list[MatrixDebateEntry],
+    profiles: dict[str, ModelProfile],
+    concurrency: int = 1,
+    debate_format: DebateFormat = LINCOLN_DOUGLAS,
+) -> float | None:
+    """Expected wall time of a whole matrix at a given concurrency.
+
+    Assumes debates pack evenly into the slots, so the result is a lower
+    bound once rate limits bite. Returns None without a profile for every
+    debater.
+    """
+    estimates = [estimate_debate_seconds(e, profiles, debate_format) for e in schedule]
+    per_debate = [seconds for seconds in estimates if seconds is not None]
+    if not per_debate or len(per_debate) < len(estimates):
+        return None
+    return max(max(per_debate), sum(per_debate) / max(1, concurrency))
+
+
+def suggest_concurrency(
+    schedule: list[MatrixDebateEntry],
+    profiles: dict[str, ModelProfile],
+    debate_format: DebateFormat = LINCOLN_DOUGLAS,
+    ceiling: int = 16,
+) -> int:
+    """Most debates to run at once that every measured rate limit sustains.
+
+    For each model with reported per-minute limits, the requests and tokens
+    it serves per debate (speeches and judging) are spread over the
+    estimated debate duration; the tightest limit sets the answer. Models
+    without reported limits do not constrain it.
+    """
+    durations = [estimate_debate_seconds(e, profiles, debate_format) for e in schedule]
+    known = [d for d in durations if d]
+    if not known:
+        return 1
+    minutes = sum(known) / len(known) / 60
+
+    requests: dict[str, int] = {}
+    tokens: dict[str, int] = {}
+    for entry in schedule:
+        for name, input_tokens, output_tokens in _debate_calls(entry, debate_format):
+            requests[name] = requests.get(name, 0) + 1
+            tokens[name] = tokens.get(name, 0) + input_tokens + output_tokens
+
+    best = ceiling
+    for name, profile in profiles.items():
+        if name not in requests:
+            continue
+        # Per-minute demand of one running debate, on average.
+        demand = [
+            (profile.requests_limit, requests[name] / len(schedule) / minutes),
+            (profile.tokens_limit, tokens[name] / len(schedule) / minutes),
+        ]
+        for limit, per_debate in demand:
+            if limit and per_debate > 0:
+                best = min(best, math.floor(limit / per_debate))
+    return max(1, best)
@@ -29,12 +29,21 @@ class MatrixDebateResult:
     loser_model: str
     winner_side: str  # "affirmative" or "negative"
     margin: float
-    is_unanimous: bool
+    is_unanimous: bool  # False for a short-handed panel
     aggregate_aff_total: float
     aggregate_neg_total: float
     category_scores: dict[str, dict[str, float]]  # {model_name: {category: avg}}
     judge_names: list[str]
     transcript_id: str
+    # One record per generation call (speeches, then judges): tokens,
+    # cache/reasoning breakdown, latency, queueing, retries, request id.
+    usage: list[dict[str, object]] = field(default_factory=list)
+    judge_substitutions: list[dict[str, str | None]] = field(default_factory=list)
+    # A seat stayed empty: reported, but left out of the Elo ratings.
+    short_handed: bool = False
+    # Context compression: estimated input tokens saved, and the summaries' cost.
+    context_tokens_saved: int = 0
+    summary_tokens: int = 0
 
 
 @dataclass
@@ -137,6 +146,8 @@ class MatrixResult:
     stats: MatrixStats
     started_at: datetime
     completed_at: datetime
+    # Indices of debates not scored (timed out, errored or unjudged)
+    failed_debates: list[int] = field(default_factory=list)
 
     @property
     def duration_seconds(self) -> float:
@@ -1,25 +1,75 @@
-"""Model adapters for different AI providers."""
+"""Model adapters for different AI providers.
+
+Provider adapters are imported lazily: ``from ai_debate.models import
+AnthropicModel`` still works, but the anthropic / openai / google-genai SDKs
+are only loaded when an adapter is first touched.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
 
-from ai_debate.models.anthropic import AnthropicModel
 from ai_debate.models.base import (
     DebateModel,
     Message,
     ModelConfig,
     ModelResponse,
+    Reasoning,
+    ReasoningEffort,
     Role,
+    Usage,
 )
-from ai_debate.models.google import GoogleModel
-from ai_debate.models.openai import OpenAIModel
-from ai_debate.models.xai import XAIModel
+from ai_debate.models.http import PoolSettings
+from ai_debate.models.mock import LatencyProfile, MockModel
+from ai_debate.models.registry import ModelRegistry, get_registry
+
+if TYPE_CHECKING:
+    from ai_debate.models.anthropic import AnthropicModel
+    from ai_debate.models.google import GoogleModel
+    from ai_debate.models.openai import OpenAIModel
+    from ai_debate.models.openai_compat import Dialect, OpenAICompatibleModel
+    from ai_debate.models.xai import XAIModel
+
+_LAZY_ATTRS: dict[str, str] = {
+    "AnthropicModel": "ai_debate.models.anthropic",
+    "Dialect": "ai_debate.models.openai_compat",
+    "GoogleModel": "ai_debate.models.google",
+    "OpenAICompatibleModel": "ai_debate.models.openai_compat",
+    "OpenAIModel": "ai_debate.models.openai",
+    "XAIModel": "ai_debate.models.xai",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
 
 __all__ = [
     "AnthropicModel",
     "DebateModel",
+    "Dialect",
     "GoogleModel",
+    "LatencyProfile",
     "Message",
+    "MockModel",
     "ModelConfig",
+    "ModelRegistry",
     "ModelResponse",
+    "OpenAICompatibleModel",
     "OpenAIModel",
+    "PoolSettings",
+    "Reasoning",
+    "ReasoningEffort",
     "Role",
+    "Usage",
     "XAIModel",
+    "get_registry",
 ]
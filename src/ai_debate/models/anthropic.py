@@ -1,11 +1,20 @@
 """Anthropic (Claude) model adapter."""
 
-import os
+import time
+from collections.abc import AsyncGenerator
 from dataclasses import dataclass, field
+from typing import Any
 
 import anthropic
+import httpx
 
-from ai_debate.models.base import Message, ModelResponse, Role
+from ai_debate.models.base import Message, ModelResponse, Reasoning, Role, StreamChunk, Usage
+from ai_debate.models.keypool import primary_key
+
+MIN_THINKING_BUDGET = 1024  # Smallest budget_tokens the API accepts
+# Prompt-cache prices relative to uncached input (reads; 5-minute writes).
+CACHE_READ_PRICE = 0.1
+CACHE_WRITE_PRICE = 1.25
 
 
 @dataclass
@@ -16,19 +25,114 @@ class AnthropicModel:
     name: str = "Claude Opus 4.5"
     provider: str = "Anthropic"
     temperature: float = 0.7
+    api_key_env: str = "ANTHROPIC_API_KEY"
+    max_retries: int = 2
+    http_client: httpx.AsyncClient | None = field(default=None, repr=False)
     _client: anthropic.AsyncAnthropic = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
-        api_key = os.environ.get("ANTHROPIC_API_KEY")
+        api_key = primary_key(self.api_key_env)
         if not api_key:
-            raise ValueError("ANTHROPIC_API_KEY environment variable not set")
-        self._client = anthropic.AsyncAnthropic(api_key=api_key)
+            raise ValueError(f"{self.api_key_env} environment variable not set")
+        self._client = anthropic.AsyncAnthropic(
+            api_key=api_key,
+            max_retries=self.max_retries,
+            http_client=self.http_client,
+        )
+
+    def _request_params(
+        self,
+        system_prompt: str,
+        messages: list[Message],
+        max_tokens: int,
+        timeout: float | None = None,
+        reasoning: Reasoning | None = None,
+    ) -> dict[str, Any]:
+        """Build the Messages API request shared by generate and generate_stream."""
+        # Convert messages to Anthropic format
+        anthropic_messages = [self._convert_message(msg) for msg in messages]
+        params: dict[str, Any] = {
+            "model": self.model_id,
+            "max_tokens": max_tokens,
+            "system": system_prompt,
+            "messages": anthropic_messages,
+            "temperature": self.temperature,
+        }
+        if reasoning is not None and reasoning.tokens > 0:
+            # Thinking counts against max_tokens, so the speech keeps its own
+            # allowance on top of the budget. Temperature must stay at 1.
+            budget = max(MIN_THINKING_BUDGET, reasoning.tokens)
+            params["thinking"] = {"type": "enabled", "budget_tokens": budget}
+            params["max_tokens"] = max_tokens + budget
+            del params["temperature"]
+        # timeout=None would disable the SDK timeout entirely, so only pass
+        # it when the caller has a budget.
+        if timeout is not None:
+            params["timeout"] = timeout
+        return params
+
+    def _to_response(
+        self,
+        response: anthropic.types.Message,
+        request_id: str | None = None,
+    ) -> ModelResponse:
+        """Convert an Anthropic Message into a ModelResponse."""
+        # Extract text content
+        content = ""
+        for block in response.content:
+            if block.type == "text":
+                content += block.text
+
+        usage = response.usage
+        # input_tokens only counts the uncached part of the prompt.
+        read = usage.cache_read_input_tokens or 0
+        written = usage.cache_creation_input_tokens or 0
+        return ModelResponse(
+            content=content,
+            model=response.model,
+            input_tokens=usage.input_tokens + read + written,
+            output_tokens=usage.output_tokens,
+            metadata={
+                "stop_reason": response.stop_reason,
+            },
+            # Thinking is billed inside output_tokens without a count of its
+            # own, so reasoning_tokens is left out rather than guessed.
+            usage=Usage(
+                cache_read_input_tokens=read,
+                cache_creation_input_tokens=written,
+                billed_input_tokens=(
+                    usage.input_tokens + read * CACHE_READ_PRICE + written * CACHE_WRITE_PRICE
+                ),
+                request_id=request_id or getattr(response, "_request_id", None),
+            ),
+        )
+
+    @property
+    def batch_client(self) -> anthropic.AsyncAnthropic:
+        """The client Message Batches are created with (see BatchCapable)."""
+        return self._client
+
+    def batch_params(
+        self,
+        system_prompt: str,
+        messages: list[Message],
+        max_tokens: int,
+        reasoning: Reasoning | None = None,
+    ) -> dict[str, Any]:
+        """The ``params`` of one Message Batches request."""
+        return self._request_params(system_prompt, messages, max_tokens, reasoning=reasoning)
+
+    def batch_response(self, result: anthropic.types.Message) -> ModelResponse:
+        """Convert a succeeded batch result's message into a ModelResponse."""
+        return self._to_response(result)
 
     async def generate(
         self,
         system_prompt: str,
         messages: list[Message],
         max_tokens: int = 4096,
+        timeout: float | None = None,
+        reasoning: Reasoning | None = None,
     ) -> ModelResponse:
         """Generate a response using Claude.
 
@@ -36,39 +140,63 @@ class AnthropicModel:
             system_prompt: System instructions for Claude.
             messages: Conversation history.
             max_tokens: Maximum tokens to generate.
+            timeout: Request timeout in seconds (SDK default if None).
+            reasoning: Extended-thinking budget; None or a zero budget
+                leaves thinking off.
 
         Returns:
             ModelResponse with generated content and usage stats.
         """
-        # Convert messages to Anthropic format
-        anthropic_messages = [
-            {"role": self._convert_role(msg.role), "content": msg.content}
-            for msg in messages
-        ]
-
+        started = time.monotonic()
         response = await self._client.messages.create(
-            model=self.model_id,
-            max_tokens=max_tokens,
-            system=system_prompt,
-            messages=anthropic_messages,
-            temperature=self.temperature,
+            **self._request_params(system_prompt, messages, max_tokens, timeout, reasoning)
         )
+        result = self._to_response(response)
+        result.usage.latency_seconds = time.monotonic() - started
+        return result
 
-        # Extract text content
-        content = ""
-        for block in response.content:
-            if block.type == "text":
-                content += block.text
+    async def generate_stream(
+        self,
+        system_prompt: str,
+        messages: list[Message],
+        max_tokens: int = 4096,
+        timeout: float | None = None,
+        reasoning: Reasoning | None = None,
+    ) -> AsyncGenerator[StreamChunk, None]:
+        """Stream a response from Claude via ``messages.stream``.
 
-        return ModelResponse(
-            content=content,
-            model=response.model,
-            input_tokens=response.usage.input_tokens,
-            output_tokens=response.usage.output_tokens,
-            metadata={
-                "stop_reason": response.stop_reason,
-            },
-        )
+        Yields:
+            Text deltas, then a final chunk with the complete ModelResponse.
+        """
+        started = time.monotonic()
+        ttft = None
+        async with self._client.messages.stream(
+            **self._request_params(system_prompt, messages, max_tokens, timeout, reasoning)
+        ) as stream:
+            async for text in stream.text_stream:
+                if ttft is None:
+                    ttft = time.monotonic() - started
+                yield StreamChunk(text=text)
+            final = await stream.get_final_message()
+        response = self._to_response(final, request_id=stream.request_id)
+        response.usage.latency_seconds = time.monotonic() - started
+        response.usage.ttft_seconds = ttft
+        yield StreamChunk(response=response)
+
+    def _convert_message(self, msg: Message) -> dict[str, Any]:
+        """Convert a Message, adding a cache breakpoint where it is marked."""
+        if not msg.cache_control:
+            return {"role": self._convert_role(msg.role), "content": msg.content}
+        # Everything up to this block (system prompt included) is cached;
+        # the next request finds it by looking back from its own breakpoint.
+        return {
+            "role": self._convert_role(msg.role),
+            "content": [{
+                "type": "text",
+                "text": msg.content,
+                "cache_control": {"type": "ephemeral"},
+            }],
+        }
 
     def _convert_role(self, role: Role) -> str:
         """Convert Role enum to Anthropic role string."""
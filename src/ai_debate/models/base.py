@@ -1,11 +1,12 @@
 """Base types and protocol for AI model adapters."""
 
+from collections.abc import AsyncGenerator
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import StrEnum
 from typing import Protocol, runtime_checkable
 
 
-class Role(str, Enum):
+class Role(StrEnum):
     """Message role in a conversation."""
 
     SYSTEM = "system"
@@ -15,10 +16,107 @@ class Role(str, Enum):
 
 @dataclass
 class Message:
-    """A single message in a conversation."""
+    """A single message in a conversation.
+
+    ``cache_control`` marks the end of a prefix worth caching: adapters whose
+    provider supports prompt caching cache everything up to and including
+    this message, and later requests that extend it read it back cheaply.
+    """
 
     role: Role
     content: str
+    cache_control: bool = False
+
+
+class ReasoningEffort(StrEnum):
+    """How hard a reasoning model should think before answering."""
+
+    NONE = "none"
+    MINIMAL = "minimal"
+    LOW = "low"
+    MEDIUM = "medium"
+    HIGH = "high"
+
+
+# Thinking-token budget for each effort, for providers that take a budget.
+REASONING_BUDGETS: dict[ReasoningEffort, int] = {
+    ReasoningEffort.NONE: 0,
+    ReasoningEffort.MINIMAL: 512,
+    ReasoningEffort.LOW: 1024,
+    ReasoningEffort.MEDIUM: 4096,
+    ReasoningEffort.HIGH: 16384,
+}
+
+
+@dataclass(frozen=True)
+class Reasoning:
+    """Thinking requested for one call.
+
+    Providers take either an effort level or a token budget. Set whichever
+    you mean; adapters convert to the other using REASONING_BUDGETS. An
+    explicit ``budget_tokens`` wins over ``effort`` when both are set.
+    """
+
+    effort: ReasoningEffort = ReasoningEffort.MEDIUM
+    budget_tokens: int | None = None
+
+    @classmethod
+    def parse(cls, value: str) -> "Reasoning":
+        """Parse an effort name ("low") or a token budget ("2048")."""
+        value = value.strip().lower()
+        if value.isdigit():
+            return cls(budget_tokens=int(value))
+        try:
+            return cls(effort=ReasoningEffort(value))
+        except ValueError:
+            raise ValueError(
+                f"Unknown reasoning {value!r}: use a token budget or one of "
+                f"{', '.join(e.value for e in ReasoningEffort)}"
+            ) from None
+
+    @property
+    def tokens(self) -> int:
+        """Thinking-token budget (0 means no thinking)."""
+        if self.budget_tokens is not None:
+            return self.budget_tokens
+        return REASONING_BUDGETS[self.effort]
+
+    @property
+    def level(self) -> ReasoningEffort:
+        """Effort level; an explicit budget maps to the nearest level at or above it."""
+        if self.budget_tokens is None:
+            return self.effort
+        for effort, budget in REASONING_BUDGETS.items():
+            if self.budget_tokens <= budget:
+                return effort
+        return ReasoningEffort.HIGH
+
+    def __str__(self) -> str:
+        if self.budget_tokens is not None:
+            return f"{self.budget_tokens} tokens"
+        return self.effort.value
+
+
+@dataclass
+class Usage:
+    """Detailed accounting for one generation request.
+
+    Adapters fill the token breakdown, request id and timings of the call
+    that produced the response; the wrappers add queueing delay and the
+    number of retries it took.
+    """
+
+    cache_read_input_tokens: int = 0  # Served from the prompt cache (part of input_tokens)
+    cache_creation_input_tokens: int = 0  # Written to the prompt cache (part of input_tokens)
+    reasoning_tokens: int = 0  # Thinking tokens (included in output_tokens)
+    # input_tokens weighted by price, cache reads and writes at their own
+    # rates (1 = an uncached input token); None if the adapter has no rates.
+    billed_input_tokens: float | None = None
+    latency_seconds: float | None = None  # Wall clock of the successful provider call
+    ttft_seconds: float | None = None  # Time to first token (streaming only)
+    queue_seconds: float = 0.0  # Time spent waiting in rate/concurrency limiters
+    retries: int = 0
+    request_id: str | None = None
 
 
 @dataclass
@@ -30,6 +128,7 @@ class ModelResponse:
     input_tokens: int
     output_tokens: int
     metadata: dict[str, object] = field(default_factory=dict)
+    usage: Usage = field(default_factory=Usage)
 
     @property
     def total_tokens(self) -> int:
@@ -37,6 +136,18 @@ class ModelResponse:
         return self.input_tokens + self.output_tokens
 
 
+@dataclass
+class StreamChunk:
+    """One item from a streaming generation.
+
+    Intermediate chunks carry a text delta. The last chunk carries the
+    complete ModelResponse (full content plus usage) and no text.
+    """
+
+    text: str = ""
+    response: ModelResponse | None = None
+
+
 @runtime_checkable
 class DebateModel(Protocol):
     """Protocol for AI model adapters used in debates.
@@ -65,6 +176,8 @@ class DebateModel(Protocol):
         system_prompt: str,
         messages: list[Message],
         max_tokens: int = 4096,
+        timeout: float | None = None,
+        reasoning: Reasoning | None = None,
     ) -> ModelResponse:
         """Generate a response from the model.
 
@@ -72,12 +185,41 @@ class DebateModel(Protocol):
             system_prompt: System instructions for the model.
             messages: Conversation history.
             max_tokens: Maximum tokens to generate.
+            timeout: Seconds the provider call may take; None means the
+                SDK default.
+            reasoning: Thinking effort or budget; None means the
+                provider's default.
 
         Returns:
             ModelResponse with generated content and usage stats.
         """
         ...
 
+    def generate_stream(
+        self,
+        system_prompt: str,
+        messages: list[Message],
+        max_tokens: int = 4096,
+        timeout: float | None = None,
+        reasoning: Reasoning | None = None,
+    ) -> AsyncGenerator[StreamChunk, None]:
+        """Stream a response from the model.
+
+        Args:
+            system_prompt: System instructions for the model.
+            messages: Conversation history.
+            max_tokens: Maximum tokens to generate.
+            timeout: Seconds the provider call may take; None means the
+                SDK default.
+            reasoning: Thinking effort or budget; None means the
+                provider's default.
+
+        Yields:
+            StreamChunk text deltas as they arrive, then one final chunk
+            whose ``response`` holds the full content and usage stats.
+        """
+        ...
+
 
 @dataclass
 class ModelConfig:
@@ -89,3 +231,7 @@ class ModelConfig:
     api_key_env: str  # Environment variable name for API key
     temperature: float = 0.7
     max_retries: int = 3
+    base_url: str | None = None  # OpenAI-compatible endpoints only
+    dialect: str | None = None  # OpenAI-compatible request dialect (see openai_compat)
+    max_concurrency: int | None = None  # Cap on in-flight calls to this model
+    backup_model_id: str | None = None  # Same-provider stand-in when this model fails as a judge
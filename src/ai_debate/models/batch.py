@@ -0,0 +1,522 @@
+"""Provider batch jobs for requests that need no interactive answer.
+
+A BatchBackend submits a list of BatchRequests as one job and waits for the
+results. Anthropic requests go through Message Batches, OpenAI requests
+through the Batch API, and every other provider through LocalBatchServer, an
+in-process stand-in that calls the model's generate() in the background (so
+the mode also works offline with MockModel).
+
+Adapters opt in to the hosted backends by implementing BatchCapable; requests
+for any other model go to the local server. BatchDispatcher routes requests
+to the right backend, groups them into one
+job per (backend, model), and - via complete() - falls back to interactive
+calls for requests that fail inside a job or are still pending when the
+straggler timeout runs out. A job that straggles is cancelled, but the
+requests it had already finished (and billed) are kept.
+"""
+
+import asyncio
+import itertools
+import json
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any, Protocol, runtime_checkable
+
+from ai_debate.models.base import DebateModel, Message, ModelResponse, Reasoning
+from ai_debate.models.deadline import Deadline
+from ai_debate.models.wrapper import unwrap_model
+
+# Hosted batch jobs usually finish within an hour (the providers promise 24h).
+DEFAULT_STRAGGLER_TIMEOUT = 3600.0
+
+
+@dataclass
+class BatchRequest:
+    """One generation request inside a batch job."""
+
+    custom_id: str
+    model: DebateModel
+    system_prompt: str
+    messages: list[Message]
+    max_tokens: int = 4096
+    reasoning: Reasoning | None = None
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one BatchRequest: a response or an error message."""
+
+    custom_id: str
+    response: ModelResponse | None = None
+    error: str | None = None
+
+
+@runtime_checkable
+class BatchCapable(Protocol):
+    """An adapter whose requests can go into its provider's batch jobs."""
+
+    @property
+    def batch_client(self) -> Any:
+        """The SDK client batch jobs are created and polled with."""
+        ...
+
+    def batch_params(
+        self,
+        system_prompt: str,
+        messages: list[Message],
+        max_tokens: int,
+        reasoning: Reasoning | None = None,
+    ) -> dict[str, Any]:
+        """The request body for one entry of a batch job."""
+        ...
+
+    def batch_response(self, result: Any) -> ModelResponse:
+        """Convert one successful batch result into a ModelResponse."""
+        ...
+
+
+def _batch_adapter(request: BatchRequest) -> BatchCapable:
+    """The adapter behind ``request``'s model, which must support batching."""
+    adapter = unwrap_model(request.model)
+    if not isinstance(adapter, BatchCapable):
+        raise TypeError(f"{request.model.name} does not support provider batch jobs")
+    return adapter
+
+
+class BatchBackend(Protocol):
+    """Submits a list of requests as one job and waits for the results.
+
+    A job still running when ``deadline`` passes (or that fails or is
+    cancelled while waiting) is cancelled at the provider. A job still
+    running after ``straggler_timeout`` seconds is cancelled too, but the
+    results it already has are returned; the unfinished requests are
+    missing from them.
+    """
+
+    async def run(
+        self,
+        requests: list[BatchRequest],
+        deadline: Deadline | None = None,
+        straggler_timeout: float | None = None,
+    ) -> dict[str, BatchResult]:
+        ...
+
+
+async def _poll(
+    check: Callable[[], Awaitable[bool]],
+    interval: float,
+    deadline: Deadline | None,
+    straggler_timeout: float | None = None,
+) -> bool:
+    """Call ``check`` every ``interval`` seconds until it returns True.
+
+    Returns:
+        False if ``straggler_timeout`` seconds passed first.
+    """
+    stop = None if straggler_timeout is None else time.monotonic() + straggler_timeout
+    while not await check():
+        if deadline is not None:
+            deadline.check()
+        if stop is None:
+            await asyncio.sleep(interval)
+            continue
+        left = stop - time.monotonic()
+        if left <= 0:
+            return False
+        await asyncio.sleep(min(interval, left))
+    return True
+
+
+class AnthropicBatchBackend:
+    """Anthropic Message Batches (``client.messages.batches``)."""
+
+    def __init__(self, poll_interval: float = 30.0):
+        self.poll_interval = poll_interval
+
+    async def run(
+        self,
+        requests: list[BatchRequest],
+        deadline: Deadline | None = None,
+        straggler_timeout: float | None = None,
+    ) -> dict[str, BatchResult]:
+        adapter = _batch_adapter(requests[0])
+        client = adapter.batch_client
+        batch = await client.messages.batches.create(
+            requests=[
+                {
+                    "custom_id": r.custom_id,
+                    "params": _batch_adapter(r).batch_params(
+                        r.system_prompt, r.messages, r.max_tokens, reasoning=r.reasoning
+                    ),
+                }
+                for r in requests
+            ]
+        )
+
+        async def ended() -> bool:
+            nonlocal batch
+            batch = await client.messages.batches.retrieve(batch.id)
+            return bool(batch.processing_status == "ended")
+
+        try:
+            on_time = await _poll(ended, self.poll_interval, deadline, straggler_timeout)
+        except BaseException:
+            # Abandoned (deadline or polling error): stop paying for the job.
+            await client.messages.batches.cancel(batch.id)
+            raise
+        if not on_time:
+            # Cancel the stragglers; requests that already succeeded keep
+            # their results once the job has ended.
+            await client.messages.batches.cancel(batch.id)
+            await _poll(ended, self.poll_interval, deadline)
+
+        results: dict[str, BatchResult] = {}
+        async for item in await client.messages.batches.results(batch.id):
+            if item.result.type == "succeeded":
+                response = adapter.batch_response(item.result.message)
+                results[item.custom_id] = BatchResult(item.custom_id, response=response)
+            else:
+                error = getattr(item.result, "error", None)
+                results[item.custom_id] = BatchResult(
+                    item.custom_id, error=str(error or item.result.type)
+                )
+        return results
+
+
+class OpenAIBatchBackend:
+    """OpenAI Batch API over ``/v1/chat/completions``.
+
+    A batch file may only target one model, so BatchDispatcher groups
+    requests by model before calling run().
+    """
+
+    ENDPOINT = "/v1/chat/completions"
+    TERMINAL = {"completed", "failed", "expired", "cancelled"}
+
+    def __init__(self, poll_interval: float = 30.0):
+        self.poll_interval = poll_interval
+
+    async def run(
+        self,
+        requests: list[BatchRequest],
+        deadline: Deadline | None = None,
+        straggler_timeout: float | None = None,
+    ) -> dict[str, BatchResult]:
+        import openai  # Deferred so batching never forces the SDK import
+
+        adapter = _batch_adapter(requests[0])
+        client = adapter.batch_client
+        lines = []
+        for r in requests:
+            body = adapter.batch_params(
+                r.system_prompt, r.messages, r.max_tokens, reasoning=r.reasoning
+            )
+            lines.append(json.dumps({
+                "custom_id": r.custom_id,
+                "method": "POST",
+                "url": self.ENDPOINT,
+                "body": body,
+            }))
+        upload = await client.files.create(
+            file=("batch.jsonl", "\n".join(lines).encode()),
+            purpose="batch",
+        )
+        batch = await client.batches.create(
+            input_file_id=upload.id,
+            endpoint=self.ENDPOINT,
+            completion_window="24h",
+        )
+
+        async def finished() -> bool:
+            nonlocal batch
+            batch = await client.batches.retrieve(batch.id)
+            return batch.status in self.TERMINAL
+
+        try:
+            on_time = await _poll(finished, self.poll_interval, deadline, straggler_timeout)
+        except BaseException:
+            await client.batches.cancel(batch.id)
+            raise
+        if not on_time:
+            # A cancelled batch still writes the requests it completed to
+            # its output file.
+            await client.batches.cancel(batch.id)
+            await _poll(finished, self.poll_interval, deadline)
+
+        results: dict[str, BatchResult] = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            content = await client.files.content(file_id)
+            for line in content.text.splitlines():
+                if not line.strip():
+                    continue
+                item = json.loads(line)
+                custom_id = item["custom_id"]
+                reply = item.get("response") or {}
+                if item.get("error") or reply.get("status_code") != 200:
+                    error = item.get("error") or reply.get("body")
+                    results[custom_id] = BatchResult(custom_id, error=str(error))
+                    continue
+                completion = openai.types.chat.ChatCompletion.model_validate(reply["body"])
+                results[custom_id] = BatchResult(
+                    custom_id, response=adapter.batch_response(completion)
+                )
+        return results
+
+
+@dataclass
+class _LocalJob:
+    requests: list[BatchRequest]
+    status: str = "in_progress"
+    results: dict[str, BatchResult] = field(default_factory=dict)
+    task: "asyncio.Task[None] | None" = None
+
+
+class LocalBatchServer:
+    """In-process stand-in for a provider batch service.
+
+    Jobs are processed in the background through each model's generate(),
+    with bounded concurrency, and expose the same submit / status / results
+    life cycle as the hosted APIs.
+    """
+
+    def __init__(self, concurrency: int = 8):
+        self.concurrency = concurrency
+        self._jobs: dict[str, _LocalJob] = {}
+        self._ids = itertools.count(1)
+
+    def submit(self, requests: list[BatchRequest]) -> str:
+        """Queue a job and return its id."""
+        batch_id = f"local-batch-{next(self._ids)}"
+        job = _LocalJob(requests=requests)
+        job.task = asyncio.ensure_future(self._process(job))
+        self._jobs[batch_id] = job
+        return batch_id
+
+    async def _process(self, job: _LocalJob) -> None:
+        slots = asyncio.Semaphore(self.concurrency)
+
+        async def one(request: BatchRequest) -> None:
+            async with slots:
+                try:
+                    response = await request.model.generate(
+                        system_prompt=request.system_prompt,
+                        messages=request.messages,
+                        max_tokens=request.max_tokens,
+                        reasoning=request.reasoning,
+                    )
+                except Exception as e:
+                    job.results[request.custom_id] = BatchResult(request.custom_id, error=repr(e))
+                else:
+                    job.results[request.custom_id] = BatchResult(
+                        request.custom_id, response=response
+                    )
+
+        await asyncio.gather(*[one(r) for r in job.requests])
+        job.status = "ended"
+
+    def status(self, batch_id: str) -> str:
+        return self._jobs[batch_id].status
+
+    def cancel(self, batch_id: str) -> dict[str, BatchResult]:
+        """Stop a job and forget it, returning the results it already has."""
+        job = self._jobs.pop(batch_id, None)
+        if job is None:
+            return {}
+        if job.task is not None:
+            job.task.cancel()
+        return dict(job.results)
+
+    def results(self, batch_id: str) -> dict[str, BatchResult]:
+        """Results of an ended job (the job is forgotten afterwards)."""
+        job = self._jobs.pop(batch_id)
+        if job.status != "ended":
+            raise RuntimeError(f"Batch {batch_id} has not ended")
+        return job.results
+
+
+class LocalBatchBackend:
+    """Runs requests through a LocalBatchServer, polling like a hosted API."""
+
+    def __init__(
+        self,
+        server: LocalBatchServer | None = None,
+        poll_interval: float = 0.5,
+    ):
+        self.server = server or LocalBatchServer()
+        self.poll_interval = poll_interval
+
+    async def run(
+        self,
+        requests: list[BatchRequest],
+        deadline: Deadline | None = None,
+        straggler_timeout: float | None = None,
+    ) -> dict[str, BatchResult]:
+        batch_id = self.server.submit(requests)
+
+        async def ended() -> bool:
+            return self.server.status(batch_id) == "ended"
+
+        try:
+            on_time = await _poll(ended, self.poll_interval, deadline, straggler_timeout)
+        except BaseException:
+            self.server.cancel(batch_id)
+            raise
+        if not on_time:
+            return self.server.cancel(batch_id)
+        return self.server.results(batch_id)
+
+
+# Providers with a hosted batch API; everything else uses the local server.
+HOSTED_BATCH_BACKENDS: dict[str, type] = {
+    "Anthropic": AnthropicBatchBackend,
+    "OpenAI": OpenAIBatchBackend,
+}
+
+
+class BatchDispatcher:
+    """Routes requests to batch backends, with interactive fallback."""
+
+    def __init__(
+        self,
+        backends: dict[str, BatchBackend] | None = None,
+        local: LocalBatchBackend | None = None,
+        verbose: bool = True,
+        poll_interval: float = 30.0,
+        timeout: float | None = None,
+        label: str = "batch",
+    ):
+        """Initialize the dispatcher.
+
+        Args:
+            backends: Backend per provider name. Defaults to the hosted batch
+                APIs for Anthropic and OpenAI.
+            local: Backend for every other provider (default: a fresh
+                LocalBatchServer).
+            verbose: Whether to print progress.
+            poll_interval: Seconds between status checks on hosted jobs.
+            timeout: Seconds to wait for the jobs of each submit() before
+                giving up.
+            label: Name used in progress lines and deadline errors.
+        """
+        if backends is None:
+            backends = {
+                provider: cls(poll_interval=poll_interval)
+                for provider, cls in HOSTED_BATCH_BACKENDS.items()
+            }
+        self.backends = backends
+        self.local = local or LocalBatchBackend()
+        self.verbose = verbose
+        self.timeout = timeout
+        self.label = label
+
+    def backend_for(self, model: DebateModel) -> BatchBackend:
+        """The hosted backend for ``model``'s provider, or the local one.
+
+        Models whose adapter is not BatchCapable always go to the local one.
+        """
+        backend = self.backends.get(model.provider)
+        if backend is None or not isinstance(unwrap_model(model), BatchCapable):
+            return self.local
+        return backend
+
+    async def _run_job(
+        self,
+        backend: BatchBackend,
+        requests: list[BatchRequest],
+        straggler_timeout: float | None,
+        deadline: Deadline | None,
+    ) -> dict[str, BatchResult]:
+        results = await backend.run(requests, deadline, straggler_timeout)
+        missing = len(requests) - len(results)
+        if missing and self.verbose:
+            print(f"  {requests[0].model.name}: {missing} of {len(requests)} {self.label} "
+                  f"request(s) returned no result")
+        return results
+
+    async def submit(
+        self,
+        requests: list[BatchRequest],
+        straggler_timeout: float | None = None,
+    ) -> dict[str, BatchResult]:
+        """Run ``requests`` as one job per (backend, model).
+
+        Args:
+            requests: Requests with unique custom_ids.
+            straggler_timeout: Seconds to wait for each job; a job that has
+                not finished by then is cancelled, and its unfinished requests
+                are missing from the result.
+
+        Returns:
+            Results by custom_id. Requests may be missing or carry an error.
+
+        Raises:
+            DeadlineExceededError: If ``timeout`` passes before the jobs finish.
+        """
+        # The timeout starts with each submission, not with the dispatcher.
+        deadline = Deadline.after(self.timeout, self.label) if self.timeout is not None else None
+        groups: dict[tuple[int, str], list[BatchRequest]] = {}
+        for request in requests:
+            backend = self.backend_for(request.model)
+            groups.setdefault((id(backend), request.model.model_id), []).append(request)
+
+        if self.verbose:
+            print(f"\nSubmitting {len(requests)} {self.label} requests "
+                  f"in {len(groups)} batch job(s)...")
+
+        outcomes = await asyncio.gather(*[
+            self._run_job(self.backend_for(batch[0].model), batch, straggler_timeout, deadline)
+            for batch in groups.values()
+        ])
+        results: dict[str, BatchResult] = {}
+        for outcome in outcomes:
+            results.update(outcome)
+        return results
+
+    async def generate(
+        self,
+        request: BatchRequest,
+        reason: str,
+        timeout: float | None = None,
+    ) -> ModelResponse:
+        """Run one request interactively after its batch attempt failed."""
+        if self.verbose:
+            print(f"  {request.model.name}: batch request {request.custom_id} failed "
+                  f"({reason[:80]}); retrying interactively")
+        return await request.model.generate(
+            system_prompt=request.system_prompt,
+            messages=request.messages,
+            max_tokens=request.max_tokens,
+            timeout=timeout,
+            reasoning=request.reasoning,
+        )
+
+    async def complete(
+        self,
+        requests: list[BatchRequest],
+        straggler_timeout: float | None = None,
+        fallback_timeout: float | None = None,
+    ) -> dict[str, BatchResult]:
+        """Like submit(), but retry failures and stragglers interactively.
+
+        Returns:
+            A result for every request; ``error`` is set only when the
+            interactive retry failed as well.
+        """
+        results = await self.submit(requests, straggler_timeout)
+
+        async def settle(request: BatchRequest) -> BatchResult:
+            result = results.get(request.custom_id)
+            if result is not None and result.response is not None:
+                return result
+            reason = result.error if result and result.error else "no result returned"
+            try:
+                response = await self.generate(request, reason, fallback_timeout)
+            except Exception as e:
+                return BatchResult(request.custom_id, error=repr(e))
+            return BatchResult(request.custom_id, response=response)
+
+        settled = await asyncio.gather(*[settle(r) for r in requests])
+        return {result.custom_id: result for result in settled}
@@ -0,0 +1,437 @@
+"""Content-addressed response cache with in-flight request coalescing.
+
+CachedModel wraps any DebateModel and keys each call by a hash of
+(model_id, temperature, system_prompt, messages, max_tokens, reasoning).
+Responses live in a single SQLite file, zlib-compressed, and the least
+recently used entries are evicted once the file grows past ``max_bytes``.
+Identical requests that are already in flight share one upstream call;
+each caller gets its own copy of the response.
+
+A stream closed early (typically by the engine's output guard) is stored
+with the text it had produced. The guard stops a replay of that text at
+the same point, so a re-run keeps the same speech without paying for it.
+
+The cache mode is chosen per run:
+
+- ``off``: no caching (CachedModel is not installed at all).
+- ``read-write``: serve hits, call the provider on a miss and store it.
+- ``read-only``: serve hits, call the provider on a miss but store nothing.
+- ``replay``: serve hits only; a miss raises CacheMissError.
+"""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import time
+import zlib
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from dataclasses import asdict, dataclass, replace
+from enum import StrEnum
+from pathlib import Path
+
+from ai_debate.models.base import DebateModel, Message, ModelResponse, Reasoning, StreamChunk, Usage
+from ai_debate.models.ratelimit import CHARS_PER_TOKEN, estimate_tokens
+from ai_debate.models.wrapper import ModelWrapper
+
+DEFAULT_CACHE_PATH = Path(".cache") / "responses.sqlite"
+
+
+class CacheMode(StrEnum):
+    """How a run uses the response cache."""
+
+    OFF = "off"
+    READ_WRITE = "read-write"
+    READ_ONLY = "read-only"
+    REPLAY = "replay"
+
+
+class _CallAbandonedError(Exception):
+    """Set on an in-flight call whose caller stopped before it finished.
+
+    Waiters never see it: they retry the request themselves instead.
+    """
+
+
+class CacheMissError(LookupError):
+    """Raised in replay mode when a request has no cached response."""
+
+    def __init__(self, model_id: str, key: str):
+        super().__init__(f"No cached response for {model_id} (key {key[:12]}) in replay mode")
+        self.model_id = model_id
+        self.key = key
+
+
+def _copy(response: ModelResponse) -> ModelResponse:
+    """A copy whose usage and metadata the caller may change in place."""
+    return replace(response, metadata=dict(response.metadata), usage=replace(response.usage))
+
+
+def cache_key(
+    model_id: str,
+    temperature: float | None,
+    system_prompt: str,
+    messages: list[Message],
+    max_tokens: int,
+    reasoning: Reasoning | None = None,
+) -> str:
+    """Stable SHA-256 key for a generation request.
+
+    ``reasoning`` only enters the key when set, so entries written before
+    per-call reasoning existed keep their keys.
+    """
+    request: dict[str, object] = {
+        "model_id": model_id,
+        "temperature": temperature,
+        "system_prompt": system_prompt,
+        "messages": [[m.role.value, m.content] for m in messages],
+        "max_tokens": max_tokens,
+    }
+    if reasoning is not None:
+        request["reasoning"] = [reasoning.effort.value, reasoning.budget_tokens]
+    payload = json.dumps(
+        request,
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """Counters reported in the run summary."""
+
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0  # Requests that waited on an identical in-flight call
+    stored: int = 0
+    evicted: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses + self.coalesced
+
+    @property
+    def hit_ratio(self) -> float:
+        return (self.hits + self.coalesced) / self.lookups if self.lookups else 0.0
+
+    @property
+    def miss_ratio(self) -> float:
+        return self.misses / self.lookups if self.lookups else 0.0
+
+
+class ResponseStore:
+    """SQLite-backed key/value store with size-based LRU eviction."""
+
+    def __init__(self, path: Path | str = DEFAULT_CACHE_PATH, max_bytes: int = 512 * 1024 * 1024):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " model TEXT NOT NULL,"
+            " body BLOB NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " last_used REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_lru ON responses (last_used)")
+        self._db.commit()
+
+    def get(self, key: str) -> ModelResponse | None:
+        """Look up a response and mark it as recently used."""
+        row = self._db.execute("SELECT body FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        self._db.execute("UPDATE responses SET last_used = ? WHERE key = ?", (time.time(), key))
+        self._db.commit()
+        data = json.loads(zlib.decompress(row[0]))
+        # Token counts carry over; the timings of the original call do not.
+        usage = Usage(**data.pop("usage", {}))
+        usage.latency_seconds, usage.ttft_seconds = 0.0, None
+        usage.queue_seconds, usage.retries = 0.0, 0
+        return ModelResponse(**data, usage=usage)
+
+    def put(self, key: str, response: ModelResponse) -> int:
+        """Store a response, then evict old entries if over budget.
+
+        Returns:
+            Number of entries evicted.
+        """
+        body = zlib.compress(json.dumps(asdict(response), default=str).encode())
+        self._db.execute(
+            "INSERT OR REPLACE INTO responses (key, model, body, size, last_used)"
+            " VALUES (?, ?, ?, ?, ?)",
+            (key, response.model, body, len(body), time.time()),
+        )
+        evicted = self._evict()
+        self._db.commit()
+        return evicted
+
+    def _evict(self) -> int:
+        total = self.size_bytes()
+        evicted = 0
+        if total <= self.max_bytes:
+            return 0
+        rows = self._db.execute("SELECT key, size FROM responses ORDER BY last_used").fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            evicted += 1
+        return evicted
+
+    def size_bytes(self) -> int:
+        """Total compressed size of all stored responses."""
+        return int(self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0])
+
+    def __len__(self) -> int:
+        return int(self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0])
+
+    def close(self) -> None:
+        self._db.close()
+
+
+class ResponseCache:
+    """A ResponseStore plus the run's cache mode, stats and in-flight calls."""
+
+    def __init__(self, store: ResponseStore, mode: CacheMode = CacheMode.READ_WRITE):
+        self.store = store
+        self.mode = mode
+        self.stats = CacheStats()
+        self._in_flight: dict[str, asyncio.Future[ModelResponse]] = {}
+
+    def lookup(self, key: str) -> ModelResponse | None:
+        """Return a cached response (counting the hit), or None."""
+        if self.mode == CacheMode.OFF:
+            return None
+        response = self.store.get(key)
+        if response is not None:
+            self.stats.hits += 1
+        return response
+
+    def in_flight(self, key: str) -> "asyncio.Future[ModelResponse] | None":
+        """The pending upstream call for ``key``, if any (counted as coalesced)."""
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.stats.coalesced += 1
+        return future
+
+    async def wait(self, key: str) -> ModelResponse | None:
+        """The response of the in-flight call for ``key``.
+
+        Returns None if there is none, or it was abandoned; the caller then
+        makes the call itself (begin() before its next await).
+        """
+        while True:
+            pending = self.in_flight(key)
+            if pending is None:
+                return None
+            try:
+                return _copy(await asyncio.shield(pending))
+            except _CallAbandonedError:
+                continue
+
+    def begin(self, key: str, model_id: str) -> "asyncio.Future[ModelResponse]":
+        """Record a miss and register the upstream call that will fill it.
+
+        Raises:
+            CacheMissError: In replay mode, where misses are not allowed.
+        """
+        self.stats.misses += 1
+        if self.mode == CacheMode.REPLAY:
+            raise CacheMissError(model_id, key)
+        future: asyncio.Future[ModelResponse] = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        return future
+
+    def finish(
+        self,
+        key: str,
+        response: ModelResponse | None = None,
+        error: BaseException | None = None,
+    ) -> None:
+        """Resolve waiters for ``key`` and store the response if allowed."""
+        future = self._in_flight.pop(key)
+        if response is not None:
+            if self.mode == CacheMode.READ_WRITE:
+                self.stats.evicted += self.store.put(key, response)
+                self.stats.stored += 1
+            # The caller's wrappers update its response in place.
+            future.set_result(_copy(response))
+        else:
+            future.set_exception(error or RuntimeError("upstream call produced no response"))
+            # Mark retrieved so an error nobody waited on is not logged.
+            future.exception()
+
+    def abandon(self, key: str) -> None:
+        """Release ``key`` after its call was cancelled, or closed before any text.
+
+        Nothing is stored and waiters are not failed: one of them makes
+        the call again.
+        """
+        self.finish(key, error=_CallAbandonedError(key))
+
+    async def fetch(
+        self,
+        key: str,
+        model_id: str,
+        call: Callable[[], Awaitable[ModelResponse]],
+    ) -> ModelResponse:
+        """Serve ``key`` from cache, an in-flight call, or ``call()``."""
+        cached = self.lookup(key) or await self.wait(key)
+        if cached is not None:
+            return cached
+        self.begin(key, model_id)
+        try:
+            response = await call()
+        except asyncio.CancelledError:
+            self.abandon(key)
+            raise
+        except BaseException as e:
+            self.finish(key, error=e)
+            raise
+        self.finish(key, response=response)
+        return response
+
+    def summary(self) -> str:
+        """One-line report for the end of a run."""
+        s = self.stats
+        return (
+            f"  {self.mode.value}: {s.lookups} lookups, {s.hit_ratio:.0%} hit "
+            f"({s.hits} cached, {s.coalesced} coalesced), {s.miss_ratio:.0%} miss, "
+            f"{s.stored} stored, {s.evicted} evicted, "
+            f"{len(self.store)} entries / {self.store.size_bytes() / 1024:.0f} KiB on disk"
+        )
+
+    def close(self) -> None:
+        self.store.close()
+
+
+def open_cache(
+    mode: CacheMode | str,
+    path: Path | str = DEFAULT_CACHE_PATH,
+    max_bytes: int = 512 * 1024 * 1024,
+) -> ResponseCache | None:
+    """Open the response cache for a run, or None when ``mode`` is off."""
+    mode = CacheMode(mode)
+    if mode == CacheMode.OFF:
+        return None
+    return ResponseCache(ResponseStore(path, max_bytes), mode)
+
+
+class CachedModel(ModelWrapper):
+    """Serves repeated requests from a ResponseCache.
+
+    Install it outermost so hits skip rate limiting, hedging and retries.
+    """
+
+    def __init__(self, inner: DebateModel, cache: ResponseCache, temperature: float | None = None):
+        super().__init__(inner)
+        self.cache = cache
+        self.temperature = temperature
+
+    def _key(
+        self,
+        system_prompt: str,
+        messages: list[Message],
+        max_tokens: int,
+        reasoning: Reasoning | None,
+    ) -> str:
+        return cache_key(
+            self.model_id, self.temperature, system_prompt, messages, max_tokens, reasoning
+        )
+
+    async def generate(
+        self,
+        system_prompt: str,
+        messages: list[Message],
+        max_tokens: int = 4096,
+        timeout: float | None = None,
+        reasoning: Reasoning | None = None,
+    ) -> ModelResponse:
+        return await self.cache.fetch(
+            self._key(system_prompt, messages, max_tokens, reasoning),
+            self.model_id,
+            lambda: self.inner.generate(
+                system_prompt=system_prompt,
+                messages=messages,
+                max_tokens=max_tokens,
+                timeout=timeout,
+                reasoning=reasoning,
+            ),
+        )
+
+    async def generate_stream(
+        self,
+        system_prompt: str,
+        messages: list[Message],
+        max_tokens: int = 4096,
+        timeout: float | None = None,
+        reasoning: Reasoning | None = None,
+    ) -> AsyncGenerator[StreamChunk, None]:
+        """Stream a miss from the provider; replay a hit as a single chunk."""
+        key = self._key(system_prompt, messages, max_tokens, reasoning)
+        cached = self.cache.lookup(key) or await self.cache.wait(key)
+        if cached is not None:
+            yield StreamChunk(text=cached.content)
+            yield StreamChunk(response=cached)
+            return
+
+        self.cache.begin(key, self.model_id)
+        response: ModelResponse | None = None
+        parts: list[str] = []
+        stream = self.inner.generate_stream(
+            system_prompt=system_prompt,
+            messages=messages,
+            max_tokens=max_tokens,
+            timeout=timeout,
+            reasoning=reasoning,
+        )
+        try:
+            async for chunk in stream:
+                if chunk.text:
+                    parts.append(chunk.text)
+                if chunk.response is not None:
+                    response = chunk.response
+                yield chunk
+        except GeneratorExit:
+            # Closed early, e.g. by the output guard: keep what was streamed.
+            if parts:
+                self.cache.finish(key, response=self._closed_response(
+                    system_prompt, messages, "".join(parts)
+                ))
+            else:
+                self.cache.abandon(key)
+            raise
+        except asyncio.CancelledError:
+            # Nothing the caller kept; a waiter makes the call again.
+            self.cache.abandon(key)
+            raise
+        except BaseException as e:
+            self.cache.finish(key, error=e)
+            raise
+        finally:
+            await stream.aclose()
+        self.cache.finish(key, response=response)
+
+    def _closed_response(
+        self,
+        system_prompt: str,
+        messages: list[Message],
+        text: str,
+    ) -> ModelResponse:
+        """The response stored for a stream closed before it finished.
+
+        The provider's usage never arrived, so token counts are estimated.
+        """
+        return ModelResponse(
+            content=text,
+            model=self.model_id,
+            input_tokens=estimate_tokens(system_prompt, messages),
+            output_tokens=max(1, len(text) // CHARS_PER_TOKEN),
+            metadata={"finish_reason": "closed"},
+        )
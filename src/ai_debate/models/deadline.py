@@ -0,0 +1,90 @@
+"""Time budgets that flow from matrix to debate to phase to adapter call."""
+
+import asyncio
+import time
+from collections.abc import Awaitable
+from dataclasses import dataclass
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+class DeadlineExceededError(TimeoutError):
+    """A matrix, debate, phase or judge call ran out of its time budget.
+
+    Subclasses TimeoutError so generic timeout handling still applies, but
+    carries the scope that expired so the runner can decide whether to
+    retry the debate or give up on the whole matrix.
+    """
+
+    def __init__(self, scope: str, budget: float | None = None):
+        detail = f" after {budget:.1f}s" if budget is not None else ""
+        super().__init__(f"{scope} deadline exceeded{detail}")
+        self.scope = scope
+        self.budget = budget
+
+
+@dataclass(frozen=True)
+class Deadline:
+    """An absolute expiry on the monotonic clock."""
+
+    expires_at: float
+    scope: str = "run"
+
+    @classmethod
+    def after(cls, seconds: float, scope: str = "run") -> "Deadline":
+        """A deadline ``seconds`` from now."""
+        return cls(expires_at=time.monotonic() + seconds, scope=scope)
+
+    def remaining(self) -> float:
+        """Seconds left (never negative)."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    def check(self) -> None:
+        """Raise DeadlineExceededError if the deadline has passed."""
+        if self.expired:
+            raise DeadlineExceededError(self.scope)
+
+    def child(self, seconds: float | None, scope: str) -> "Deadline":
+        """A nested deadline that never outlives this one."""
+        if seconds is None:
+            return Deadline(self.expires_at, scope)
+        return Deadline(min(self.expires_at, time.monotonic() + seconds), scope)
+
+
+def child_deadline(
+    parent: Deadline | None,
+    seconds: float | None,
+    scope: str,
+) -> Deadline | None:
+    """Combine an optional parent deadline with an optional local budget."""
+    if parent is not None:
+        return parent.child(seconds, scope)
+    if seconds is not None:
+        return Deadline.after(seconds, scope)
+    return None
+
+
+async def run_with_deadline(awaitable: Awaitable[T], deadline: Deadline | None) -> T:
+    """Await ``awaitable``, cancelling it when ``deadline`` expires.
+
+    This is the backstop for SDK timeouts, which only bound the gaps between
+    bytes and so never fire on a slowly trickling stream.
+
+    Raises:
+        DeadlineExceededError: If the deadline passes first.
+    """
+    if deadline is None:
+        return await awaitable
+    budget = deadline.remaining()
+    try:
+        async with asyncio.timeout(budget):
+            return await awaitable
+    except DeadlineExceededError:
+        raise
+    except TimeoutError:
+        raise DeadlineExceededError(deadline.scope, budget) from None
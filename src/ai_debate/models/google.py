@@ -1,12 +1,53 @@
-"""Google (Gemini) model adapter using the new Google GenAI SDK."""
+"""Google (Gemini) model adapter using the new Google GenAI SDK.
 
-import os
+Conversations marked for prompt caching (Message.cache_control) are served
+from explicit cached content: the stable part of the prefix (system prompt
+and every turn before the last) is stored with ``caches.create`` once it
+reaches MIN_CACHE_TOKENS, and later requests that extend it reference the
+longest matching cache and send only the turns after it. A new cache is
+made only when that uncached tail has itself grown past the minimum, so the
+prefix is not re-uploaded on every call. Concurrent requests that would
+create the same cache wait for the first one's creation instead of
+making duplicates. Caches expire after ``cache_ttl``;
+one that is about to expire is no longer used and is created again on
+demand, and aclose() deletes the caches that are still alive.
+"""
+
+import asyncio
+import hashlib
+import time
+from collections.abc import AsyncGenerator
 from dataclasses import dataclass, field
 
+import httpx
 from google import genai
 from google.genai import types
 
-from ai_debate.models.base import Message, ModelResponse, Role
+from ai_debate.models.base import (
+    Message,
+    ModelResponse,
+    Reasoning,
+    ReasoningEffort,
+    Role,
+    StreamChunk,
+    Usage,
+)
+from ai_debate.models.keypool import primary_key
+
+# Gemini 3 takes a thinking level rather than a budget, and Pro offers only
+# low and high.
+THINKING_LEVELS: dict[ReasoningEffort, types.ThinkingLevel] = {
+    ReasoningEffort.NONE: types.ThinkingLevel.LOW,
+    ReasoningEffort.MINIMAL: types.ThinkingLevel.LOW,
+    ReasoningEffort.LOW: types.ThinkingLevel.LOW,
+    ReasoningEffort.MEDIUM: types.ThinkingLevel.HIGH,
+    ReasoningEffort.HIGH: types.ThinkingLevel.HIGH,
+}
+MIN_PRO_THINKING_BUDGET = 128  # Gemini 2.5 Pro cannot turn thinking off
+
+CHARS_PER_TOKEN = 4
+MIN_CACHE_TOKENS = 4096  # Smaller explicit caches are rejected (or not worth it)
+CACHE_EXPIRY_MARGIN = 60.0  # Seconds before expiry a cache stops being used
 
 
 @dataclass
@@ -17,19 +58,201 @@ class GoogleModel:
     name: str = "Gemini 3 Pro"
     provider: str = "Google"
     temperature: float = 0.7
+    api_key_env: str = "GOOGLE_API_KEY"
+    max_retries: int = 0
+    http_client: httpx.AsyncClient | None = field(default=None, repr=False)
+    cache_ttl: int = 900  # Seconds an explicit prompt cache lives
     _client: genai.Client = field(init=False, repr=False)
+    # Prefix hash -> (cached content name, monotonic expiry). A None name
+    # means creation failed; it is not retried.
+    _caches: dict[str, tuple[str | None, float]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    # Prefix hash -> cache name (None on failure) of a creation in flight.
+    _creating: dict[str, asyncio.Future[str | None]] = field(
+        default_factory=dict, init=False, repr=False
+    )
 
     def __post_init__(self) -> None:
-        api_key = os.environ.get("GOOGLE_API_KEY")
+        api_key = primary_key(self.api_key_env)
         if not api_key:
-            raise ValueError("GOOGLE_API_KEY environment variable not set")
-        self._client = genai.Client(api_key=api_key)
+            raise ValueError(f"{self.api_key_env} environment variable not set")
+        http_options = types.HttpOptions()
+        if self.http_client is not None:
+            http_options.httpx_async_client = self.http_client
+        if self.max_retries > 0:
+            http_options.retry_options = types.HttpRetryOptions(
+                attempts=self.max_retries + 1,
+            )
+        self._client = genai.Client(api_key=api_key, http_options=http_options)
+
+    def _build_contents(self, messages: list[Message]) -> list[types.Content]:
+        """Convert messages to Gemini turns (assistant turns are "model")."""
+        return [
+            types.Content(
+                role="model" if msg.role == Role.ASSISTANT else "user",
+                parts=[types.Part(text=msg.content)],
+            )
+            for msg in messages
+        ]
+
+    def _prefix_keys(self, system_prompt: str, messages: list[Message]) -> list[str]:
+        """Hash of the system prompt plus the first i messages, for every i."""
+        digest = hashlib.sha256(f"{self.model_id}\x00{system_prompt}".encode())
+        keys = [digest.hexdigest()]
+        for msg in messages:
+            digest.update(f"\x00{msg.role.value}\x00{msg.content}".encode())
+            keys.append(digest.hexdigest())
+        return keys
+
+    async def _cached_prefix(
+        self,
+        system_prompt: str,
+        messages: list[Message],
+    ) -> tuple[str | None, int]:
+        """Cached content to use for this request and how many messages it covers.
+
+        Only the turns before the last one are cached: they are what the
+        next request in the conversation will share.
+        """
+        if not any(msg.cache_control for msg in messages):
+            return None, 0
+        stable = len(messages) - 1
+        keys = self._prefix_keys(system_prompt, messages[:stable])
+        now = time.monotonic()
+        for key in keys:
+            if key in self._caches and self._caches[key][1] - CACHE_EXPIRY_MARGIN <= now:
+                del self._caches[key]  # Expired (or about to): make it again if needed
+        name, covered = None, 0
+        for i in range(stable, 0, -1):
+            if keys[i] in self._caches and self._caches[keys[i]][0]:
+                name, covered = self._caches[keys[i]][0], i
+                break
+
+        tail = messages[covered:stable] if name else messages[:stable]
+        tail_tokens = sum(len(m.content) for m in tail) // CHARS_PER_TOKEN
+        if not name:
+            tail_tokens += len(system_prompt) // CHARS_PER_TOKEN
+        if stable == 0 or keys[stable] in self._caches or tail_tokens < MIN_CACHE_TOKENS:
+            return name, covered
+        if keys[stable] in self._creating:
+            created = await asyncio.shield(self._creating[keys[stable]])
+            return (created, stable) if created else (name, covered)
+
+        creating = asyncio.get_running_loop().create_future()
+        self._creating[keys[stable]] = creating
+        try:
+            cache = await self._client.aio.caches.create(
+                model=self.model_id,
+                config=types.CreateCachedContentConfig(
+                    system_instruction=system_prompt,
+                    contents=self._build_contents(messages[:stable]),
+                    ttl=f"{self.cache_ttl}s",
+                ),
+            )
+        except Exception:
+            # e.g. below the model's minimum
+            self._caches[keys[stable]] = (None, float("inf"))
+            return name, covered
+        else:
+            self._caches[keys[stable]] = (cache.name, now + self.cache_ttl)
+            creating.set_result(cache.name)
+            return cache.name, stable
+        finally:
+            # Failed or cancelled: waiters go ahead without the new cache.
+            if not creating.done():
+                creating.set_result(None)
+            del self._creating[keys[stable]]
+
+    async def aclose(self) -> None:
+        """Delete the prompt caches this adapter created that are still alive."""
+        now = time.monotonic()
+        names = [name for name, expires in self._caches.values() if name and expires > now]
+        self._caches.clear()
+        for name in names:
+            try:
+                await self._client.aio.caches.delete(name=name)
+            except Exception:
+                pass  # Already expired or deleted; it lapses after cache_ttl anyway
+
+    async def _prepare(
+        self,
+        system_prompt: str,
+        messages: list[Message],
+        max_tokens: int,
+        timeout: float | None,
+        reasoning: Reasoning | None,
+    ) -> tuple[list[types.Content], types.GenerateContentConfig]:
+        """Contents and config for a request, using a prompt cache if one applies."""
+        config = self._build_config(system_prompt, max_tokens, timeout, reasoning)
+        cache_name, covered = await self._cached_prefix(system_prompt, messages)
+        if cache_name is not None:
+            # The system prompt lives in the cache and may not be repeated.
+            config.cached_content = cache_name
+            config.system_instruction = None
+        return self._build_contents(messages[covered:]), config
+
+    def _build_config(
+        self,
+        system_prompt: str,
+        max_tokens: int,
+        timeout: float | None = None,
+        reasoning: Reasoning | None = None,
+    ) -> types.GenerateContentConfig:
+        config = types.GenerateContentConfig(
+            system_instruction=system_prompt,
+            max_output_tokens=max_tokens,
+            temperature=self.temperature,
+        )
+        if timeout is not None:
+            # GenAI takes per-request timeouts in milliseconds.
+            config.http_options = types.HttpOptions(timeout=int(timeout * 1000))
+        if reasoning is not None:
+            config.thinking_config = self._thinking_config(reasoning)
+        return config
+
+    def _thinking_config(self, reasoning: Reasoning) -> types.ThinkingConfig:
+        """Map a Reasoning onto a thinking level (Gemini 3) or budget (2.5)."""
+        if self.model_id.startswith("gemini-3"):
+            return types.ThinkingConfig(thinking_level=THINKING_LEVELS[reasoning.level])
+        budget = reasoning.tokens
+        if "pro" in self.model_id:
+            budget = max(MIN_PRO_THINKING_BUDGET, budget)
+        return types.ThinkingConfig(thinking_budget=budget)
+
+    def _to_response(
+        self,
+        content: str,
+        usage: types.GenerateContentResponseUsageMetadata | None,
+        finish_reason: object,
+        request_id: str | None,
+    ) -> ModelResponse:
+        """Build a ModelResponse from Gemini usage metadata.
+
+        Gemini reports thinking tokens separately from the candidates; they
+        are billed as output, so they are counted in ``output_tokens`` too.
+        """
+        thoughts = (usage.thoughts_token_count or 0) if usage else 0
+        return ModelResponse(
+            content=content,
+            model=self.model_id,
+            input_tokens=(usage.prompt_token_count or 0) if usage else 0,
+            output_tokens=((usage.candidates_token_count or 0) if usage else 0) + thoughts,
+            metadata={"finish_reason": finish_reason},
+            usage=Usage(
+                cache_read_input_tokens=(usage.cached_content_token_count or 0) if usage else 0,
+                reasoning_tokens=thoughts,
+                request_id=request_id,
+            ),
+        )
 
     async def generate(
         self,
         system_prompt: str,
         messages: list[Message],
         max_tokens: int = 4096,
+        timeout: float | None = None,
+        reasoning: Reasoning | None = None,
     ) -> ModelResponse:
         """Generate a response using Gemini.
 
@@ -37,40 +260,80 @@ class GoogleModel:
             system_prompt: System instructions for Gemini.
             messages: Conversation history.
             max_tokens: Maximum tokens to generate.
+            timeout: Request timeout in seconds (SDK default if None).
+            reasoning: Thinking level (Gemini 3) or budget (earlier models).
 
         Returns:
             ModelResponse with generated content and usage stats.
         """
-        # Build the user content from messages
-        user_content = ""
-        for msg in messages:
-            if msg.role == Role.USER:
-                user_content += msg.content
-
-        # Use the new GenAI SDK
+        started = time.monotonic()
+        contents, config = await self._prepare(
+            system_prompt, messages, max_tokens, timeout, reasoning
+        )
         response = await self._client.aio.models.generate_content(
             model=self.model_id,
-            contents=user_content,
-            config=types.GenerateContentConfig(
-                system_instruction=system_prompt,
-                max_output_tokens=max_tokens,
-                temperature=self.temperature,
-            ),
+            contents=contents,
+            config=config,
         )
 
-        # Extract usage metadata
-        usage = response.usage_metadata
-        input_tokens = usage.prompt_token_count if usage else 0
-        output_tokens = usage.candidates_token_count if usage else 0
+        result = self._to_response(
+            response.text or "",
+            response.usage_metadata,
+            response.candidates[0].finish_reason if response.candidates else None,
+            response.response_id,
+        )
+        result.usage.latency_seconds = time.monotonic() - started
+        return result
 
-        return ModelResponse(
-            content=response.text or "",
+    async def generate_stream(
+        self,
+        system_prompt: str,
+        messages: list[Message],
+        max_tokens: int = 4096,
+        timeout: float | None = None,
+        reasoning: Reasoning | None = None,
+    ) -> AsyncGenerator[StreamChunk, None]:
+        """Stream a response from Gemini via ``generate_content_stream``.
+
+        Usage metadata is cumulative, so the last chunk's counts are final.
+
+        Yields:
+            Text deltas, then a final chunk with the complete ModelResponse.
+        """
+        started = time.monotonic()
+        contents, config = await self._prepare(
+            system_prompt, messages, max_tokens, timeout, reasoning
+        )
+        stream = await self._client.aio.models.generate_content_stream(
             model=self.model_id,
-            input_tokens=input_tokens,
-            output_tokens=output_tokens,
-            metadata={
-                "finish_reason": response.candidates[0].finish_reason
-                if response.candidates
-                else None,
-            },
+            contents=contents,
+            config=config,
         )
+
+        parts: list[str] = []
+        usage = None
+        finish_reason = None
+        request_id = None
+        ttft = None
+        try:
+            async for chunk in stream:
+                usage = chunk.usage_metadata or usage
+                request_id = request_id or chunk.response_id
+                if chunk.candidates and chunk.candidates[0].finish_reason:
+                    finish_reason = chunk.candidates[0].finish_reason
+                if chunk.text:
+                    if ttft is None:
+                        ttft = time.monotonic() - started
+                    parts.append(chunk.text)
+                    yield StreamChunk(text=chunk.text)
+        finally:
+            # Release the connection if the caller stops early. The SDK types
+            # the stream as an AsyncIterator, but it is an async generator.
+            aclose = getattr(stream, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+        response = self._to_response("".join(parts), usage, finish_reason, request_id)
+        response.usage.ttft_seconds = ttft
+        response.usage.latency_seconds = time.monotonic() - started
+        yield StreamChunk(response=response)
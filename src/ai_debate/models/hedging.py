@@ -0,0 +1,269 @@
+"""Hedged requests to cut provider tail latency.
+
+HedgedModel learns each model's recent latency distribution. When a call
+has not produced output by the chosen percentile, a duplicate request is
+sent; whichever answers first wins and the other is cancelled. For
+streams, "produced output" means the first text delta, so only the time
+to first token is hedged and the winning stream is consumed normally.
+
+Hedging is capped by ``max_hedge_fraction`` so it never adds more than
+that share of extra calls.
+"""
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from ai_debate.models.base import DebateModel, Message, ModelResponse, Reasoning, StreamChunk
+from ai_debate.models.wrapper import ModelWrapper
+
+T = TypeVar("T")
+
+
+@dataclass
+class HedgeStats:
+    """Counters for one model's hedging activity."""
+
+    model_name: str
+    calls: int = 0
+    hedged: int = 0
+    hedge_wins: int = 0
+    seconds_saved: float = 0.0  # Estimated tail latency avoided by hedge wins
+
+    @property
+    def hedge_rate(self) -> float:
+        return self.hedged / self.calls if self.calls else 0.0
+
+
+_stats: dict[str, HedgeStats] = {}
+
+
+def hedge_stats() -> dict[str, HedgeStats]:
+    """Hedging counters for every hedged model seen so far."""
+    return dict(_stats)
+
+
+class LatencyTracker:
+    """Sliding window of recent latencies with percentile lookup."""
+
+    def __init__(self, window: int = 200, min_samples: int = 10):
+        self.min_samples = min_samples
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def percentile(self, q: float) -> float | None:
+        """The q-th percentile (0-100), or None until enough samples exist."""
+        if len(self._samples) < self.min_samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def expected_beyond(self, elapsed: float) -> float:
+        """Mean of recorded latencies longer than ``elapsed`` (0 if none)."""
+        tail = [s for s in self._samples if s > elapsed]
+        return sum(tail) / len(tail) if tail else 0.0
+
+
+async def _cancel(task: "asyncio.Future[Any]") -> None:
+    task.cancel()
+    try:
+        await task
+    except BaseException:
+        pass
+
+
+async def _first_success(
+    tasks: "set[asyncio.Future[T]]",
+) -> "tuple[asyncio.Future[T], set[asyncio.Future[T]]]":
+    """Wait for the first task to succeed; raise only if all of them fail.
+
+    Returns the winning task and the still-pending ones.
+    """
+    pending = set(tasks)
+    while True:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            if task.exception() is None:
+                return task, pending
+        if not pending:
+            error = next(iter(done)).exception()
+            assert error is not None
+            raise error
+
+
+class HedgedModel(ModelWrapper):
+    """Sends a backup request when the primary is slower than usual."""
+
+    def __init__(
+        self,
+        inner: DebateModel,
+        percentile: float = 95.0,
+        max_hedge_fraction: float = 0.05,
+        min_samples: int = 10,
+    ):
+        super().__init__(inner)
+        self.percentile = percentile
+        self.max_hedge_fraction = max_hedge_fraction
+        # Completion time scales with max_tokens, so generate() latencies are
+        # tracked per max_tokens bucket; time to first token is not.
+        self._min_samples = min_samples
+        self._latency: dict[int, LatencyTracker] = {}
+        self._ttft = LatencyTracker(min_samples=min_samples)
+        self.stats = _stats.setdefault(inner.name, HedgeStats(model_name=inner.name))
+
+    def _tracker(self, max_tokens: int) -> LatencyTracker:
+        bucket = max_tokens.bit_length()
+        if bucket not in self._latency:
+            self._latency[bucket] = LatencyTracker(min_samples=self._min_samples)
+        return self._latency[bucket]
+
+    def _hedge_delay(self, tracker: LatencyTracker) -> float | None:
+        """Seconds to wait before hedging, or None if hedging is not allowed."""
+        if self.stats.hedged + 1 > self.max_hedge_fraction * self.stats.calls:
+            return None
+        return tracker.percentile(self.percentile)
+
+    async def generate(
+        self,
+        system_prompt: str,
+        messages: list[Message],
+        max_tokens: int = 4096,
+        timeout: float | None = None,
+        reasoning: Reasoning | None = None,
+    ) -> ModelResponse:
+        self.stats.calls += 1
+        # Thinking runs ahead of the answer, so it counts towards the bucket.
+        tracker = self._tracker(max_tokens + (reasoning.tokens if reasoning else 0))
+
+        def call() -> asyncio.Task[ModelResponse]:
+            return asyncio.ensure_future(
+                self.inner.generate(
+                    system_prompt=system_prompt,
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    timeout=timeout,
+                    reasoning=reasoning,
+                )
+            )
+
+        started = time.monotonic()
+        primary = call()
+        # Every task still running when this returns (or is cancelled) is
+        # cancelled, so neither request outlives the call.
+        tasks: set[asyncio.Future[ModelResponse]] = {primary}
+        try:
+            delay = self._hedge_delay(tracker)
+            if delay is not None:
+                await asyncio.wait({primary}, timeout=delay)
+            if delay is None or primary.done():
+                response = await primary
+                tracker.record(time.monotonic() - started)
+                return response
+
+            self.stats.hedged += 1
+            hedge_started = time.monotonic()
+            hedge = call()
+            tasks.add(hedge)
+            winner, _ = await _first_success(tasks)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    await _cancel(task)
+
+        now = time.monotonic()
+        if winner is hedge:
+            self._record_hedge_win(tracker, now - started)
+            tracker.record(now - hedge_started)
+        else:
+            tracker.record(now - started)
+        return winner.result()
+
+    def _record_hedge_win(self, tracker: LatencyTracker, elapsed: float) -> None:
+        """Count a hedge win and estimate the tail latency it avoided.
+
+        The cancelled primary's true latency is unknown, so the saving is
+        estimated as the mean recent latency beyond the point it was dropped.
+        """
+        self.stats.hedge_wins += 1
+        self.stats.seconds_saved += max(0.0, tracker.expected_beyond(elapsed) - elapsed)
+
+    async def generate_stream(
+        self,
+        system_prompt: str,
+        messages: list[Message],
+        max_tokens: int = 4096,
+        timeout: float | None = None,
+        reasoning: Reasoning | None = None,
+    ) -> AsyncGenerator[StreamChunk, None]:
+        self.stats.calls += 1
+
+        def open_stream() -> AsyncGenerator[StreamChunk, None]:
+            return self.inner.generate_stream(
+                system_prompt=system_prompt,
+                messages=messages,
+                max_tokens=max_tokens,
+                timeout=timeout,
+                reasoning=reasoning,
+            )
+
+        async def first_text(
+            stream: AsyncGenerator[StreamChunk, None],
+        ) -> list[StreamChunk]:
+            """Pull chunks until the first text delta (or the end)."""
+            chunks: list[StreamChunk] = []
+            async for chunk in stream:
+                chunks.append(chunk)
+                if chunk.text or chunk.response is not None:
+                    break
+            return chunks
+
+        started = time.monotonic()
+        primary = open_stream()
+        primary_task = asyncio.ensure_future(first_text(primary))
+        tasks: set[asyncio.Future[list[StreamChunk]]] = {primary_task}
+        hedge: AsyncGenerator[StreamChunk, None] | None = None
+        try:
+            delay = self._hedge_delay(self._ttft)
+            if delay is not None:
+                await asyncio.wait({primary_task}, timeout=delay)
+            if delay is None or primary_task.done():
+                head = await primary_task
+                self._ttft.record(time.monotonic() - started)
+            else:
+                self.stats.hedged += 1
+                hedge_started = time.monotonic()
+                hedge = open_stream()
+                hedge_task = asyncio.ensure_future(first_text(hedge))
+                tasks.add(hedge_task)
+                task, _ = await _first_success(tasks)
+                head = task.result()
+        finally:
+            for other in tasks:
+                if not other.done():
+                    await _cancel(other)
+
+        winner = primary
+        if hedge is not None:
+            now = time.monotonic()
+            if task is hedge_task:
+                winner, loser = hedge, primary
+                self._record_hedge_win(self._ttft, now - started)
+                self._ttft.record(now - hedge_started)
+            else:
+                loser = hedge
+                self._ttft.record(now - started)
+            await loser.aclose()
+
+        try:
+            for chunk in head:
+                yield chunk
+            async for chunk in winner:
+                yield chunk
+        finally:
+            await winner.aclose()
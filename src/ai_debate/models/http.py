@@ -0,0 +1,94 @@
+"""Shared keep-alive HTTP connection pools, one per provider.
+
+Every SDK client built through the registry reuses the same httpx.AsyncClient
+for its provider, so TLS handshakes and connection setup are paid once per
+process instead of once per adapter instance.
+"""
+
+import asyncio
+import importlib.util
+from dataclasses import dataclass
+
+import httpx
+
+PROVIDER_BASE_URLS: dict[str, str] = {
+    "Anthropic": "https://api.anthropic.com",
+    "OpenAI": "https://api.openai.com",
+    "Google": "https://generativelanguage.googleapis.com",
+    "xAI": "https://api.x.ai",
+}
+
+
+@dataclass
+class PoolSettings:
+    """Connection pool tuning for a provider's shared client."""
+
+    max_connections: int = 64
+    max_keepalive_connections: int = 32
+    keepalive_expiry: float = 120.0
+    connect_timeout: float = 10.0
+    read_timeout: float = 600.0
+    http2: bool = True
+
+
+_clients: dict[str, httpx.AsyncClient] = {}
+
+
+def http2_available() -> bool:
+    """Whether the optional ``h2`` package needed for HTTP/2 is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def get_http_client(
+    provider: str,
+    settings: PoolSettings | None = None,
+) -> httpx.AsyncClient:
+    """Return the process-wide pooled client for a provider, creating it once.
+
+    Settings only apply when the client is first created.
+    """
+    client = _clients.get(provider)
+    if client is not None and not client.is_closed:
+        return client
+
+    settings = settings or PoolSettings()
+    client = httpx.AsyncClient(
+        http2=settings.http2 and http2_available(),
+        limits=httpx.Limits(
+            max_connections=settings.max_connections,
+            max_keepalive_connections=settings.max_keepalive_connections,
+            keepalive_expiry=settings.keepalive_expiry,
+        ),
+        timeout=httpx.Timeout(settings.read_timeout, connect=settings.connect_timeout),
+        follow_redirects=True,
+    )
+    _clients[provider] = client
+    return client
+
+
+async def prewarm(provider: str, connections: int = 1) -> None:
+    """Open connections to a provider ahead of the first real request.
+
+    Sends lightweight HEAD requests to the provider's base URL; the status
+    code is irrelevant, only the established keep-alive connections matter.
+    Failures are ignored so pre-warming never blocks a run.
+    """
+    base_url = PROVIDER_BASE_URLS.get(provider)
+    if base_url is None:
+        return
+    client = get_http_client(provider)
+
+    async def ping() -> None:
+        try:
+            await client.head(base_url)
+        except httpx.HTTPError:
+            pass
+
+    await asyncio.gather(*[ping() for _ in range(max(1, connections))])
+
+
+async def close_http_clients() -> None:
+    """Close every shared client. Call once at the end of a run."""
+    clients = list(_clients.values())
+    _clients.clear()
+    await asyncio.gather(*[c.aclose() for c in clients if not c.is_closed])
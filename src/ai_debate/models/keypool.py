@@ -0,0 +1,369 @@
+"""Per-provider pools of API keys, rotated by rate-limit headroom.
+
+A provider's pool is read from the environment: ``ANTHROPIC_API_KEYS`` (a
+comma-separated list) or ``ANTHROPIC_API_KEY`` plus ``ANTHROPIC_API_KEY_2``,
+``ANTHROPIC_API_KEY_3``, ... Keys for different projects of the same
+provider can be mixed freely.
+
+The SDK clients are still built with a single key. KeyPool wraps the
+transport of the provider's shared httpx client instead: each request's auth
+header is swapped for the key with the most headroom, and the provider's
+rate-limit headers are read back into that key's state. The key counts as
+in flight until the response body is closed, or the request fails or is
+cancelled. A key that is throttled (429, or no requests left) sits out
+until its reset time; one that is rejected (401/403) sits out for
+``revoked_cooldown`` seconds.
+
+Batch jobs, uploaded files and Gemini cachedContents belong to the key
+(project) that created them, so requests for them always use that key.
+"""
+
+import os
+import re
+import time
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from datetime import datetime
+
+import httpx
+
+# Header carrying the key, and how its value is built.
+AUTH_HEADERS: dict[str, tuple[str, str]] = {
+    "Anthropic": ("x-api-key", "{key}"),
+    "OpenAI": ("authorization", "Bearer {key}"),
+    "xAI": ("authorization", "Bearer {key}"),
+    "Google": ("x-goog-api-key", "{key}"),
+}
+
+# Remaining / limit / reset headers per provider (Google sends none).
+RATE_LIMIT_HEADERS: dict[str, dict[str, str]] = {
+    "Anthropic": {
+        "requests_remaining": "anthropic-ratelimit-requests-remaining",
+        "requests_limit": "anthropic-ratelimit-requests-limit",
+        "tokens_remaining": "anthropic-ratelimit-tokens-remaining",
+        "tokens_limit": "anthropic-ratelimit-tokens-limit",
+        "reset": "anthropic-ratelimit-requests-reset",
+    },
+    "OpenAI": {
+        "requests_remaining": "x-ratelimit-remaining-requests",
+        "requests_limit": "x-ratelimit-limit-requests",
+        "tokens_remaining": "x-ratelimit-remaining-tokens",
+        "tokens_limit": "x-ratelimit-limit-tokens",
+        "reset": "x-ratelimit-reset-requests",
+    },
+}
+RATE_LIMIT_HEADERS["xAI"] = RATE_LIMIT_HEADERS["OpenAI"]
+
+# Batch jobs and uploaded files belong to the key that created them; they
+# always go out on the primary key.
+PINNED_PATHS = ("/batches", "/files")
+
+_EXTENSION = "ai_debate_key"
+_CACHE_PATH = "/cachedContents"
+_CACHE_REFERENCE = re.compile(rb'"cachedContent"\s*:\s*"(cachedContents/[^"]+)"')
+_CACHE_NAME = re.compile(rb'"name"\s*:\s*"(cachedContents/[^"]+)"')
+_DURATION = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def keys_from_env(env: str) -> list[str]:
+    """Every key configured for ``env``, primary first, without duplicates.
+
+    Reads ``{env}S`` (comma-separated), then ``{env}``, ``{env}_2``,
+    ``{env}_3``, ... until the first gap.
+    """
+    if not env:
+        return []
+    keys = [k.strip() for k in os.environ.get(f"{env}S", "").split(",") if k.strip()]
+    if os.environ.get(env):
+        keys.append(os.environ[env])
+    n = 2
+    while os.environ.get(f"{env}_{n}"):
+        keys.append(os.environ[f"{env}_{n}"])
+        n += 1
+    return list(dict.fromkeys(keys))
+
+
+def primary_key(env: str) -> str | None:
+    """The key an adapter's SDK client is built with, or None if unset."""
+    keys = keys_from_env(env)
+    return keys[0] if keys else None
+
+
+def parse_reset(value: str) -> float | None:
+    """Seconds until a rate-limit window resets.
+
+    Accepts OpenAI-style durations ("1s", "6m0s", "20ms") and Anthropic's
+    RFC 3339 timestamps.
+    """
+    value = value.strip()
+    parts = _DURATION.findall(value)
+    if parts and "".join(n + u for n, u in parts) == value:
+        return sum(float(n) * _UNITS[u] for n, u in parts)
+    try:
+        return max(0.0, datetime.fromisoformat(value).timestamp() - time.time())
+    except ValueError:
+        return None
+
+
+@dataclass
+class KeyState:
+    """Headroom and usage of one key."""
+
+    key: str
+    requests: int = 0
+    throttled: int = 0
+    rejected: int = 0
+    in_flight: int = 0
+    requests_remaining: int | None = None
+    requests_limit: int | None = None
+    tokens_remaining: int | None = None
+    tokens_limit: int | None = None
+    available_at: float = 0.0  # monotonic time the key re-enters rotation
+    last_used: float = 0.0
+
+    @property
+    def label(self) -> str:
+        """Safe identifier for logs (never the full key)."""
+        return f"...{self.key[-4:]}"
+
+    @property
+    def headroom(self) -> float:
+        """Fraction of the tightest limit still available (1.0 if unknown)."""
+        fractions = [
+            remaining / limit
+            for remaining, limit in (
+                (self.requests_remaining, self.requests_limit),
+                (self.tokens_remaining, self.tokens_limit),
+            )
+            if remaining is not None and limit
+        ]
+        return min(fractions, default=1.0)
+
+    def cool_down(self, seconds: float) -> None:
+        self.available_at = max(self.available_at, time.monotonic() + seconds)
+
+
+class KeyPool:
+    """Spreads one provider's requests across several API keys."""
+
+    def __init__(
+        self,
+        provider: str,
+        keys: list[str],
+        throttle_cooldown: float = 30.0,
+        revoked_cooldown: float = 300.0,
+    ):
+        if not keys:
+            raise ValueError(f"No API keys for {provider}")
+        self.provider = provider
+        self.keys = [KeyState(key) for key in keys]
+        self.throttle_cooldown = throttle_cooldown
+        self.revoked_cooldown = revoked_cooldown
+        self._by_key = {state.key: state for state in self.keys}
+        self._cache_owners: dict[str, KeyState] = {}  # Gemini cache name -> creating key
+        self._header, self._template = AUTH_HEADERS.get(provider, ("authorization", "Bearer {key}"))
+        self._rate_headers = RATE_LIMIT_HEADERS.get(provider, {})
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def choose(self) -> KeyState:
+        """The available key with the most headroom (least busy on ties).
+
+        When every key is sitting out, the one that comes back first is
+        used; the retry layer deals with a rejection.
+        """
+        now = time.monotonic()
+        available = [k for k in self.keys if k.available_at <= now]
+        if not available:
+            return min(self.keys, key=lambda k: k.available_at)
+        return max(available, key=lambda k: (k.headroom, -k.in_flight, -k.last_used))
+
+    def _key_of(self, request: httpx.Request) -> KeyState | None:
+        """The pooled key a request was built with, if any."""
+        value = request.headers.get(self._header)
+        if value is None:
+            return None
+        prefix, _, suffix = self._template.partition("{key}")
+        key = value.removeprefix(prefix).removesuffix(suffix)
+        return self._by_key.get(key)
+
+    def acquire(self, request: httpx.Request) -> KeyState | None:
+        """Route ``request`` to the best key; release() it once it is done."""
+        if self._key_of(request) is None:
+            return None  # Not one of ours (e.g. a model configured with another key)
+        cache = _cache_of(request)
+        if any(part in request.url.path for part in PINNED_PATHS):
+            state = self.keys[0]
+        elif cache is not None and cache in self._cache_owners:
+            state = self._cache_owners[cache]
+        else:
+            state = self.choose()
+        request.headers[self._header] = self._template.format(key=state.key)
+        state.requests += 1
+        state.in_flight += 1
+        state.last_used = time.monotonic()
+        request.extensions[_EXTENSION] = state
+        return state
+
+    def release(self, state: KeyState) -> None:
+        state.in_flight -= 1
+
+    def remember_cache(self, name: str, state: KeyState) -> None:
+        """Route later requests for the Gemini cache ``name`` to ``state``."""
+        self._cache_owners[name] = state
+
+    def forget_cache(self, name: str) -> None:
+        self._cache_owners.pop(name, None)
+
+    def record(self, state: KeyState, request: httpx.Request, response: httpx.Response) -> None:
+        """Record headroom and bench failing keys."""
+        headers = response.headers
+        for attr in ("requests_remaining", "requests_limit", "tokens_remaining", "tokens_limit"):
+            value = headers.get(self._rate_headers.get(attr, ""))
+            if value is not None and value.isdigit():
+                setattr(state, attr, int(value))
+
+        if response.status_code == 429:
+            state.throttled += 1
+            state.cool_down(self._wait_hint(headers) or self.throttle_cooldown)
+        elif response.status_code == 403 and _cache_of(request) is not None:
+            pass  # The cache is gone or not this project's; the key is fine
+        elif response.status_code in (401, 403):
+            state.rejected += 1
+            state.cool_down(self.revoked_cooldown)
+        elif state.requests_remaining == 0:
+            state.cool_down(self._wait_hint(headers) or self.throttle_cooldown)
+
+    def _wait_hint(self, headers: httpx.Headers) -> float | None:
+        if "retry-after" in headers:
+            try:
+                return float(headers["retry-after"])
+            except ValueError:
+                pass
+        reset = headers.get(self._rate_headers.get("reset", ""))
+        return parse_reset(reset) if reset else None
+
+    def install(self, client: httpx.AsyncClient) -> None:
+        """Route a provider's shared client through the pool (idempotent)."""
+        # httpx has no public way to wrap an existing client's transports
+        # (the default one and any proxy mounts).
+        if not isinstance(client._transport, _PooledTransport):
+            client._transport = _PooledTransport(client._transport, self)
+        for pattern, transport in client._mounts.items():
+            if transport is not None and not isinstance(transport, _PooledTransport):
+                client._mounts[pattern] = _PooledTransport(transport, self)
+
+    def summary(self) -> str:
+        """One line per key for the end of a run."""
+        now = time.monotonic()
+        lines = []
+        for state in self.keys:
+            benched = state.available_at - now
+            status = f", out of rotation for {benched:.0f}s" if benched > 0 else ""
+            lines.append(
+                f"  {self.provider} {state.label}: {state.requests} requests, "
+                f"{state.throttled} throttled, {state.rejected} rejected, "
+                f"{state.headroom:.0%} headroom{status}"
+            )
+        return "\n".join(lines)
+
+
+def _cache_of(request: httpx.Request) -> str | None:
+    """The Gemini cache a request reads, deletes or updates, if any."""
+    path = request.url.path
+    start = path.find(_CACHE_PATH + "/")
+    if start >= 0:
+        return path[start + 1 :]
+    if request.method != "POST":
+        return None
+    try:
+        body = request.content
+    except httpx.RequestNotRead:
+        return None
+    match = _CACHE_REFERENCE.search(body)
+    return match.group(1).decode() if match else None
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """A response body that calls ``release`` once it is closed."""
+
+    def __init__(self, inner: httpx.AsyncByteStream, release: Callable[[], None]):
+        self.inner = inner
+        self._release: Callable[[], None] | None = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self.inner:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self.inner.aclose()
+        finally:
+            if self._release is not None:
+                self._release()
+                self._release = None
+
+
+class _PooledTransport(httpx.AsyncBaseTransport):
+    """Sends each request with a key from ``pool`` and releases it afterwards."""
+
+    def __init__(self, inner: httpx.AsyncBaseTransport, pool: KeyPool):
+        self.inner = inner
+        self.pool = pool
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        state = self.pool.acquire(request)
+        if state is None:
+            return await self.inner.handle_async_request(request)
+        try:
+            response = await self.inner.handle_async_request(request)
+            self.pool.record(state, request, response)
+            if response.is_success and request.url.path.endswith(_CACHE_PATH):
+                # A new cache: find its name so its users get the same key.
+                match = _CACHE_NAME.search(await response.aread())
+                if match:
+                    self.pool.remember_cache(match.group(1).decode(), state)
+            elif response.is_success and request.method == "DELETE":
+                cache = _cache_of(request)
+                if cache is not None:
+                    self.pool.forget_cache(cache)
+        except BaseException:
+            self.pool.release(state)
+            raise
+        if response.is_closed:  # Body already read above
+            self.pool.release(state)
+            return response
+        # Streamed responses hold the key until the body is closed.
+        assert isinstance(response.stream, httpx.AsyncByteStream)
+        response.stream = _ReleasingStream(response.stream, lambda: self.pool.release(state))
+        return response
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+
+_pools: dict[str, KeyPool] = {}
+
+
+def get_key_pool(provider: str, env: str) -> KeyPool | None:
+    """The shared pool for a provider, or None when it has a single key."""
+    pool = _pools.get(provider)
+    if pool is None:
+        keys = keys_from_env(env)
+        if len(keys) < 2:
+            return None
+        pool = KeyPool(provider, keys)
+        _pools[provider] = pool
+    return pool
+
+
+def key_pools() -> dict[str, KeyPool]:
+    """Every pool created so far."""
+    return dict(_pools)
+
+
+def format_key_pool_summary() -> str:
+    """Per-key usage across all pools ("" when no pools are in use)."""
+    return "\n".join(pool.summary() for pool in _pools.values())
@@ -0,0 +1,283 @@
+"""Deterministic in-process model for offline and load testing.
+
+MockModel satisfies DebateModel without any network access. Speeches are
+synthetic text sized to the phase's word limit, judge calls return JSON that
+parse_judge_response accepts, and latency follows a configurable
+distribution. A reasoning budget adds hidden thinking tokens, generated at
+``tokens_per_second`` before the first visible token. Requests marked for
+prompt caching report the prefix they share with earlier marked requests as
+cache reads, like a provider prefix cache would (priced at Anthropic's
+rates). Faults (429s, timeouts, malformed judge output, speeches that
+overrun their word limit or loop) can be injected at fixed rates to exercise
+the resilience and rate-limit layers and the engine's output guard.
+
+Content depends only on the request, so repeated runs produce the same
+debates; latency and faults are drawn from a per-model seeded sequence.
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+import re
+import time
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Literal
+
+import httpx
+
+from ai_debate.models.base import Message, ModelResponse, Reasoning, StreamChunk, Usage
+
+CHARS_PER_TOKEN = 4
+TOKENS_PER_WORD = 1.3
+THINKING_SHARE = 0.6  # Share of the reasoning budget a mock call spends thinking
+CACHE_READ_PRICE = 0.1  # Relative to uncached input, as Anthropic prices them
+CACHE_WRITE_PRICE = 1.25
+
+_WORD_LIMIT = re.compile(r"Stay within (\d+) words")
+
+_VOCABULARY = (
+    "the resolution value criterion contention evidence because therefore however "
+    "my opponent argues that this framework fails since justice liberty welfare "
+    "society outcomes first second third impact weighs outweighs clearly demonstrates "
+    "consider example policy harms benefits rights duty principle question answer"
+).split()
+
+_CATEGORIES = ("argumentation", "evidence", "clash", "rebuttal", "persuasiveness")
+
+
+class MockAPIError(Exception):
+    """Injected provider error shaped like the SDK status errors.
+
+    Exposes ``status_code`` and a ``response`` with headers so the error
+    classification and Retry-After handling treat it like the real thing.
+    """
+
+    def __init__(self, status_code: int, message: str, retry_after: float | None = None):
+        super().__init__(message)
+        self.status_code = status_code
+        headers = {"retry-after": str(retry_after)} if retry_after is not None else {}
+        self.response = httpx.Response(status_code, headers=headers)
+
+
+@dataclass
+class LatencyProfile:
+    """Distribution of the time to first token.
+
+    - ``fixed``: always ``seconds``.
+    - ``lognormal``: median ``seconds`` with shape ``sigma``.
+    - ``replay``: cycle through recorded ``samples``.
+    """
+
+    kind: Literal["fixed", "lognormal", "replay"] = "lognormal"
+    seconds: float = 0.2
+    sigma: float = 0.5
+    samples: list[float] = field(default_factory=list)
+
+    @classmethod
+    def from_file(cls, path: Path | str) -> "LatencyProfile":
+        """Load recorded latencies (a JSON list, or one number per line)."""
+        text = Path(path).read_text().strip()
+        if text.startswith("["):
+            samples = [float(x) for x in json.loads(text)]
+        else:
+            samples = [float(line) for line in text.splitlines() if line.strip()]
+        if not samples:
+            raise ValueError(f"No latency samples in {path}")
+        return cls(kind="replay", samples=samples)
+
+    def sample(self, rng: random.Random, index: int) -> float:
+        """Latency for the ``index``-th call."""
+        if self.kind == "fixed":
+            return self.seconds
+        if self.kind == "replay":
+            return self.samples[index % len(self.samples)]
+        return rng.lognormvariate(0.0, self.sigma) * self.seconds
+
+
+@dataclass
+class MockModel:
+    """Synthetic DebateModel with configurable latency, throughput and faults."""
+
+    model_id: str = "mock-1"
+    name: str = "Mock 1"
+    provider: str = "Mock"
+    temperature: float = 0.7
+    latency: LatencyProfile = field(default_factory=LatencyProfile)
+    tokens_per_second: float = 500.0
+    malformed_rate: float = 0.0  # Share of judge responses that are not valid JSON
+    overrun_rate: float = 0.0  # Share of speeches that ignore the word limit
+    loop_rate: float = 0.0  # Share of speeches that repeat one sentence over and over
+    rate_limit_rate: float = 0.0  # Share of calls failing with a 429
+    timeout_rate: float = 0.0  # Share of calls that hang, then time out
+    hang_seconds: float = 30.0  # How long an injected timeout hangs (capped by the call's timeout)
+    seed: int | str | None = None
+    # Accepted so the registry can build mocks like any other adapter.
+    api_key_env: str = ""
+    max_retries: int = 0
+    http_client: Any = field(default=None, repr=False)
+    calls: int = field(default=0, init=False)
+    _prefixes: set[str] = field(default_factory=set, init=False, repr=False)
+    _rng: random.Random = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._rng = random.Random(self.seed if self.seed is not None else self.model_id)
+
+    def _content(self, system_prompt: str, messages: list[Message], max_tokens: int) -> str:
+        """Deterministic speech or judge decision for this request."""
+        rng = random.Random(
+            "\x00".join([self.model_id, system_prompt, *(m.content for m in messages)])
+        )
+        if "debater_a_scores" in system_prompt:
+            return self._judge_json(rng)
+        match = _WORD_LIMIT.search(messages[-1].content if messages else "")
+        match = match or _WORD_LIMIT.search(system_prompt)
+        limit = int(match.group(1)) if match else max(1, int(max_tokens / TOKENS_PER_WORD))
+        ceiling = int(max_tokens / TOKENS_PER_WORD)
+        # Draw only when enabled, so content is unchanged at the default rates.
+        if self.overrun_rate and rng.random() < self.overrun_rate:
+            limit = ceiling
+        limit = min(limit, ceiling)
+        words = max(1, int(limit * rng.uniform(0.8, 1.0)))
+        if self.loop_rate and rng.random() < self.loop_rate:
+            sentence = " ".join(rng.choice(_VOCABULARY) for _ in range(12))
+            text = ". ".join([sentence] * max(1, words // 12))
+        else:
+            text = " ".join(rng.choice(_VOCABULARY) for _ in range(words))
+        return text[0].upper() + text[1:] + "."
+
+    def _judge_json(self, rng: random.Random) -> str:
+        scores = {
+            side: {cat: rng.randint(4, 9) for cat in _CATEGORIES}
+            for side in ("debater_a_scores", "debater_b_scores")
+        }
+        total_a = sum(scores["debater_a_scores"].values())
+        total_b = sum(scores["debater_b_scores"].values())
+        decision = {
+            **scores,
+            "winner": "A" if total_a >= total_b else "B",
+            "reasoning": "Synthetic decision from the mock judge.",
+        }
+        raw = json.dumps(decision, indent=2)
+        if rng.random() < self.malformed_rate:
+            return raw[: len(raw) // 2]
+        return raw
+
+    async def _fault(self, timeout: float | None) -> None:
+        """Raise an injected 429 or timeout for this call, if one is drawn."""
+        roll = self._rng.random()
+        if roll < self.rate_limit_rate:
+            raise MockAPIError(429, f"{self.name}: rate limited (mock)", retry_after=1.0)
+        if roll < self.rate_limit_rate + self.timeout_rate:
+            hang = self.hang_seconds if timeout is None else min(timeout, self.hang_seconds)
+            await asyncio.sleep(hang)
+            raise TimeoutError(f"{self.name}: request timed out (mock)")
+
+    def _response(
+        self,
+        system_prompt: str,
+        messages: list[Message],
+        content: str,
+        index: int,
+        reasoning: Reasoning | None,
+    ) -> ModelResponse:
+        chars = len(system_prompt) + sum(len(m.content) for m in messages)
+        thinking = round(reasoning.tokens * THINKING_SHARE) if reasoning else 0
+        cache_read, cache_write = self._prompt_cache(system_prompt, messages)
+        input_tokens = max(1, chars // CHARS_PER_TOKEN)
+        uncached = max(0, input_tokens - cache_read - cache_write)
+        return ModelResponse(
+            content=content,
+            model=self.model_id,
+            input_tokens=input_tokens,
+            output_tokens=max(1, round(len(content.split()) * TOKENS_PER_WORD)) + thinking,
+            metadata={"finish_reason": "stop", "mock": True},
+            usage=Usage(
+                cache_read_input_tokens=cache_read,
+                cache_creation_input_tokens=cache_write,
+                reasoning_tokens=thinking,
+                billed_input_tokens=(
+                    uncached + cache_read * CACHE_READ_PRICE + cache_write * CACHE_WRITE_PRICE
+                ),
+                request_id=f"{self.model_id}-{index}",
+            ),
+        )
+
+    def _prompt_cache(self, system_prompt: str, messages: list[Message]) -> tuple[int, int]:
+        """(read, written) tokens of a simulated prefix cache for this request.
+
+        The prefix up to the last message marked ``cache_control`` is
+        written; any part of it already written by an earlier request is a
+        read instead.
+        """
+        marked = [i for i, m in enumerate(messages) if m.cache_control]
+        if not marked:
+            return 0, 0
+        digest = hashlib.sha256(system_prompt.encode())
+        chars = len(system_prompt)
+        cached = 0
+        for msg in messages[: marked[-1] + 1]:
+            digest.update(f"\x00{msg.role.value}\x00{msg.content}".encode())
+            chars += len(msg.content)
+            key = digest.hexdigest()
+            if key in self._prefixes:
+                cached = chars
+            self._prefixes.add(key)
+        return cached // CHARS_PER_TOKEN, (chars - cached) // CHARS_PER_TOKEN
+
+    async def _wait(self, seconds: float, timeout: float | None) -> None:
+        """Sleep, but fail like an SDK would if the call outlives ``timeout``."""
+        if timeout is not None and seconds > timeout:
+            await asyncio.sleep(timeout)
+            raise TimeoutError(f"{self.name}: request timed out (mock)")
+        await asyncio.sleep(seconds)
+
+    async def generate(
+        self,
+        system_prompt: str,
+        messages: list[Message],
+        max_tokens: int = 4096,
+        timeout: float | None = None,
+        reasoning: Reasoning | None = None,
+    ) -> ModelResponse:
+        index = self.calls
+        self.calls += 1
+        started = time.monotonic()
+        await self._fault(timeout)
+        content = self._content(system_prompt, messages, max_tokens)
+        response = self._response(system_prompt, messages, content, index, reasoning)
+        ttft = self.latency.sample(self._rng, index)
+        await self._wait(ttft + response.output_tokens / self.tokens_per_second, timeout)
+        response.usage.latency_seconds = time.monotonic() - started
+        return response
+
+    async def generate_stream(
+        self,
+        system_prompt: str,
+        messages: list[Message],
+        max_tokens: int = 4096,
+        timeout: float | None = None,
+        reasoning: Reasoning | None = None,
+    ) -> AsyncGenerator[StreamChunk, None]:
+        index = self.calls
+        self.calls += 1
+        started = time.monotonic()
+        await self._fault(timeout)
+        content = self._content(system_prompt, messages, max_tokens)
+        response = self._response(system_prompt, messages, content, index, reasoning)
+        thinking = response.usage.reasoning_tokens / self.tokens_per_second
+        await self._wait(self.latency.sample(self._rng, index) + thinking, timeout)
+        response.usage.ttft_seconds = time.monotonic() - started
+
+        # Emit ~20-word deltas paced at tokens_per_second.
+        words = content.split(" ")
+        for start in range(0, len(words), 20):
+            delta = " ".join(words[start : start + 20])
+            if start:
+                delta = " " + delta
+            yield StreamChunk(text=delta)
+            await asyncio.sleep(len(delta.split()) * TOKENS_PER_WORD / self.tokens_per_second)
+        response.usage.latency_seconds = time.monotonic() - started
+        yield StreamChunk(response=response)
@@ -1,82 +1,42 @@
 """OpenAI (GPT) model adapter."""
 
-import os
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from typing import Any
 
 import openai
 
-from ai_debate.models.base import Message, ModelResponse, Role
+from ai_debate.models.base import Message, ModelResponse, Reasoning
+from ai_debate.models.openai_compat import Dialect, OpenAICompatibleModel
 
 
 @dataclass
-class OpenAIModel:
+class OpenAIModel(OpenAICompatibleModel):
     """Adapter for OpenAI GPT models."""
 
     model_id: str = "gpt-5.2"
     name: str = "GPT-5.2"
     provider: str = "OpenAI"
-    temperature: float = 0.7
-    _client: openai.AsyncOpenAI = field(init=False, repr=False)
+    api_key_env: str = "OPENAI_API_KEY"
+    dialect: Dialect | str = "openai"
 
-    def __post_init__(self) -> None:
-        api_key = os.environ.get("OPENAI_API_KEY")
-        if not api_key:
-            raise ValueError("OPENAI_API_KEY environment variable not set")
-        self._client = openai.AsyncOpenAI(api_key=api_key)
+    @property
+    def batch_client(self) -> openai.AsyncOpenAI:
+        """The client batch files and jobs are created with (see BatchCapable)."""
+        return self._client
 
-    async def generate(
+    def batch_params(
         self,
         system_prompt: str,
         messages: list[Message],
-        max_tokens: int = 4096,
-    ) -> ModelResponse:
-        """Generate a response using GPT.
-
-        Args:
-            system_prompt: System instructions for GPT.
-            messages: Conversation history.
-            max_tokens: Maximum tokens to generate.
-
-        Returns:
-            ModelResponse with generated content and usage stats.
-        """
-        # Build messages list with system prompt first
-        openai_messages: list[dict[str, str]] = [
-            {"role": "system", "content": system_prompt}
-        ]
-
-        # Add conversation messages
-        for msg in messages:
-            openai_messages.append({
-                "role": self._convert_role(msg.role),
-                "content": msg.content,
-            })
-
-        response = await self._client.chat.completions.create(
-            model=self.model_id,
-            messages=openai_messages,
-            max_completion_tokens=max_tokens,
-            temperature=self.temperature,
-        )
-
-        # Extract content from response
-        content = response.choices[0].message.content or ""
-
-        # Get usage stats
-        usage = response.usage
-        input_tokens = usage.prompt_tokens if usage else 0
-        output_tokens = usage.completion_tokens if usage else 0
-
-        return ModelResponse(
-            content=content,
-            model=response.model,
-            input_tokens=input_tokens,
-            output_tokens=output_tokens,
-            metadata={
-                "finish_reason": response.choices[0].finish_reason,
-            },
-        )
-
-    def _convert_role(self, role: Role) -> str:
-        """Convert Role enum to OpenAI role string."""
-        return role.value  # OpenAI uses same role names
+        max_tokens: int,
+        reasoning: Reasoning | None = None,
+    ) -> dict[str, Any]:
+        """The body of one Batch API line for ``/v1/chat/completions``."""
+        body = self._request_params(system_prompt, messages, max_tokens, reasoning=reasoning)
+        # The SDK merges extra_body into the request; a batch line is the raw body.
+        body.update(body.pop("extra_body", {}))
+        return body
+
+    def batch_response(self, result: openai.types.chat.ChatCompletion) -> ModelResponse:
+        """Convert a completed batch line's ChatCompletion into a ModelResponse."""
+        return self._to_response(result)
@@ -0,0 +1,272 @@
+"""Adapter for any endpoint that speaks the OpenAI Chat Completions API.
+
+OpenAI, xAI and local inference servers (llama.cpp, vLLM, ...) share one
+wire format but disagree on details such as the name of the max-tokens
+parameter or whether streamed usage is reported. Those differences live in
+a Dialect so one adapter can serve every endpoint.
+"""
+
+import hashlib
+import time
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+import openai
+
+from ai_debate.models.base import Message, ModelResponse, Reasoning, Role, StreamChunk, Usage
+from ai_debate.models.keypool import primary_key
+
+CHARS_PER_TOKEN = 4
+LOCAL_API_KEY = "not-needed"  # Local servers ignore the key but the SDK requires one
+
+
+@dataclass(frozen=True)
+class Dialect:
+    """Per-endpoint differences in the Chat Completions request."""
+
+    name: str
+    max_tokens_param: str = "max_completion_tokens"
+    stream_usage: bool = True  # Supports stream_options.include_usage
+    send_temperature: bool = True
+    reasoning_effort: bool = False  # Accepts the reasoning_effort parameter
+    prompt_cache_key: bool = False  # Accepts prompt_cache_key (prefix caching is automatic)
+    extra_body: dict[str, Any] = field(default_factory=dict)
+
+
+DIALECTS: dict[str, Dialect] = {
+    "openai": Dialect("openai", reasoning_effort=True, prompt_cache_key=True),
+    "xai": Dialect("xai", max_tokens_param="max_tokens"),
+    "vllm": Dialect("vllm", max_tokens_param="max_tokens"),
+    "llama.cpp": Dialect("llama.cpp", max_tokens_param="max_tokens", stream_usage=False),
+}
+
+
+def get_dialect(dialect: "Dialect | str") -> Dialect:
+    """Resolve a dialect name (case-insensitive) or pass a Dialect through."""
+    if isinstance(dialect, Dialect):
+        return dialect
+    try:
+        return DIALECTS[dialect.lower()]
+    except KeyError:
+        raise ValueError(
+            f"Unknown dialect {dialect!r}. Available: {', '.join(DIALECTS)}"
+        ) from None
+
+
+def _estimate_tokens(text: str) -> int:
+    return max(1, len(text) // CHARS_PER_TOKEN) if text else 0
+
+
+def _usage_details(usage: Any) -> Usage:
+    """Cached and reasoning token counts from a CompletionUsage, if reported."""
+    prompt = getattr(usage, "prompt_tokens_details", None)
+    completion = getattr(usage, "completion_tokens_details", None)
+    return Usage(
+        cache_read_input_tokens=(getattr(prompt, "cached_tokens", None) or 0),
+        reasoning_tokens=(getattr(completion, "reasoning_tokens", None) or 0),
+    )
+
+
+@dataclass
+class OpenAICompatibleModel:
+    """Adapter for OpenAI-compatible Chat Completions endpoints.
+
+    ``base_url`` selects the endpoint (None means api.openai.com) and
+    ``dialect`` the request details. An empty ``api_key_env`` is allowed for
+    local servers that do not check keys.
+    """
+
+    model_id: str = "local-model"
+    name: str = "Local model"
+    provider: str = "Local"
+    temperature: float = 0.7
+    base_url: str | None = None
+    api_key_env: str = ""
+    dialect: Dialect | str = "openai"
+    max_retries: int = 2
+    http_client: httpx.AsyncClient | None = field(default=None, repr=False)
+    _client: openai.AsyncOpenAI = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.dialect = get_dialect(self.dialect)
+        if self.api_key_env:
+            api_key = primary_key(self.api_key_env)
+            if not api_key:
+                raise ValueError(f"{self.api_key_env} environment variable not set")
+        else:
+            api_key = LOCAL_API_KEY
+        self._client = openai.AsyncOpenAI(
+            api_key=api_key,
+            base_url=self.base_url,
+            max_retries=self.max_retries,
+            http_client=self.http_client,
+        )
+
+    def _request_params(
+        self,
+        system_prompt: str,
+        messages: list[Message],
+        max_tokens: int,
+        timeout: float | None = None,
+        reasoning: Reasoning | None = None,
+    ) -> dict[str, Any]:
+        """Build the Chat Completions request shared by generate and generate_stream."""
+        assert isinstance(self.dialect, Dialect)
+        # Build messages list with system prompt first
+        chat_messages: list[dict[str, str]] = [
+            {"role": "system", "content": system_prompt}
+        ]
+
+        # Add conversation messages
+        for msg in messages:
+            chat_messages.append({
+                "role": self._convert_role(msg.role),
+                "content": msg.content,
+            })
+
+        params: dict[str, Any] = {
+            "model": self.model_id,
+            "messages": chat_messages,
+            self.dialect.max_tokens_param: max_tokens,
+        }
+        if self.dialect.send_temperature:
+            params["temperature"] = self.temperature
+        # Endpoints without the parameter (xAI, local servers) reason at
+        # their own fixed level.
+        if reasoning is not None and self.dialect.reasoning_effort:
+            params["reasoning_effort"] = reasoning.level.value
+        # Prefix caching needs no markers, but requests that share a prefix
+        # only hit the cache if they reach the same server; the key (one per
+        # system prompt, i.e. per debater and debate) routes them together.
+        if self.dialect.prompt_cache_key and any(m.cache_control for m in messages):
+            digest = hashlib.sha256(system_prompt.encode()).hexdigest()[:32]
+            params["prompt_cache_key"] = f"ai-debate-{digest}"
+        if self.dialect.extra_body:
+            params["extra_body"] = dict(self.dialect.extra_body)
+        # timeout=None would disable the SDK timeout entirely, so only pass
+        # it when the caller has a budget.
+        if timeout is not None:
+            params["timeout"] = timeout
+        return params
+
+    async def generate(
+        self,
+        system_prompt: str,
+        messages: list[Message],
+        max_tokens: int = 4096,
+        timeout: float | None = None,
+        reasoning: Reasoning | None = None,
+    ) -> ModelResponse:
+        """Generate a response from the endpoint.
+
+        Args:
+            system_prompt: System instructions for the model.
+            messages: Conversation history.
+            max_tokens: Maximum tokens to generate.
+            timeout: Request timeout in seconds (SDK default if None).
+            reasoning: Sent as ``reasoning_effort`` where the dialect
+                supports it; a token budget maps to the nearest level.
+
+        Returns:
+            ModelResponse with generated content and usage stats.
+        """
+        started = time.monotonic()
+        response = await self._client.chat.completions.create(
+            **self._request_params(system_prompt, messages, max_tokens, timeout, reasoning)
+        )
+        result = self._to_response(response)
+        result.usage.latency_seconds = time.monotonic() - started
+        return result
+
+    def _to_response(self, response: Any) -> ModelResponse:
+        """Convert a ChatCompletion into a ModelResponse."""
+        # Extract content from response
+        content = response.choices[0].message.content or ""
+
+        # Get usage stats
+        usage = response.usage
+        input_tokens = usage.prompt_tokens if usage else 0
+        output_tokens = usage.completion_tokens if usage else _estimate_tokens(content)
+
+        details = _usage_details(usage)
+        details.request_id = getattr(response, "_request_id", None) or response.id
+        return ModelResponse(
+            content=content,
+            model=response.model or self.model_id,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            metadata={
+                "finish_reason": response.choices[0].finish_reason,
+            },
+            usage=details,
+        )
+
+    async def generate_stream(
+        self,
+        system_prompt: str,
+        messages: list[Message],
+        max_tokens: int = 4096,
+        timeout: float | None = None,
+        reasoning: Reasoning | None = None,
+    ) -> AsyncGenerator[StreamChunk, None]:
+        """Stream a response with ``stream=True``.
+
+        When the dialect supports ``stream_options.include_usage``, usage
+        arrives in a trailing chunk with no choices. Otherwise output tokens
+        are estimated from the text and input tokens are reported as 0.
+
+        Yields:
+            Text deltas, then a final chunk with the complete ModelResponse.
+        """
+        assert isinstance(self.dialect, Dialect)
+        params = self._request_params(system_prompt, messages, max_tokens, timeout, reasoning)
+        if self.dialect.stream_usage:
+            params["stream_options"] = {"include_usage": True}
+        started = time.monotonic()
+        stream = await self._client.chat.completions.create(**params, stream=True)
+        http_response = getattr(stream, "response", None)
+        request_id = http_response.headers.get("x-request-id") if http_response else None
+
+        parts: list[str] = []
+        model = self.model_id
+        finish_reason = None
+        usage = None
+        ttft = None
+        try:
+            async for chunk in stream:
+                model = chunk.model or model
+                request_id = request_id or chunk.id
+                usage = chunk.usage or usage
+                if not chunk.choices:
+                    continue
+                choice = chunk.choices[0]
+                finish_reason = choice.finish_reason or finish_reason
+                if choice.delta.content:
+                    if ttft is None:
+                        ttft = time.monotonic() - started
+                    parts.append(choice.delta.content)
+                    yield StreamChunk(text=choice.delta.content)
+        finally:
+            await stream.close()  # Release the connection if the caller stops early
+
+        content = "".join(parts)
+        details = _usage_details(usage)
+        details.request_id = request_id
+        details.ttft_seconds = ttft
+        details.latency_seconds = time.monotonic() - started
+        yield StreamChunk(
+            response=ModelResponse(
+                content=content,
+                model=model,
+                input_tokens=usage.prompt_tokens if usage else 0,
+                output_tokens=usage.completion_tokens if usage else _estimate_tokens(content),
+                metadata={"finish_reason": finish_reason},
+                usage=details,
+            )
+        )
+
+    def _convert_role(self, role: Role) -> str:
+        """Convert Role enum to OpenAI role string."""
+        return role.value  # OpenAI uses same role names
@@ -0,0 +1,257 @@
+"""Measured latency and throughput per model, from a preflight probe.
+
+probe_model() sends a few streamed requests with representative prompt
+sizes (an opening speech, a late rebuttal, a judge call) and records the
+time to first token, output speed and the rate-limit headers the provider
+returns. A ModelProfile fits TTFT as a linear function of prompt size, so
+the time of a call of any size can be estimated from it.
+
+Profiles are saved as JSON keyed by model ID (see save_profiles), so a
+preflight run on one day can inform the schedule of the next.
+"""
+
+import json
+import statistics
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from ai_debate.models.base import DebateModel, Message, Role
+from ai_debate.models.http import PROVIDER_BASE_URLS
+from ai_debate.models.keypool import RATE_LIMIT_HEADERS
+from ai_debate.models.wrapper import unwrap_model
+
+PROFILE_PATH = Path(".cache") / "model_profiles.json"
+
+# Prompt sizes probed: an opening speech, a late rebuttal, a judge call.
+PROBE_INPUT_TOKENS = (500, 4000, 12000)
+PROBE_OUTPUT_TOKENS = 300
+WORDS_PER_TOKEN = 0.75
+
+_PROBE_SYSTEM_PROMPT = "You are helping measure response latency. Reply in plain prose."
+_FILLER = (
+    "The affirmative argues that the policy protects individual liberty while the "
+    "negative answers that collective welfare outweighs it, and both sides dispute "
+    "which evidence should weigh most heavily in the final decision. "
+).split()
+
+
+@dataclass
+class ProbeResult:
+    """One timed request of a preflight probe."""
+
+    input_tokens: int
+    output_tokens: int = 0
+    ttft_seconds: float | None = None
+    latency_seconds: float | None = None
+    error: str | None = None
+
+    @property
+    def tokens_per_second(self) -> float | None:
+        """Output speed after the first token, if the probe succeeded."""
+        if self.ttft_seconds is None or self.latency_seconds is None or not self.output_tokens:
+            return None
+        generating = self.latency_seconds - self.ttft_seconds
+        return self.output_tokens / generating if generating > 0 else None
+
+
+@dataclass
+class ModelProfile:
+    """Measured performance of one model.
+
+    ``ttft_seconds`` is the fitted time to first token of an empty prompt;
+    each 1,000 input tokens add ``ttft_seconds_per_1k_input``. Rate limits
+    are the per-minute values the provider reported for the probing key.
+    """
+
+    model_id: str
+    name: str
+    provider: str
+    measured_at: str
+    connect_seconds: float | None = None  # DNS, TCP, TLS and one round trip
+    ttft_seconds: float | None = None
+    ttft_seconds_per_1k_input: float = 0.0
+    tokens_per_second: float | None = None
+    requests_limit: int | None = None
+    requests_remaining: int | None = None
+    tokens_limit: int | None = None
+    tokens_remaining: int | None = None
+    probes: list[ProbeResult] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """Whether at least one probe succeeded."""
+        return self.ttft_seconds is not None and self.tokens_per_second is not None
+
+    def ttft(self, input_tokens: int) -> float:
+        """Expected time to first token for a prompt of ``input_tokens``."""
+        return (self.ttft_seconds or 0.0) + self.ttft_seconds_per_1k_input * input_tokens / 1000
+
+    def call_seconds(self, input_tokens: int, output_tokens: int) -> float:
+        """Expected wall time of a whole call."""
+        speed = self.tokens_per_second or 0.0
+        generating = output_tokens / speed if speed > 0 else 0.0
+        return self.ttft(input_tokens) + generating
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ModelProfile":
+        probes = [ProbeResult(**p) for p in data.get("probes", [])]
+        return cls(**{**data, "probes": probes})
+
+
+def probe_prompt(input_tokens: int, output_tokens: int = PROBE_OUTPUT_TOKENS) -> list[Message]:
+    """A user message of roughly ``input_tokens`` asking for ~``output_tokens`` back."""
+    words = max(1, int(input_tokens * WORDS_PER_TOKEN))
+    filler = " ".join(_FILLER[i % len(_FILLER)] for i in range(words))
+    reply_words = int(output_tokens * WORDS_PER_TOKEN)
+    return [Message(
+        role=Role.USER,
+        content=f"{filler}\n\nSummarize the discussion above in about {reply_words} words.",
+    )]
+
+
+async def measure_connect(provider: str, timeout: float = 10.0) -> float | None:
+    """Seconds to open a fresh connection to a provider and get a reply.
+
+    Uses a throwaway client so the shared pool's warm connections do not
+    hide the handshake. None for providers without a known base URL or
+    when the endpoint is unreachable.
+    """
+    base_url = PROVIDER_BASE_URLS.get(provider)
+    if base_url is None:
+        return None
+    async with httpx.AsyncClient(timeout=timeout) as client:
+        started = time.monotonic()
+        try:
+            await client.head(base_url)
+        except httpx.HTTPError:
+            return None
+        return time.monotonic() - started
+
+
+class _HeaderRecorder:
+    """httpx response hook keeping the rate-limit headers of one model's calls."""
+
+    def __init__(self, model_id: str, provider: str):
+        self.model_id = model_id
+        self.names = RATE_LIMIT_HEADERS.get(provider, {})
+        self.values: dict[str, int] = {}
+
+    async def on_response(self, response: httpx.Response) -> None:
+        request = response.request
+        # The client is shared with the provider's other models.
+        if self.model_id not in request.url.path and self.model_id.encode() not in request.content:
+            return
+        for attr, header in self.names.items():
+            value = response.headers.get(header)
+            if value is not None and value.isdigit():
+                self.values[attr] = int(value)
+
+
+async def _probe(
+    model: DebateModel,
+    input_tokens: int,
+    output_tokens: int,
+    timeout: float | None,
+) -> ProbeResult:
+    result = ProbeResult(input_tokens=input_tokens)
+    started = time.monotonic()
+    try:
+        async for chunk in model.generate_stream(
+            system_prompt=_PROBE_SYSTEM_PROMPT,
+            messages=probe_prompt(input_tokens, output_tokens),
+            max_tokens=output_tokens,
+            timeout=timeout,
+        ):
+            if chunk.text and result.ttft_seconds is None:
+                result.ttft_seconds = time.monotonic() - started
+            if chunk.response is not None:
+                result.input_tokens = chunk.response.input_tokens or input_tokens
+                result.output_tokens = chunk.response.output_tokens
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"[:200]
+        return result
+    result.latency_seconds = time.monotonic() - started
+    return result
+
+
+def _fit_ttft(probes: list[ProbeResult]) -> tuple[float | None, float]:
+    """Least-squares intercept and per-1k-token slope of TTFT vs prompt size."""
+    points = [(p.input_tokens / 1000, p.ttft_seconds) for p in probes if p.ttft_seconds is not None]
+    if not points:
+        return None, 0.0
+    xs = [x for x, _ in points]
+    ys = [y for _, y in points]
+    if len(set(xs)) < 2:
+        return statistics.mean(ys), 0.0
+    # Refit the intercept after clamping: TTFT never shrinks with more input.
+    slope = max(0.0, statistics.linear_regression(xs, ys).slope)
+    return max(0.0, statistics.mean(ys) - slope * statistics.mean(xs)), slope
+
+
+async def probe_model(
+    model: DebateModel,
+    input_sizes: tuple[int, ...] = PROBE_INPUT_TOKENS,
+    output_tokens: int = PROBE_OUTPUT_TOKENS,
+    timeout: float | None = 120.0,
+) -> ModelProfile:
+    """Measure a model with one streamed request per prompt size.
+
+    The requests run one after another so they do not compete with each
+    other; probe several models concurrently with asyncio.gather.
+    """
+    profile = ModelProfile(
+        model_id=model.model_id,
+        name=model.name,
+        provider=model.provider,
+        measured_at=datetime.now(UTC).isoformat(),
+    )
+    profile.connect_seconds = await measure_connect(model.provider)
+
+    recorder = _HeaderRecorder(model.model_id, model.provider)
+    client: httpx.AsyncClient | None = getattr(unwrap_model(model), "http_client", None)
+    if client is not None:
+        hooks = client.event_hooks
+        hooks["response"].append(recorder.on_response)
+        client.event_hooks = hooks
+    try:
+        for size in input_sizes:
+            profile.probes.append(await _probe(model, size, output_tokens, timeout))
+    finally:
+        if client is not None:
+            hooks = client.event_hooks
+            hooks["response"].remove(recorder.on_response)
+            client.event_hooks = hooks
+
+    profile.ttft_seconds, profile.ttft_seconds_per_1k_input = _fit_ttft(profile.probes)
+    speeds = [p.tokens_per_second for p in profile.probes if p.tokens_per_second is not None]
+    profile.tokens_per_second = statistics.median(speeds) if speeds else None
+    for attr, value in recorder.values.items():
+        setattr(profile, attr, value)
+    return profile
+
+
+def load_profiles(path: Path | str = PROFILE_PATH) -> dict[str, ModelProfile]:
+    """Saved profiles by model ID ({} if the file does not exist)."""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    data = json.loads(path.read_text())
+    return {model_id: ModelProfile.from_dict(entry) for model_id, entry in data.items()}
+
+
+def save_profiles(profiles: list[ModelProfile], path: Path | str = PROFILE_PATH) -> Path:
+    """Merge ``profiles`` into the profile file, replacing older entries."""
+    path = Path(path)
+    merged = load_profiles(path)
+    merged.update({profile.model_id: profile for profile in profiles})
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(
+        {model_id: asdict(profile) for model_id, profile in merged.items()},
+        indent=2,
+    ))
+    return path
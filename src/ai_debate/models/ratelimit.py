@@ -0,0 +1,368 @@
+"""Provider-level rate limiting with adaptive concurrency.
+
+Each provider gets one ProviderLimiter shared by every model from that
+provider. It combines:
+
+- token buckets for requests per minute and tokens per minute (input tokens
+  are estimated before the call, the real usage is settled afterwards), and
+- an AIMD concurrency controller that halves its limit on a 429 or a latency
+  spike and adds one slot after a run of successful calls.
+
+RateLimitedModel wraps any DebateModel so its calls go through the limiter.
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass
+
+from ai_debate.models.base import DebateModel, Message, ModelResponse, Reasoning, StreamChunk
+from ai_debate.models.deadline import DeadlineExceededError
+from ai_debate.models.wrapper import ModelWrapper
+
+CHARS_PER_TOKEN = 4
+
+
+@dataclass
+class ProviderLimits:
+    """Published (or account-specific) limits for one provider."""
+
+    requests_per_minute: int
+    tokens_per_minute: int
+    initial_concurrency: int = 8
+    max_concurrency: int = 64
+    min_concurrency: int = 1
+
+
+DEFAULT_PROVIDER_LIMITS: dict[str, ProviderLimits] = {
+    "Anthropic": ProviderLimits(requests_per_minute=50, tokens_per_minute=400_000),
+    "OpenAI": ProviderLimits(requests_per_minute=500, tokens_per_minute=500_000),
+    "Google": ProviderLimits(requests_per_minute=150, tokens_per_minute=1_000_000),
+    "xAI": ProviderLimits(requests_per_minute=60, tokens_per_minute=400_000),
+    # Local servers have no published limits; only concurrency matters.
+    "Local": ProviderLimits(
+        requests_per_minute=100_000, tokens_per_minute=100_000_000, initial_concurrency=4
+    ),
+}
+
+
+def estimate_tokens(system_prompt: str, messages: list[Message]) -> int:
+    """Rough input token estimate (~4 characters per token)."""
+    chars = len(system_prompt) + sum(len(m.content) for m in messages)
+    return max(1, chars // CHARS_PER_TOKEN)
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """Whether an SDK exception is an HTTP 429.
+
+    Anthropic and OpenAI errors expose ``status_code``; google-genai
+    errors expose ``code``.
+    """
+    return getattr(exc, "status_code", None) == 429 or getattr(exc, "code", None) == 429
+
+
+class TokenBucket:
+    """Refilling bucket sized to a per-minute budget.
+
+    ``debit`` may drive the level negative, so usage that turns out larger
+    than the estimate delays later callers instead of being forgotten.
+    ``acquire`` reserves its units the same way before it sleeps, so waiters
+    are served in arrival order without holding anything while they wait.
+    """
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.level = float(per_minute)
+        self._rate = per_minute / 60.0
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self._updated) * self._rate)
+        self._updated = now
+
+    async def acquire(self, amount: float) -> None:
+        """Take ``amount`` units, waiting until the bucket has refilled to cover them.
+
+        A caller cancelled while waiting gives its units back.
+        """
+        amount = min(amount, self.capacity)
+        # No await between the refill and the reservation, so no lock is needed.
+        self._refill()
+        self.level -= amount
+        if self.level >= 0:
+            return
+        try:
+            await asyncio.sleep(-self.level / self._rate)
+        except BaseException:
+            self.debit(-amount)
+            raise
+
+    def debit(self, amount: float) -> None:
+        """Take (or with a negative amount, return) units without waiting."""
+        self._refill()
+        self.level = min(self.capacity, self.level - amount)
+
+
+class AIMDController:
+    """Additive-increase / multiplicative-decrease limit on in-flight calls."""
+
+    def __init__(
+        self,
+        initial: int,
+        minimum: int = 1,
+        maximum: int = 64,
+        increase_after: int = 10,
+        decrease_factor: float = 0.5,
+        latency_spike: float = 3.0,
+        warmup_samples: int = 5,
+        decrease_cooldown: float = 2.0,
+    ):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.increase_after = increase_after
+        self.decrease_factor = decrease_factor
+        self.latency_spike = latency_spike
+        self.warmup_samples = warmup_samples
+        self.decrease_cooldown = decrease_cooldown
+        self.in_flight = 0
+        self._successes = 0
+        self._samples = 0
+        self._baseline: float | None = None
+        self._last_decrease = float("-inf")
+        self._condition = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+
+    def _decrease(self) -> None:
+        # One backoff per cooldown window, so a burst of simultaneous 429s
+        # halves the limit once instead of collapsing it to the minimum.
+        now = time.monotonic()
+        self._successes = 0
+        if now - self._last_decrease < self.decrease_cooldown:
+            return
+        self.limit = max(float(self.minimum), self.limit * self.decrease_factor)
+        self._last_decrease = now
+
+    async def release(self, throttled: bool = False, latency: float | None = None) -> None:
+        """Return a slot and adapt the limit.
+
+        Args:
+            throttled: The call was rejected with a 429.
+            latency: Seconds per output token for a successful call; compared
+                against a moving baseline to detect latency spikes.
+        """
+        async with self._condition:
+            self.in_flight -= 1
+            if throttled:
+                self._decrease()
+            elif latency is not None:
+                self._samples += 1
+                spiked = (
+                    self._baseline is not None
+                    and self._samples > self.warmup_samples
+                    and latency > self._baseline * self.latency_spike
+                )
+                if spiked:
+                    self._decrease()
+                else:
+                    self._successes += 1
+                    if self._successes >= self.increase_after:
+                        self.limit = min(float(self.maximum), self.limit + 1)
+                        self._successes = 0
+                self._baseline = (
+                    latency if self._baseline is None else 0.8 * self._baseline + 0.2 * latency
+                )
+            self._condition.notify_all()
+
+
+class ProviderLimiter:
+    """Rate buckets plus adaptive concurrency for a single provider."""
+
+    def __init__(self, provider: str, limits: ProviderLimits):
+        self.provider = provider
+        self.limits = limits
+        self.requests = TokenBucket(limits.requests_per_minute)
+        self.tokens = TokenBucket(limits.tokens_per_minute)
+        self.concurrency = AIMDController(
+            initial=limits.initial_concurrency,
+            minimum=limits.min_concurrency,
+            maximum=limits.max_concurrency,
+        )
+        self.queue_depth = 0
+        self.completed = 0
+        self.throttled = 0
+
+    @property
+    def current_limit(self) -> int:
+        """Current adaptive concurrency limit."""
+        return int(self.concurrency.limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self.concurrency.in_flight
+
+    async def acquire(self, estimated_tokens: int) -> None:
+        """Wait for a concurrency slot and request/token budget.
+
+        Cancelled while waiting (e.g. by a timeout), it gives back everything
+        it already took.
+        """
+        self.queue_depth += 1
+        try:
+            await self.concurrency.acquire()
+            try:
+                await self.requests.acquire(1)
+                try:
+                    await self.tokens.acquire(estimated_tokens)
+                except BaseException:
+                    self.requests.debit(-1)
+                    raise
+            except BaseException:
+                await self.concurrency.release()
+                raise
+        finally:
+            self.queue_depth -= 1
+
+    async def release(
+        self,
+        estimated_tokens: int,
+        response: ModelResponse | None = None,
+        error: BaseException | None = None,
+        elapsed: float = 0.0,
+    ) -> None:
+        """Settle token usage and feed the outcome to the AIMD controller."""
+        if response is not None:
+            self.completed += 1
+            self.tokens.debit(response.total_tokens - estimated_tokens)
+            per_token = elapsed / max(1, response.output_tokens)
+            await self.concurrency.release(latency=per_token)
+        else:
+            throttled = error is not None and is_rate_limit_error(error)
+            if throttled:
+                self.throttled += 1
+            await self.concurrency.release(throttled=throttled)
+
+    def snapshot(self) -> dict[str, int | float]:
+        """Point-in-time view of the limiter for progress output."""
+        return {
+            "queue_depth": self.queue_depth,
+            "in_flight": self.in_flight,
+            "current_limit": self.current_limit,
+            "completed": self.completed,
+            "throttled": self.throttled,
+            "request_budget": round(self.requests.level, 1),
+            "token_budget": round(self.tokens.level),
+        }
+
+
+_limiters: dict[str, ProviderLimiter] = {}
+
+
+def get_provider_limiter(provider: str, limits: ProviderLimits | None = None) -> ProviderLimiter:
+    """Return the shared limiter for a provider, creating it on first use."""
+    limiter = _limiters.get(provider)
+    if limiter is None:
+        limits = limits or DEFAULT_PROVIDER_LIMITS.get(
+            provider, ProviderLimits(requests_per_minute=60, tokens_per_minute=100_000)
+        )
+        limiter = ProviderLimiter(provider, limits)
+        _limiters[provider] = limiter
+    return limiter
+
+
+def limiter_snapshots() -> dict[str, dict[str, int | float]]:
+    """Snapshots of every provider limiter created so far."""
+    return {provider: limiter.snapshot() for provider, limiter in _limiters.items()}
+
+
+class RateLimitedModel(ModelWrapper):
+    """Routes a model's calls through its provider's shared limiter."""
+
+    def __init__(self, inner: DebateModel, limiter: ProviderLimiter | None = None):
+        super().__init__(inner)
+        self.limiter = limiter or get_provider_limiter(inner.provider)
+
+    async def _acquire(self, estimated: int, timeout: float | None) -> float | None:
+        """Wait for the limiter within the call's budget.
+
+        The wait runs in this task under asyncio.timeout(), so a timeout
+        cancels the limiter's acquire, which gives back what it took.
+
+        Returns:
+            The timeout left for the provider call after queueing.
+        """
+        queued = time.monotonic()
+        try:
+            async with asyncio.timeout(timeout):
+                await self.limiter.acquire(estimated)
+        except TimeoutError:
+            raise DeadlineExceededError(f"{self.provider} rate limit queue", timeout) from None
+        if timeout is None:
+            return None
+        return max(0.0, timeout - (time.monotonic() - queued))
+
+    async def generate(
+        self,
+        system_prompt: str,
+        messages: list[Message],
+        max_tokens: int = 4096,
+        timeout: float | None = None,
+        reasoning: Reasoning | None = None,
+    ) -> ModelResponse:
+        estimated = estimate_tokens(system_prompt, messages)
+        queued = time.monotonic()
+        timeout = await self._acquire(estimated, timeout)
+        started = time.monotonic()
+        try:
+            response = await self.inner.generate(
+                system_prompt=system_prompt,
+                messages=messages,
+                max_tokens=max_tokens,
+                timeout=timeout,
+                reasoning=reasoning,
+            )
+        except BaseException as e:
+            await self.limiter.release(estimated, error=e)
+            raise
+        await self.limiter.release(
+            estimated, response=response, elapsed=time.monotonic() - started
+        )
+        response.usage.queue_seconds += started - queued
+        return response
+
+    async def generate_stream(
+        self,
+        system_prompt: str,
+        messages: list[Message],
+        max_tokens: int = 4096,
+        timeout: float | None = None,
+        reasoning: Reasoning | None = None,
+    ) -> AsyncGenerator[StreamChunk, None]:
+        estimated = estimate_tokens(system_prompt, messages)
+        queued = time.monotonic()
+        timeout = await self._acquire(estimated, timeout)
+        started = time.monotonic()
+        response: ModelResponse | None = None
+        try:
+            async for chunk in self.inner.generate_stream(
+                system_prompt=system_prompt,
+                messages=messages,
+                max_tokens=max_tokens,
+                timeout=timeout,
+                reasoning=reasoning,
+            ):
+                if chunk.response is not None:
+                    response = chunk.response
+                    response.usage.queue_seconds += started - queued
+                yield chunk
+        except BaseException as e:
+            await self.limiter.release(estimated, error=e)
+            raise
+        await self.limiter.release(
+            estimated, response=response, elapsed=time.monotonic() - started
+        )
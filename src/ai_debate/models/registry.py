@@ -0,0 +1,320 @@
+"""Process-wide model registry backed by shared provider connection pools.
+
+Scripts ask the registry for a model by short name ("claude", "gpt", ...)
+instead of constructing adapters directly. Each key is built once and every
+adapter for a provider shares one pooled HTTP client.
+
+Adapters are resolved lazily by provider name, so a provider's SDK is only
+imported when one of its models is first built. Third-party packages can
+add providers through the ``ai_debate.adapters`` entry-point group, e.g.::
+
+    [project.entry-points."ai_debate.adapters"]
+    Mistral = "my_package.mistral:MistralModel"
+"""
+
+import asyncio
+import dataclasses
+import importlib
+import os
+import re
+from importlib.metadata import entry_points
+from typing import Any
+
+from ai_debate.models.base import DebateModel, ModelConfig
+from ai_debate.models.cache import CachedModel, ResponseCache
+from ai_debate.models.hedging import HedgedModel
+from ai_debate.models.http import (
+    PoolSettings,
+    close_http_clients,
+    get_http_client,
+    prewarm,
+)
+from ai_debate.models.keypool import get_key_pool
+from ai_debate.models.ratelimit import (
+    DEFAULT_PROVIDER_LIMITS,
+    RateLimitedModel,
+    get_provider_limiter,
+)
+from ai_debate.models.resilience import ResilientModel
+from ai_debate.models.wrapper import ConcurrencyLimitedModel, unwrap_model
+
+ENTRY_POINT_GROUP = "ai_debate.adapters"
+
+# Provider name -> "module:Class" (imported on first use) or the class itself.
+ADAPTERS: dict[str, str | type] = {
+    "Anthropic": "ai_debate.models.anthropic:AnthropicModel",
+    "OpenAI": "ai_debate.models.openai:OpenAIModel",
+    "Google": "ai_debate.models.google:GoogleModel",
+    "xAI": "ai_debate.models.xai:XAIModel",
+    "Local": "ai_debate.models.openai_compat:OpenAICompatibleModel",
+    "Mock": "ai_debate.models.mock:MockModel",
+}
+
+# Providers served in-process, with no HTTP pool to share.
+LOCAL_PROVIDERS = {"Mock"}
+
+_MOCK_KEY = re.compile(r"mock-(\d+)")
+
+BUILTIN_MODELS: dict[str, ModelConfig] = {
+    "claude": ModelConfig(
+        provider="Anthropic",
+        model_id="claude-opus-4-5-20251101",
+        name="Claude Opus 4.5",
+        api_key_env="ANTHROPIC_API_KEY",
+        backup_model_id="claude-sonnet-4-5-20250929",
+    ),
+    "gpt": ModelConfig(
+        provider="OpenAI",
+        model_id="gpt-5.2",
+        name="GPT-5.2",
+        api_key_env="OPENAI_API_KEY",
+        backup_model_id="gpt-5-mini",
+    ),
+    "gemini": ModelConfig(
+        provider="Google",
+        model_id="gemini-3-pro-preview",
+        name="Gemini 3 Pro",
+        api_key_env="GOOGLE_API_KEY",
+        backup_model_id="gemini-2.5-pro",
+    ),
+    "grok": ModelConfig(
+        provider="xAI",
+        model_id="grok-4",
+        name="Grok 4",
+        api_key_env="XAI_API_KEY",
+        backup_model_id="grok-4-fast",
+    ),
+    # Any OpenAI-compatible server on this machine (llama.cpp, vLLM, ...).
+    # See CONFIG_ENV for the variables that override these defaults.
+    "local": ModelConfig(
+        provider="Local",
+        model_id="local-model",
+        name="Local model",
+        api_key_env="",
+        base_url="http://localhost:8080/v1",
+        dialect="llama.cpp",
+        max_retries=1,
+        max_concurrency=4,
+    ),
+}
+
+# Key -> ModelConfig field -> environment variable overriding it. Read when
+# the configuration is looked up, so a .env loaded after import still applies.
+CONFIG_ENV: dict[str, dict[str, str]] = {
+    "local": {
+        "model_id": "LOCAL_MODEL_ID",
+        "base_url": "LOCAL_BASE_URL",
+        "dialect": "LOCAL_DIALECT",
+    },
+}
+
+
+_entry_points_loaded = False
+
+
+def register_adapter(provider: str, adapter: str | type) -> None:
+    """Register an adapter class (or its "module:Class" path) for a provider."""
+    ADAPTERS[provider] = adapter
+
+
+def _load_entry_points() -> None:
+    """Add adapters advertised by installed packages (once, without importing them)."""
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+    _entry_points_loaded = True
+    for ep in entry_points(group=ENTRY_POINT_GROUP):
+        ADAPTERS.setdefault(ep.name, ep.value)
+
+
+def resolve_adapter(provider: str) -> type:
+    """Return the adapter class for a provider, importing it on first use.
+
+    Raises:
+        KeyError: If no built-in or entry-point adapter serves the provider.
+    """
+    if provider not in ADAPTERS:
+        _load_entry_points()
+    adapter = ADAPTERS.get(provider)
+    if adapter is None:
+        raise KeyError(f"No adapter registered for provider {provider!r}")
+    if isinstance(adapter, str):
+        module_name, _, attr = adapter.partition(":")
+        adapter = getattr(importlib.import_module(module_name), attr)
+        ADAPTERS[provider] = adapter
+    return adapter
+
+
+def available_providers() -> list[str]:
+    """Built-in and entry-point providers, without importing any adapter."""
+    _load_entry_points()
+    return list(ADAPTERS)
+
+
+def mock_config(key: str) -> ModelConfig | None:
+    """Configuration for an offline ``mock-N`` key, or None for other keys."""
+    match = _MOCK_KEY.fullmatch(key)
+    if match is None:
+        return None
+    number = match.group(1)
+    return ModelConfig(
+        provider="Mock",
+        model_id=f"mock-{number}",
+        name=f"Mock {number}",
+        api_key_env="",
+        backup_model_id=f"mock-{number}-backup",
+    )
+
+
+class ModelRegistry:
+    """Hands out cached model adapters that share per-provider HTTP pools."""
+
+    def __init__(
+        self,
+        configs: dict[str, ModelConfig] | None = None,
+        pool_settings: PoolSettings | None = None,
+        rate_limit: bool = False,
+        resilient: bool = True,
+        hedge: bool = False,
+        cache: ResponseCache | None = None,
+    ):
+        self.configs = dict(configs if configs is not None else BUILTIN_MODELS)
+        self.pool_settings = pool_settings or PoolSettings()
+        self.rate_limit = rate_limit
+        self.resilient = resilient
+        self.hedge = hedge
+        self.cache = cache
+        self._instances: dict[str, DebateModel] = {}
+
+    def keys(self) -> list[str]:
+        """Registered short names (``mock-N`` keys are also accepted)."""
+        return [key for key in self.configs if not key.endswith(":backup")]
+
+    def __contains__(self, key: str) -> bool:
+        key = key.strip().lower()
+        return key in self.configs or mock_config(key) is not None
+
+    def register(self, key: str, config: ModelConfig) -> None:
+        """Add or replace a model configuration."""
+        self.configs[key] = config
+        self._instances.pop(key, None)
+
+    def config(self, key: str) -> ModelConfig:
+        """Look up the configuration for a short name, with CONFIG_ENV overrides applied."""
+        key = key.strip().lower()
+        if key not in self.configs:
+            config = mock_config(key)
+            if config is not None:
+                return config
+            raise KeyError(f"Unknown model: {key!r}. Available: {', '.join(self.configs)}")
+        overrides: dict[str, Any] = {
+            name: os.environ[env]
+            for name, env in CONFIG_ENV.get(key, {}).items()
+            if os.environ.get(env)
+        }
+        return dataclasses.replace(self.configs[key], **overrides)
+
+    def get(self, key: str) -> DebateModel:
+        """Return the adapter for ``key``, building it on first use.
+
+        Raises:
+            KeyError: If the key is not registered.
+            ValueError: If the provider's API key is not set.
+        """
+        config = self.config(key)
+        key = key.strip().lower()
+        if key in self._instances:
+            return self._instances[key]
+
+        adapter_cls = resolve_adapter(config.provider)
+
+        adapter_kwargs: dict[str, object] = {
+            "model_id": config.model_id,
+            "name": config.name,
+            "provider": config.provider,
+            "temperature": config.temperature,
+            "api_key_env": config.api_key_env,
+        }
+        if config.base_url is not None:
+            adapter_kwargs["base_url"] = config.base_url
+        if config.dialect is not None:
+            adapter_kwargs["dialect"] = config.dialect
+        key_pool = None
+        if config.provider not in LOCAL_PROVIDERS:
+            http_client = get_http_client(config.provider, self.pool_settings)
+            key_pool = get_key_pool(config.provider, config.api_key_env)
+            if key_pool is not None:
+                key_pool.install(http_client)
+            adapter_kwargs["http_client"] = http_client
+        if self.resilient:
+            # ResilientModel owns retries; stop the SDK retrying underneath it.
+            adapter_kwargs["max_retries"] = 0
+        model: DebateModel = adapter_cls(**adapter_kwargs)
+        if config.max_concurrency is not None:
+            model = ConcurrencyLimitedModel(model, config.max_concurrency)
+        if self.rate_limit:
+            limits = DEFAULT_PROVIDER_LIMITS.get(config.provider)
+            if key_pool is not None and limits is not None:
+                # Every key brings its own per-minute budget.
+                limits = dataclasses.replace(
+                    limits,
+                    requests_per_minute=limits.requests_per_minute * len(key_pool),
+                    tokens_per_minute=limits.tokens_per_minute * len(key_pool),
+                )
+            model = RateLimitedModel(model, get_provider_limiter(config.provider, limits))
+        if self.hedge:
+            model = HedgedModel(model)
+        if self.resilient:
+            model = ResilientModel(model, max_retries=config.max_retries)
+        if self.cache is not None:
+            model = CachedModel(model, self.cache, temperature=config.temperature)
+        self._instances[key] = model
+        return model
+
+    def get_backup(self, key: str) -> DebateModel | None:
+        """The backup-model adapter for ``key``, or None if none is configured.
+
+        The backup shares the primary's provider, key and settings and is
+        registered as ``<key>:backup``.
+        """
+        config = self.config(key)
+        if config.backup_model_id is None:
+            return None
+        backup_key = f"{key.strip().lower()}:backup"
+        if backup_key not in self.configs:
+            self.configs[backup_key] = dataclasses.replace(
+                config,
+                model_id=config.backup_model_id,
+                name=f"{config.name} (backup)",
+                backup_model_id=None,
+            )
+        return self.get(backup_key)
+
+    async def prewarm(self, connections: int = 1) -> None:
+        """Open pooled connections for every provider built so far."""
+        providers = {model.provider for model in self._instances.values()}
+        await asyncio.gather(*[prewarm(p, connections) for p in providers])
+
+    async def aclose(self) -> None:
+        """Close adapters that hold provider-side state, then the connection pools.
+
+        Adapters with an ``aclose()`` (e.g. GoogleModel's prompt caches) are
+        closed before the HTTP clients they use.
+        """
+        adapters = [unwrap_model(model) for model in self._instances.values()]
+        self._instances.clear()
+        await asyncio.gather(*[
+            adapter.aclose() for adapter in adapters if hasattr(adapter, "aclose")
+        ])
+        await close_http_clients()
+
+
+_default_registry: ModelRegistry | None = None
+
+
+def get_registry() -> ModelRegistry:
+    """Return the process-wide default registry."""
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = ModelRegistry()
+    return _default_registry
@@ -0,0 +1,390 @@
+"""Retries, backoff and circuit breaking shared by all model adapters.
+
+ResilientModel wraps any DebateModel and retries transient failures with
+jittered exponential backoff (honouring Retry-After), up to
+ModelConfig.max_retries. A per-provider CircuitBreaker fails fast while a
+provider is down instead of letting coroutines pile up behind it.
+
+Errors are classified by duck typing on the SDK exception classes so this
+module never has to import anthropic, openai or google-genai itself.
+"""
+
+import asyncio
+import random
+import time
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass
+from enum import StrEnum
+
+import httpx
+
+from ai_debate.models.base import DebateModel, Message, ModelResponse, Reasoning, StreamChunk
+from ai_debate.models.deadline import Deadline, DeadlineExceededError
+from ai_debate.models.wrapper import ModelWrapper
+
+RETRYABLE_STATUS = {408, 409, 425, 429, 500, 502, 503, 504, 529}
+# Base classes of the SDKs' errors for failed calls (anthropic, openai, google-genai).
+PROVIDER_ERROR_CLASSES = {"APIError", "APIConnectionError", "APITimeoutError", "APIStatusError"}
+
+
+class ErrorKind(StrEnum):
+    """How a failed call should be handled."""
+
+    RETRYABLE = "retryable"
+    RATE_LIMITED = "rate_limited"
+    FATAL = "fatal"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a provider whose circuit breaker is open."""
+
+    def __init__(self, provider: str, retry_in: float):
+        super().__init__(f"{provider} circuit open; retry in {retry_in:.0f}s")
+        self.provider = provider
+        self.retry_in = retry_in
+
+
+def _status_of(exc: BaseException) -> int | None:
+    """HTTP status from an SDK error (``status_code`` or genai's ``code``)."""
+    for attr in ("status_code", "code"):
+        value = getattr(exc, attr, None)
+        if isinstance(value, int):
+            return value
+    return None
+
+
+def classify_error(exc: BaseException) -> ErrorKind:
+    """Decide whether a failed generate() call is worth retrying.
+
+    - anthropic / openai: APIConnectionError and APITimeoutError are
+      retryable; APIStatusError is classified by status code.
+    - google-genai: APIError carries the status in ``code``
+      (ServerError = 5xx, ClientError = 4xx).
+    - Raw httpx transport errors and timeouts are retryable, but an
+      exhausted DeadlineExceededError budget is not.
+    """
+    if isinstance(exc, DeadlineExceededError):
+        return ErrorKind.FATAL
+    if isinstance(exc, (asyncio.TimeoutError, TimeoutError, httpx.TransportError)):
+        return ErrorKind.RETRYABLE
+
+    class_names = {cls.__name__ for cls in type(exc).__mro__}
+    if class_names & {"APIConnectionError", "APITimeoutError"}:
+        return ErrorKind.RETRYABLE
+
+    status = _status_of(exc)
+    if status == 429:
+        return ErrorKind.RATE_LIMITED
+    if status in RETRYABLE_STATUS or (status is not None and status >= 500):
+        return ErrorKind.RETRYABLE
+    if "ServerError" in class_names:
+        return ErrorKind.RETRYABLE
+    return ErrorKind.FATAL
+
+
+def is_provider_error(exc: BaseException) -> bool:
+    """Whether ``exc`` is a failed provider call rather than a bug.
+
+    True for SDK and httpx errors, timeouts (deadlines included), anything
+    carrying an HTTP status, and calls refused by an open circuit breaker.
+    """
+    if isinstance(exc, (CircuitOpenError, TimeoutError, httpx.HTTPError)):
+        return True
+    if _status_of(exc) is not None:
+        return True
+    return bool({cls.__name__ for cls in type(exc).__mro__} & PROVIDER_ERROR_CLASSES)
+
+
+def retry_after(exc: BaseException) -> float | None:
+    """Seconds the provider asked us to wait, from Retry-After headers."""
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        if "retry-after-ms" in headers:
+            return float(headers["retry-after-ms"]) / 1000.0
+        if "retry-after" in headers:
+            return float(headers["retry-after"])
+    except (TypeError, ValueError):
+        return None
+    return None
+
+
+@dataclass
+class RetryPolicy:
+    """Jittered exponential backoff ("full jitter")."""
+
+    max_retries: int = 3
+    base_delay: float = 1.0
+    max_delay: float = 60.0
+
+    def delay(self, attempt: int, exc: BaseException) -> float:
+        """Seconds to wait before retry number ``attempt`` (0-based)."""
+        backoff = random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+        hinted = retry_after(exc)
+        if hinted is not None:
+            return min(self.max_delay, max(backoff, hinted))
+        return backoff
+
+
+@dataclass
+class ResilienceStats:
+    """Counters for one provider, reported at the end of a run."""
+
+    provider: str
+    calls: int = 0
+    retries: int = 0
+    failures: int = 0
+    breaker_trips: int = 0
+    fast_failures: int = 0
+
+
+_stats: dict[str, ResilienceStats] = {}
+
+
+def get_stats(provider: str) -> ResilienceStats:
+    """Return the shared counters for a provider."""
+    if provider not in _stats:
+        _stats[provider] = ResilienceStats(provider=provider)
+    return _stats[provider]
+
+
+def resilience_stats() -> dict[str, ResilienceStats]:
+    """Counters for every provider seen so far."""
+    return dict(_stats)
+
+
+def format_resilience_summary() -> str:
+    """One line per provider with retries and breaker activity."""
+    lines = []
+    for stats in _stats.values():
+        lines.append(
+            f"  {stats.provider}: {stats.calls} calls, {stats.retries} retries, "
+            f"{stats.failures} failed, {stats.breaker_trips} breaker trips, "
+            f"{stats.fast_failures} fast-failed"
+        )
+    return "\n".join(lines)
+
+
+class CircuitBreaker:
+    """Closed → open after consecutive failures → half-open probe → closed.
+
+    Only provider-side failures (timeouts, connection errors, 5xx) count;
+    rate limits and request errors do not mean the provider is down, and
+    our own deadlines running out says nothing about it either way.
+    """
+
+    def __init__(self, provider: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.provider = provider
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.consecutive_failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    @property
+    def is_healthy(self) -> bool:
+        return self.state != "open"
+
+    def before_call(self) -> bool:
+        """Raise CircuitOpenError if calls should not reach the provider.
+
+        Returns:
+            True if this call is the half-open probe. A probe that ends
+            without a result (cancelled, or a stream closed early) must
+            call release_probe().
+        """
+        state = self.state
+        if state == "closed":
+            return False
+        if state == "half-open" and not self._probing:
+            self._probing = True
+            return True
+        get_stats(self.provider).fast_failures += 1
+        assert self._opened_at is not None
+        retry_in = max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+        raise CircuitOpenError(self.provider, retry_in)
+
+    def record_success(self) -> None:
+        self.consecutive_failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def release_probe(self) -> None:
+        """Free the half-open slot without counting the probe either way."""
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self.consecutive_failures += 1
+        if self._probing or self.consecutive_failures >= self.failure_threshold:
+            if self._opened_at is None or self._probing:
+                get_stats(self.provider).breaker_trips += 1
+            self._opened_at = time.monotonic()
+            self._probing = False
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+
+
+def get_breaker(provider: str) -> CircuitBreaker:
+    """Return the shared circuit breaker for a provider."""
+    if provider not in _breakers:
+        _breakers[provider] = CircuitBreaker(provider)
+    return _breakers[provider]
+
+
+def is_provider_healthy(provider: str) -> bool:
+    """False while a provider's breaker is open."""
+    breaker = _breakers.get(provider)
+    return breaker is None or breaker.is_healthy
+
+
+class ResilientModel(ModelWrapper):
+    """Retries transient failures and respects the provider's circuit breaker."""
+
+    def __init__(
+        self,
+        inner: DebateModel,
+        max_retries: int = 3,
+        policy: RetryPolicy | None = None,
+        breaker: CircuitBreaker | None = None,
+    ):
+        super().__init__(inner)
+        self.policy = policy or RetryPolicy(max_retries=max_retries)
+        self.breaker = breaker or get_breaker(inner.provider)
+        self.stats = get_stats(inner.provider)
+
+    async def generate(
+        self,
+        system_prompt: str,
+        messages: list[Message],
+        max_tokens: int = 4096,
+        timeout: float | None = None,
+        reasoning: Reasoning | None = None,
+    ) -> ModelResponse:
+        self.stats.calls += 1
+        # The timeout covers all attempts, not each one.
+        deadline = Deadline.after(timeout, "call") if timeout is not None else None
+        attempt = 0
+        while True:
+            probe = self.breaker.before_call()
+            try:
+                response = await self.inner.generate(
+                    system_prompt=system_prompt,
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    timeout=self._attempt_timeout(deadline, timeout),
+                    reasoning=reasoning,
+                )
+            except Exception as e:
+                await self._handle_failure(e, attempt, deadline, probe)
+                attempt += 1
+                continue
+            except BaseException:
+                # Cancelled: says nothing about the provider.
+                if probe:
+                    self.breaker.release_probe()
+                raise
+            self.breaker.record_success()
+            response.usage.retries += attempt
+            return response
+
+    async def generate_stream(
+        self,
+        system_prompt: str,
+        messages: list[Message],
+        max_tokens: int = 4096,
+        timeout: float | None = None,
+        reasoning: Reasoning | None = None,
+    ) -> AsyncGenerator[StreamChunk, None]:
+        """Stream with retries, but only until the first text delta.
+
+        Once text has been yielded the caller holds partial output, so a
+        later failure is raised rather than silently restarting the speech.
+        """
+        self.stats.calls += 1
+        deadline = Deadline.after(timeout, "call") if timeout is not None else None
+        attempt = 0
+        while True:
+            probe = self.breaker.before_call()
+            started = False
+            try:
+                async for chunk in self.inner.generate_stream(
+                    system_prompt=system_prompt,
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    timeout=self._attempt_timeout(deadline, timeout),
+                    reasoning=reasoning,
+                ):
+                    if chunk.text:
+                        started = True
+                    if chunk.response is not None:
+                        chunk.response.usage.retries += attempt
+                    yield chunk
+            except Exception as e:
+                if started:
+                    self._record_error(e, probe)
+                    self.stats.failures += 1
+                    raise
+                await self._handle_failure(e, attempt, deadline, probe)
+                attempt += 1
+                continue
+            except BaseException:
+                # Cancelled, or the caller closed the stream early.
+                if probe:
+                    self.breaker.release_probe()
+                raise
+            self.breaker.record_success()
+            return
+
+    @staticmethod
+    def _attempt_timeout(deadline: Deadline | None, timeout: float | None) -> float | None:
+        """Time left for the next attempt, raising once the budget is spent."""
+        if deadline is None:
+            return None
+        remaining = deadline.remaining()
+        if remaining <= 0:
+            raise DeadlineExceededError("call", timeout)
+        return remaining
+
+    def _record_error(self, error: Exception, probe: bool) -> ErrorKind:
+        """Update the breaker for a failed call and return the error's kind."""
+        kind = classify_error(error)
+        if kind == ErrorKind.RETRYABLE:
+            self.breaker.record_failure()
+        elif _status_of(error) is not None:
+            # A 4xx: the provider answered, so it is up even if we are not.
+            self.breaker.record_success()
+        elif probe:
+            # No answer either way (e.g. our own deadline ran out first).
+            self.breaker.release_probe()
+        return kind
+
+    async def _handle_failure(
+        self,
+        error: Exception,
+        attempt: int,
+        deadline: Deadline | None = None,
+        probe: bool = False,
+    ) -> None:
+        """Update the breaker, then re-raise or sleep before the next attempt."""
+        kind = self._record_error(error, probe)
+        if kind == ErrorKind.FATAL or attempt >= self.policy.max_retries:
+            self.stats.failures += 1
+            raise error
+        delay = self.policy.delay(attempt, error)
+        if deadline is not None and delay >= deadline.remaining():
+            # Not enough budget left to wait and try again.
+            self.stats.failures += 1
+            raise error
+        self.stats.retries += 1
+        await asyncio.sleep(delay)
@@ -0,0 +1,125 @@
+"""Base class for adapters that decorate another DebateModel."""
+
+import asyncio
+import time
+from collections.abc import AsyncGenerator
+
+from ai_debate.models.base import DebateModel, Message, ModelResponse, Reasoning, StreamChunk
+
+
+class ModelWrapper:
+    """Delegates the DebateModel interface to an inner model.
+
+    Subclasses override generate() to add behaviour (limits, retries, ...)
+    while name/model_id/provider stay those of the wrapped model, so
+    transcripts and results never see the wrapper.
+    """
+
+    def __init__(self, inner: DebateModel):
+        self.inner = inner
+
+    @property
+    def name(self) -> str:
+        return self.inner.name
+
+    @property
+    def model_id(self) -> str:
+        return self.inner.model_id
+
+    @property
+    def provider(self) -> str:
+        return self.inner.provider
+
+    async def generate(
+        self,
+        system_prompt: str,
+        messages: list[Message],
+        max_tokens: int = 4096,
+        timeout: float | None = None,
+        reasoning: Reasoning | None = None,
+    ) -> ModelResponse:
+        return await self.inner.generate(
+            system_prompt=system_prompt,
+            messages=messages,
+            max_tokens=max_tokens,
+            timeout=timeout,
+            reasoning=reasoning,
+        )
+
+    async def generate_stream(
+        self,
+        system_prompt: str,
+        messages: list[Message],
+        max_tokens: int = 4096,
+        timeout: float | None = None,
+        reasoning: Reasoning | None = None,
+    ) -> AsyncGenerator[StreamChunk, None]:
+        async for chunk in self.inner.generate_stream(
+            system_prompt=system_prompt,
+            messages=messages,
+            max_tokens=max_tokens,
+            timeout=timeout,
+            reasoning=reasoning,
+        ):
+            yield chunk
+
+
+def unwrap_model(model: DebateModel) -> DebateModel:
+    """The provider adapter underneath any stack of ModelWrappers."""
+    while isinstance(model, ModelWrapper):
+        model = model.inner
+    return model
+
+
+class ConcurrencyLimitedModel(ModelWrapper):
+    """Caps the number of in-flight generate() calls for one model."""
+
+    def __init__(self, inner: DebateModel, max_in_flight: int):
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        super().__init__(inner)
+        self.max_in_flight = max_in_flight
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+
+    async def generate(
+        self,
+        system_prompt: str,
+        messages: list[Message],
+        max_tokens: int = 4096,
+        timeout: float | None = None,
+        reasoning: Reasoning | None = None,
+    ) -> ModelResponse:
+        queued = time.monotonic()
+        async with self._semaphore:
+            waited = time.monotonic() - queued
+            response = await self.inner.generate(
+                system_prompt=system_prompt,
+                messages=messages,
+                max_tokens=max_tokens,
+                timeout=timeout,
+                reasoning=reasoning,
+            )
+        response.usage.queue_seconds += waited
+        return response
+
+    async def generate_stream(
+        self,
+        system_prompt: str,
+        messages: list[Message],
+        max_tokens: int = 4096,
+        timeout: float | None = None,
+        reasoning: Reasoning | None = None,
+    ) -> AsyncGenerator[StreamChunk, None]:
+        queued = time.monotonic()
+        async with self._semaphore:
+            waited = time.monotonic() - queued
+            async for chunk in self.inner.generate_stream(
+                system_prompt=system_prompt,
+                messages=messages,
+                max_tokens=max_tokens,
+                timeout=timeout,
+                reasoning=reasoning,
+            ):
+                if chunk.response is not None:
+                    chunk.response.usage.queue_seconds += waited
+                yield chunk
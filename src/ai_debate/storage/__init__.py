@@ -1 +1,5 @@
 """Storage for debate transcripts and results."""
+
+from ai_debate.storage.journal import JOURNAL_DIR, RunJournal, new_run_id
+
+__all__ = ["JOURNAL_DIR", "RunJournal", "new_run_id"]
@@ -0,0 +1,447 @@
+"""Write-ahead journal of a debate or matrix run, for resuming after a crash.
+
+Every speech, speech summary and judge decision is appended to a JSON Lines
+file the moment its call returns, and the file is flushed and fsynced
+before the run moves on. Reopening a journal replays it into memory, and the
+engine, judge panel and matrix runner consult that state to skip work that
+has already been paid for:
+
+- a judged matrix debate is restored from its ``result`` record;
+- an unfinished debate continues after its last journaled phase;
+- a judge seat that already decided is not asked again.
+
+A crash can leave half a line at the end of the file. It is discarded when
+the journal is reopened, so only the call that was in flight is repeated.
+
+Records (one JSON object per line, ``type`` first):
+
+- ``run``: resolution and model names, checked when resuming a matrix.
+- ``debate``: a new transcript (its ID, sides, and matrix debate index).
+  A fork names its parent and the number of phases it shares with it;
+  those phases are not written again.
+- ``phase``: one finished speech, by index into the format's phases.
+- ``summary``: a speech summary written for context compression.
+- ``decision``: one judge seat's decision and the substitutions it took.
+- ``result``: a matrix debate's final result.
+"""
+
+import json
+import os
+from dataclasses import asdict
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Literal, NotRequired, TypedDict
+from uuid import uuid4
+
+from ai_debate.debate.engine import DebateTranscript, PhaseResult
+from ai_debate.debate.formats import LINCOLN_DOUGLAS, DebateFormat, SpeakerRole
+from ai_debate.debate.guard import StopReason
+from ai_debate.judging.judge import build_result
+from ai_debate.judging.scoring import (
+    DebateResult,
+    DebaterScores,
+    JudgeDecision,
+    JudgeSubstitution,
+)
+from ai_debate.models.base import Usage
+
+JOURNAL_DIR = Path(".journal")
+
+
+# One TypedDict per record type listed above, as written to the file.
+
+
+class RunRecord(TypedDict):
+    type: Literal["run"]
+    resolution: str
+    models: list[str]
+    format: str
+    started_at: str
+
+
+class DebateRecord(TypedDict):
+    type: Literal["debate"]
+    id: str
+    debate_index: int | None
+    resolution: str
+    affirmative_model: str
+    negative_model: str
+    format_name: str
+    started_at: str
+    parent_id: NotRequired[str | None]
+    forked_at: NotRequired[int | None]
+    shared_phases: NotRequired[int]
+
+
+class PhaseRecord(TypedDict):
+    type: Literal["phase"]
+    debate: str
+    index: int
+    phase: str
+    speaker_model: str
+    speaker_role: str
+    content: str
+    word_count: int
+    input_tokens: int
+    output_tokens: int
+    ttft_seconds: float | None
+    duration_seconds: float | None
+    usage: dict[str, Any]
+    stopped: NotRequired[str | None]
+    tokens_saved: NotRequired[int]
+    seconds_saved: NotRequired[float]
+    shared_from: NotRequired[str | None]
+    shared_tokens_saved: NotRequired[int]
+    context_tokens_saved: int
+    at: str
+
+
+class SummaryRecord(TypedDict):
+    type: Literal["summary"]
+    debate: str
+    index: int
+    summary: str | None
+    summary_tokens: int
+
+
+class DecisionRecord(TypedDict):
+    type: Literal["decision"]
+    debate: str
+    seat: str
+    decision: dict[str, Any]
+    substitutions: list[dict[str, Any]]
+
+
+class ResultRecord(TypedDict):
+    type: Literal["result"]
+    debate: str
+    seats: list[str]
+    substitutions: list[dict[str, Any]]
+    panel_size: int
+
+
+JournalRecord = (
+    RunRecord | DebateRecord | PhaseRecord | SummaryRecord | DecisionRecord | ResultRecord
+)
+
+
+def new_run_id() -> str:
+    """A fresh run ID (also the journal's file name)."""
+    return uuid4().hex[:8]
+
+
+def _decision_from_dict(data: dict[str, Any]) -> JudgeDecision:
+    return JudgeDecision(**{
+        **data,
+        "scores_a": DebaterScores(**data["scores_a"]),
+        "scores_b": DebaterScores(**data["scores_b"]),
+        "usage": Usage(**data.get("usage", {})),
+    })
+
+
+class RunJournal:
+    """Append-only record of one run, replayed into memory when reopened.
+
+    Args:
+        run_id: The run to create or continue (a new ID when None).
+        directory: Where journals are kept.
+        format: The format the run's debates follow; journaled phases are
+            matched back to its phases by position.
+    """
+
+    def __init__(
+        self,
+        run_id: str | None = None,
+        directory: Path | str = JOURNAL_DIR,
+        format: DebateFormat = LINCOLN_DOUGLAS,
+    ):
+        self.run_id = run_id or new_run_id()
+        self.path = Path(directory) / f"{self.run_id}.jsonl"
+        self.format = format
+        self.header: RunRecord | None = None
+        self._transcripts: dict[str, DebateTranscript] = {}
+        self._debates: dict[int | None, str] = {}  # Matrix debate index -> latest transcript ID
+        self._decisions: dict[str, dict[str, tuple[JudgeDecision, list[JudgeSubstitution]]]] = {}
+        self._results: dict[str, DebateResult] = {}
+        self.records = self._replay() if self.path.exists() else 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.path.open("a", encoding="utf-8")
+
+    @classmethod
+    def resume(
+        cls,
+        run_id: str,
+        directory: Path | str = JOURNAL_DIR,
+        format: DebateFormat = LINCOLN_DOUGLAS,
+    ) -> "RunJournal":
+        """Reopen an existing journal.
+
+        Raises:
+            FileNotFoundError: If there is no journal for ``run_id``.
+            ValueError: If the journal was written for another format.
+        """
+        path = Path(directory) / f"{run_id}.jsonl"
+        if not path.exists():
+            raise FileNotFoundError(f"No journal for run {run_id!r} in {directory}")
+        return cls(run_id, directory, format)
+
+    def close(self) -> None:
+        self._file.close()
+
+    # -- Replay --------------------------------------------------------------
+
+    def _replay(self) -> int:
+        """Load every complete record; cut off a torn final line."""
+        good = 0
+        count = 0
+        with self.path.open("rb") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    break
+                if not line.endswith(b"\n"):
+                    break
+                self._apply(record)
+                good += len(line)
+                count += 1
+        if good < self.path.stat().st_size:
+            with self.path.open("r+b") as f:
+                f.truncate(good)
+        return count
+
+    def _apply(self, record: JournalRecord) -> None:
+        if record["type"] == "run":
+            self.header = record
+        elif record["type"] == "debate":
+            if record["format_name"] != self.format.name:
+                raise ValueError(
+                    f"Journal {self.path} holds a {record['format_name']} debate; "
+                    f"resume it with that format, not {self.format.name}"
+                )
+            parent_id = record.get("parent_id")
+            shared = record.get("shared_phases", 0)
+            self._transcripts[record["id"]] = DebateTranscript(
+                id=record["id"],
+                resolution=record["resolution"],
+                affirmative_model=record["affirmative_model"],
+                negative_model=record["negative_model"],
+                format_name=record["format_name"],
+                phases=(
+                    self._transcripts[parent_id].phases[:shared]
+                    if parent_id is not None and shared
+                    else []
+                ),
+                started_at=datetime.fromisoformat(record["started_at"]),
+                parent_id=parent_id,
+                forked_at=record.get("forked_at"),
+            )
+            self._debates[record.get("debate_index")] = record["id"]
+        elif record["type"] == "phase":
+            transcript = self._transcripts[record["debate"]]
+            index = record["index"]
+            phase = self.format.phases[index]
+            if phase.name != record["phase"] or index != len(transcript.phases):
+                raise ValueError(
+                    f"Journal {self.path} does not match format {self.format.name!r} "
+                    f"at phase {index + 1} ({record['phase']!r})"
+                )
+            stopped = record.get("stopped")
+            transcript.phases.append(PhaseResult(
+                phase=phase,
+                speaker_model=record["speaker_model"],
+                speaker_role=SpeakerRole(record["speaker_role"]),
+                content=record["content"],
+                word_count=record["word_count"],
+                input_tokens=record["input_tokens"],
+                output_tokens=record["output_tokens"],
+                ttft_seconds=record["ttft_seconds"],
+                duration_seconds=record["duration_seconds"],
+                usage=Usage(**record["usage"]),
+                stopped=StopReason(stopped) if stopped else None,
+                tokens_saved=record.get("tokens_saved", 0),
+                seconds_saved=record.get("seconds_saved", 0.0),
+                shared_from=record.get("shared_from"),
+                shared_tokens_saved=record.get("shared_tokens_saved", 0),
+            ))
+            transcript.context_tokens_saved = record["context_tokens_saved"]
+            if len(transcript.phases) == len(self.format.phases):
+                transcript.completed_at = datetime.fromisoformat(record["at"])
+        elif record["type"] == "summary":
+            transcript = self._transcripts[record["debate"]]
+            transcript.phases[record["index"]].summary = record["summary"]
+            transcript.summary_tokens = record["summary_tokens"]
+        elif record["type"] == "decision":
+            seats = self._decisions.setdefault(record["debate"], {})
+            seats[record["seat"]] = (
+                _decision_from_dict(record["decision"]),
+                [JudgeSubstitution(**s) for s in record["substitutions"]],
+            )
+        elif record["type"] == "result":
+            transcript = self._transcripts[record["debate"]]
+            seats = self._decisions.get(record["debate"], {})
+            self._results[record["debate"]] = build_result(
+                transcript,
+                [seats[seat][0] for seat in record["seats"]],
+                substitutions=[JudgeSubstitution(**s) for s in record["substitutions"]],
+                panel_size=record.get("panel_size", len(record["seats"])),
+            )
+
+    # -- Writing -------------------------------------------------------------
+
+    def _append(self, record: JournalRecord) -> None:
+        self._file.write(json.dumps(record, default=str) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.records += 1
+
+    def record_run(self, resolution: str, model_names: list[str]) -> None:
+        """Start the journal, or check a resumed run is the same matrix.
+
+        Raises:
+            ValueError: If the journal belongs to a different resolution or
+                set of models.
+        """
+        if self.header is None:
+            self.header = RunRecord(
+                type="run",
+                resolution=resolution,
+                models=model_names,
+                format=self.format.name,
+                started_at=datetime.now(UTC).isoformat(),
+            )
+            self._append(self.header)
+            return
+        if self.header["resolution"] != resolution or self.header["models"] != model_names:
+            raise ValueError(
+                f"Run {self.run_id} was started for {self.header['models']} on "
+                f"{self.header['resolution']!r}; resume it with the same models and resolution"
+            )
+
+    def record_debate(self, transcript: DebateTranscript, debate_index: int | None = None) -> None:
+        """A new transcript, continued in place if the run resumes.
+
+        A fork's phases are stored as a reference to its parent when the
+        parent is in this journal, and written out in full otherwise.
+        """
+        shared = 0
+        if transcript.parent_id in self._transcripts:
+            shared = transcript.forked_at or 0
+        self._transcripts[transcript.id] = transcript
+        self._debates[debate_index] = transcript.id
+        self._append(DebateRecord(
+            type="debate",
+            id=transcript.id,
+            debate_index=debate_index,
+            resolution=transcript.resolution,
+            affirmative_model=transcript.affirmative_model,
+            negative_model=transcript.negative_model,
+            format_name=transcript.format_name,
+            started_at=transcript.started_at.isoformat(),
+            parent_id=transcript.parent_id,
+            forked_at=transcript.forked_at,
+            shared_phases=shared,
+        ))
+        for index, result in enumerate(transcript.phases[shared:], start=shared):
+            self._append_phase(transcript, index, result)
+
+    def record_phase(self, transcript: DebateTranscript, result: PhaseResult) -> None:
+        """A speech just appended to ``transcript``."""
+        self._append_phase(transcript, len(transcript.phases) - 1, result)
+
+    def _append_phase(self, transcript: DebateTranscript, index: int, result: PhaseResult) -> None:
+        self._append(PhaseRecord(
+            type="phase",
+            debate=transcript.id,
+            index=index,
+            phase=result.phase.name,
+            speaker_model=result.speaker_model,
+            speaker_role=result.speaker_role.value,
+            content=result.content,
+            word_count=result.word_count,
+            input_tokens=result.input_tokens,
+            output_tokens=result.output_tokens,
+            ttft_seconds=result.ttft_seconds,
+            duration_seconds=result.duration_seconds,
+            usage=asdict(result.usage),
+            stopped=result.stopped.value if result.stopped else None,
+            tokens_saved=result.tokens_saved,
+            seconds_saved=result.seconds_saved,
+            shared_from=result.shared_from,
+            shared_tokens_saved=result.shared_tokens_saved,
+            context_tokens_saved=transcript.context_tokens_saved,
+            at=datetime.now(UTC).isoformat(),
+        ))
+
+    def record_summary(self, transcript: DebateTranscript, result: PhaseResult) -> None:
+        """A summary just written onto ``result``."""
+        self._append(SummaryRecord(
+            type="summary",
+            debate=transcript.id,
+            index=transcript.phases.index(result),
+            summary=result.summary,
+            summary_tokens=transcript.summary_tokens,
+        ))
+
+    def record_decision(
+        self,
+        transcript_id: str,
+        seat: str,
+        decision: JudgeDecision,
+        substitutions: list[JudgeSubstitution],
+    ) -> None:
+        """The decision for the panel seat of judge ``seat``."""
+        self._decisions.setdefault(transcript_id, {})[seat] = (decision, substitutions)
+        self._append(DecisionRecord(
+            type="decision",
+            debate=transcript_id,
+            seat=seat,
+            decision=asdict(decision),
+            substitutions=[asdict(s) for s in substitutions],
+        ))
+
+    def record_result(self, transcript: DebateTranscript, result: DebateResult) -> None:
+        """A judged debate; decisions not yet journaled are added first."""
+        seats = self._decisions.get(transcript.id, {})
+        order = []
+        for decision in result.decisions:
+            seat = next((s for s, (d, _) in seats.items() if d == decision), None)
+            if seat is None:
+                seat = decision.judge_name
+                self.record_decision(transcript.id, seat, decision, [])
+            order.append(seat)
+        self._results[transcript.id] = result
+        self._append(ResultRecord(
+            type="result",
+            debate=transcript.id,
+            seats=order,
+            substitutions=[asdict(s) for s in result.substitutions],
+            panel_size=result.panel_size,
+        ))
+
+    # -- Queries -------------------------------------------------------------
+
+    @property
+    def transcripts(self) -> list[DebateTranscript]:
+        """Every journaled transcript, judged or not, in the order they were started."""
+        return list(self._transcripts.values())
+
+    def transcript(self, debate_index: int | None = None) -> DebateTranscript | None:
+        """The latest unjudged transcript for a matrix debate (or the standalone debate)."""
+        transcript_id = self._debates.get(debate_index)
+        if transcript_id is None or transcript_id in self._results:
+            return None
+        return self._transcripts[transcript_id]
+
+    def result(self, debate_index: int) -> tuple[DebateTranscript, DebateResult] | None:
+        """A matrix debate's transcript and result, if it was judged."""
+        transcript_id = self._debates.get(debate_index)
+        if transcript_id is None or transcript_id not in self._results:
+            return None
+        return self._transcripts[transcript_id], self._results[transcript_id]
+
+    def decision(
+        self, transcript_id: str, seat: str
+    ) -> tuple[JudgeDecision, list[JudgeSubstitution]] | None:
+        """A journaled decision for judge ``seat`` of a debate, with its substitutions."""
+        return self._decisions.get(transcript_id, {}).get(seat)
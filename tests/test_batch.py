@@ -0,0 +1,44 @@
+"""Tests for batch jobs and their interactive fallback."""
+
+from ai_debate.models.base import Message, Role
+from ai_debate.models.batch import BatchDispatcher, BatchRequest, LocalBatchBackend
+from ai_debate.models.mock import LatencyProfile, MockModel
+
+
+def request(model: MockModel, custom_id: str) -> BatchRequest:
+    messages = [Message(role=Role.USER, content=f"{custom_id}. Stay within 20 words.")]
+    return BatchRequest(custom_id=custom_id, model=model, system_prompt="", messages=messages)
+
+
+def dispatcher() -> BatchDispatcher:
+    return BatchDispatcher(local=LocalBatchBackend(poll_interval=0.01), verbose=False)
+
+
+async def test_straggling_job_keeps_finished_results() -> None:
+    # The first call answers at once, the second hangs past the straggler timeout.
+    model = MockModel(latency=LatencyProfile(kind="replay", samples=[0.0, 10.0]))
+    results = await dispatcher().submit(
+        [request(model, "fast"), request(model, "slow")], straggler_timeout=0.2
+    )
+
+    assert list(results) == ["fast"]
+    assert results["fast"].response is not None
+
+
+async def test_complete_retries_only_unfinished_requests() -> None:
+    model = MockModel(latency=LatencyProfile(kind="replay", samples=[0.0, 10.0, 0.0]))
+    results = await dispatcher().complete(
+        [request(model, "fast"), request(model, "slow")], straggler_timeout=0.2
+    )
+
+    assert all(result.response is not None for result in results.values())
+    # Two batched calls plus one interactive retry of the straggler.
+    assert model.calls == 3
+
+
+def test_models_without_batch_support_use_the_local_backend() -> None:
+    hosted = dispatcher()
+    model = MockModel(provider="Anthropic")
+
+    assert "Anthropic" in hosted.backends
+    assert hosted.backend_for(model) is hosted.local
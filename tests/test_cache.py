@@ -0,0 +1,43 @@
+"""Tests for the response cache."""
+
+import asyncio
+from pathlib import Path
+
+from ai_debate.models.base import Message, Role
+from ai_debate.models.cache import CachedModel, CacheMode, ResponseCache, open_cache
+from ai_debate.models.mock import LatencyProfile, MockModel
+
+MESSAGES = [Message(role=Role.USER, content="Stay within 100 words.")]
+
+
+def cached_model(path: Path, mode: CacheMode, seconds: float = 0.0) -> CachedModel:
+    cache = open_cache(mode, path)
+    assert isinstance(cache, ResponseCache)
+    return CachedModel(MockModel(latency=LatencyProfile(kind="fixed", seconds=seconds)), cache)
+
+
+async def test_coalesced_callers_get_their_own_response(tmp_path: Path) -> None:
+    model = cached_model(tmp_path / "cache.sqlite", CacheMode.READ_WRITE, seconds=0.05)
+    first, second = await asyncio.gather(
+        model.generate("", MESSAGES), model.generate("", MESSAGES)
+    )
+
+    assert model.cache.stats.coalesced == 1
+    assert first.content == second.content
+    first.usage.retries += 1
+    assert second.usage.retries == 0
+
+
+async def test_stream_closed_early_is_stored(tmp_path: Path) -> None:
+    path = tmp_path / "cache.sqlite"
+    model = cached_model(path, CacheMode.READ_WRITE)
+    stream = model.generate_stream("", MESSAGES)
+    first = await anext(stream)
+    await stream.aclose()
+    model.cache.close()
+
+    replay = cached_model(path, CacheMode.REPLAY)
+    chunks = [chunk async for chunk in replay.generate_stream("", MESSAGES)]
+
+    assert chunks[0].text == first.text
+    assert replay.cache.stats.hits == 1
@@ -0,0 +1,68 @@
+"""Tests for deadlines in the debate engine."""
+
+import asyncio
+import time
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+import pytest
+
+from ai_debate.debate import DebateEngine
+from ai_debate.models.base import StreamChunk
+from ai_debate.models.deadline import DeadlineExceededError
+from ai_debate.models.mock import LatencyProfile, MockModel
+
+RESOLUTION = "Resolved: Tests should run offline."
+M = TypeVar("M", bound=MockModel)
+
+
+@dataclass
+class StalledModel(MockModel):
+    """Sends one delta, then trickles nothing, ignoring its timeout."""
+
+    async def generate_stream(self, *args: Any, **kwargs: Any) -> AsyncGenerator[StreamChunk, None]:
+        yield StreamChunk(text="I will now")
+        await asyncio.sleep(60)
+
+
+@dataclass
+class RecordingModel(MockModel):
+    """A mock that records the timeout of every call."""
+
+    timeouts: list[float | None] = field(default_factory=list)
+
+    async def generate_stream(self, *args: Any, **kwargs: Any) -> AsyncGenerator[StreamChunk, None]:
+        self.timeouts.append(kwargs.get("timeout"))
+        async for chunk in super().generate_stream(*args, **kwargs):
+            yield chunk
+
+
+def fast(cls: type[M], name: str) -> M:
+    return cls(
+        model_id=name.lower(),
+        name=name,
+        latency=LatencyProfile(kind="fixed", seconds=0.0),
+        tokens_per_second=1e6,
+    )
+
+
+async def test_phase_deadline_stops_a_stalled_stream() -> None:
+    engine = DebateEngine(verbose=False, phase_timeout=lambda phase: 0.2)
+    started = time.monotonic()
+
+    with pytest.raises(DeadlineExceededError) as excinfo:
+        await engine.run_debate(RESOLUTION, fast(StalledModel, "Aff"), fast(MockModel, "Neg"))
+
+    assert "phase" in excinfo.value.scope
+    assert time.monotonic() - started < 5
+
+
+async def test_call_timeouts_fit_the_debate_deadline() -> None:
+    engine = DebateEngine(verbose=False, phase_timeout=None, debate_timeout=30.0)
+    aff, neg = fast(RecordingModel, "Aff"), fast(RecordingModel, "Neg")
+
+    await engine.run_debate(RESOLUTION, aff, neg)
+
+    timeouts = aff.timeouts + neg.timeouts
+    assert timeouts and all(t is not None and 0 < t <= 30.0 for t in timeouts)
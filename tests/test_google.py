@@ -0,0 +1,57 @@
+"""Tests for the Gemini adapter's explicit prompt caches."""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from ai_debate.models.base import Message, Role
+from ai_debate.models.google import CHARS_PER_TOKEN, MIN_CACHE_TOKENS, GoogleModel
+
+LONG = "word " * (MIN_CACHE_TOKENS * CHARS_PER_TOKEN // 5 + 1)
+MESSAGES = [
+    Message(role=Role.USER, content=LONG, cache_control=True),
+    Message(role=Role.USER, content="Your turn."),
+]
+
+
+class FakeCaches:
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.created = 0
+
+    async def create(self, **kwargs: Any) -> SimpleNamespace:
+        self.created += 1
+        await asyncio.sleep(0.05)
+        if self.fail:
+            raise RuntimeError("too small")
+        return SimpleNamespace(name=f"cachedContents/{self.created}")
+
+
+def model_with(caches: FakeCaches, monkeypatch: pytest.MonkeyPatch) -> GoogleModel:
+    monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
+    model = GoogleModel()
+    model._client = SimpleNamespace(aio=SimpleNamespace(caches=caches))  # type: ignore[assignment]
+    return model
+
+
+async def test_concurrent_requests_share_one_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    caches = FakeCaches()
+    model = model_with(caches, monkeypatch)
+
+    prefixes = await asyncio.gather(*[model._cached_prefix("", MESSAGES) for _ in range(3)])
+
+    assert caches.created == 1
+    assert prefixes == [("cachedContents/1", 1)] * 3
+
+
+async def test_waiters_go_uncached_when_creation_fails(monkeypatch: pytest.MonkeyPatch) -> None:
+    caches = FakeCaches(fail=True)
+    model = model_with(caches, monkeypatch)
+
+    prefixes = await asyncio.gather(*[model._cached_prefix("", MESSAGES) for _ in range(3)])
+
+    assert caches.created == 1
+    assert prefixes == [(None, 0)] * 3
+    assert not model._creating
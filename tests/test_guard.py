@@ -0,0 +1,35 @@
+"""Tests for the output guard."""
+
+from ai_debate.debate.guard import OutputGuard, StopReason
+
+GUARD = OutputGuard(repeat_ngram=4, max_repeats=3)
+TAGLINE = "Liberty is the answer."
+FILLER = "We weigh the evidence first. Then the impacts follow. "
+
+
+def test_phrase_said_twice_is_not_a_loop() -> None:
+    text = f"{TAGLINE} {FILLER}{TAGLINE} {FILLER}"
+    assert GUARD.check(text, word_limit=100) is None
+
+
+def test_trim_cuts_the_loop_that_was_detected() -> None:
+    # The tagline comes round twice (fine); the loop only at its third pass.
+    loop = "Justice demands we act now. "
+    text = f"{TAGLINE} {FILLER}{TAGLINE} {loop * 3}"
+
+    assert GUARD.check(text, word_limit=100) is StopReason.REPETITION
+    trimmed = GUARD.trim(text, 100, StopReason.REPETITION)
+    assert trimmed == f"{TAGLINE} {FILLER}{TAGLINE} {loop.strip()}"
+
+
+def test_watch_result_does_not_depend_on_chunking() -> None:
+    text = "Words pile up here. " * 40
+    whole = GUARD.check(text, word_limit=500)
+    watch = GUARD.watch(500)
+    chunked = None
+    for i in range(0, len(text), 3):
+        chunked = watch.feed(text[i : i + 3])
+        if chunked:
+            break
+
+    assert whole is chunked is StopReason.REPETITION
@@ -0,0 +1,55 @@
+"""Tests for resuming a matrix run from its journal."""
+
+from pathlib import Path
+
+from ai_debate.matrix import MatrixRunner, build_matrix_schedule
+from ai_debate.models.mock import LatencyProfile, MockModel
+from ai_debate.storage.journal import RunJournal
+
+RESOLUTION = "Resolved: Tests should run offline."
+
+
+def mock_models() -> dict[str, MockModel]:
+    return {
+        f"Mock {i}": MockModel(
+            model_id=f"mock-{i}",
+            name=f"Mock {i}",
+            latency=LatencyProfile(kind="fixed", seconds=0.0),
+            tokens_per_second=1e6,
+        )
+        for i in range(1, 4)
+    }
+
+
+async def run(journal: RunJournal) -> tuple[list[str], int]:
+    """Winners of a three-model matrix, and how many model calls it made."""
+    models = mock_models()
+    runner = MatrixRunner(dict(models), verbose=False, journal=journal)
+    result = await runner.run_matrix(RESOLUTION, build_matrix_schedule(list(models)))
+    journal.close()
+    winners = [r.winner_model for r in result.debate_results]
+    return winners, sum(model.calls for model in models.values())
+
+
+async def test_finished_run_is_restored_without_calls(tmp_path: Path) -> None:
+    journal = RunJournal(directory=tmp_path)
+    winners, calls = await run(journal)
+
+    resumed, resumed_calls = await run(RunJournal.resume(journal.run_id, tmp_path))
+
+    assert calls > 0
+    assert resumed_calls == 0
+    assert resumed == winners
+
+
+async def test_crashed_run_repeats_only_the_unjournaled_calls(tmp_path: Path) -> None:
+    journal = RunJournal(directory=tmp_path)
+    winners, calls = await run(journal)
+    # Crash halfway: keep half the records and a torn final line.
+    lines = journal.path.read_bytes().splitlines(keepends=True)
+    journal.path.write_bytes(b"".join(lines[: len(lines) // 2]) + lines[len(lines) // 2][:10])
+
+    resumed, resumed_calls = await run(RunJournal.resume(journal.run_id, tmp_path))
+
+    assert 0 < resumed_calls < calls
+    assert resumed == winners
@@ -0,0 +1,86 @@
+"""Tests for judge panels: parse retries, failover and short-handed results."""
+
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from ai_debate.debate.engine import DebateTranscript
+from ai_debate.judging import JudgePanel
+from ai_debate.matrix.elo import DEFAULT_RATING, compute_elo_ratings
+from ai_debate.matrix.runner import _build_matrix_result
+from ai_debate.matrix.types import MatrixDebateEntry
+from ai_debate.models.base import ModelResponse
+from ai_debate.models.mock import MockAPIError, MockModel
+
+
+@dataclass
+class ScriptedJudge(MockModel):
+    """Replies with ``script`` in order (an exception is raised), then as a mock."""
+
+    script: tuple[Any, ...] = ()
+
+    async def generate(self, *args: Any, **kwargs: Any) -> ModelResponse:
+        if self.calls < len(self.script):
+            reply = self.script[self.calls]
+            self.calls += 1
+            if isinstance(reply, Exception):
+                raise reply
+            return ModelResponse(
+                content=reply, model=self.model_id, input_tokens=1, output_tokens=1
+            )
+        return await super().generate(*args, **kwargs)
+
+
+def judge(name: str, *script: Any) -> ScriptedJudge:
+    return ScriptedJudge(model_id=name.lower(), name=name, provider=name, script=script)
+
+
+def transcript() -> DebateTranscript:
+    return DebateTranscript(
+        id="t1",
+        resolution="Resolved: Tests should run offline.",
+        affirmative_model="Aff",
+        negative_model="Neg",
+        format_name="Lincoln-Douglas",
+        phases=[],
+        started_at=datetime.now(UTC),
+    )
+
+
+async def test_malformed_reply_is_retried_on_the_same_judge() -> None:
+    flaky = judge("Flaky", "not json")
+    alternate = judge("Alternate")
+    panel = JudgePanel([flaky], verbose=False, alternates=[alternate])
+
+    result = await panel.judge_debate(transcript())
+
+    assert [d.judge_name for d in result.decisions] == ["Flaky"]
+    assert flaky.calls == 2
+    assert alternate.calls == 0
+    assert result.substitutions == []
+
+
+async def test_provider_error_fails_over_to_alternate() -> None:
+    down = judge("Down", MockAPIError(500, "server error"))
+    panel = JudgePanel([down], verbose=False, alternates=[judge("Alternate")])
+
+    result = await panel.judge_debate(transcript())
+
+    assert [d.judge_name for d in result.decisions] == ["Alternate"]
+    assert [s.substitute_judge for s in result.substitutions] == ["Alternate"]
+    assert not result.short_handed
+
+
+async def test_unfilled_seat_is_short_handed_and_skips_elo() -> None:
+    panel = JudgePanel(
+        [judge("Down", MockAPIError(500, "server error")), judge("Up")], verbose=False
+    )
+
+    result = await panel.judge_debate(transcript())
+
+    assert result.short_handed
+    assert not result.is_unanimous
+    entry = MatrixDebateEntry("Aff", "Neg", ["Down", "Up"], debate_index=0)
+    matrix_result = _build_matrix_result(entry, transcript(), result)
+    ratings = compute_elo_ratings([matrix_result], ["Aff", "Neg"])
+    assert ratings["Aff"].rating == ratings["Neg"].rating == DEFAULT_RATING
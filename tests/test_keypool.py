@@ -0,0 +1,58 @@
+"""Tests for pooled API keys."""
+
+from collections.abc import AsyncIterator
+
+import httpx
+
+from ai_debate.models.keypool import KeyPool
+
+CACHE = "cachedContents/abc"
+BASE = "https://generativelanguage.googleapis.com/v1beta"
+
+
+class SlowBody(httpx.AsyncByteStream):
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for _ in range(3):
+            yield b"data: {}\n\n"
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path.endswith("/cachedContents"):
+        return httpx.Response(200, json={"name": CACHE})
+    if request.url.path.endswith(":streamGenerateContent"):
+        return httpx.Response(200, stream=SlowBody())
+    # Another project's key may not read the cache.
+    owner = request.headers["x-goog-api-key"] == "key-1"
+    return httpx.Response(200 if owner else 403, json={})
+
+
+def pooled_client() -> tuple[KeyPool, httpx.AsyncClient]:
+    pool = KeyPool("Google", ["key-1", "key-2", "key-3"])
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler), headers={"x-goog-api-key": "key-1"}
+    )
+    pool.install(client)
+    return pool, client
+
+
+async def test_cache_users_go_out_on_the_creating_key() -> None:
+    pool, client = pooled_client()
+    await client.post(f"{BASE}/cachedContents", json={})
+    # The creating key is now the busiest, but cache users still need it.
+    pool.keys[0].requests_remaining, pool.keys[0].requests_limit = 1, 100
+
+    for _ in range(3):
+        response = await client.post(
+            f"{BASE}/models/gemini:generateContent", json={"cachedContent": CACHE}
+        )
+        assert response.status_code == 200
+    assert [state.rejected for state in pool.keys] == [0, 0, 0]
+
+
+async def test_streamed_response_holds_its_key_until_closed() -> None:
+    pool, client = pooled_client()
+    async with client.stream("POST", f"{BASE}/models/gemini:streamGenerateContent") as response:
+        assert sum(state.in_flight for state in pool.keys) == 1
+        async for _ in response.aiter_bytes():
+            pass
+    assert sum(state.in_flight for state in pool.keys) == 0
@@ -0,0 +1,56 @@
+"""Tests for provider rate limiting."""
+
+import asyncio
+
+import pytest
+
+from ai_debate.models.base import Message, Role
+from ai_debate.models.deadline import DeadlineExceededError
+from ai_debate.models.mock import MockModel
+from ai_debate.models.ratelimit import (
+    ProviderLimiter,
+    ProviderLimits,
+    RateLimitedModel,
+    TokenBucket,
+)
+
+MESSAGES = [Message(role=Role.USER, content="Stay within 20 words.")]
+
+
+async def test_waiters_sleep_concurrently() -> None:
+    bucket = TokenBucket(per_minute=600)  # 10 units a second
+    bucket.level = 0.0
+
+    waiters = [asyncio.create_task(bucket.acquire(1)) for _ in range(3)]
+    await asyncio.sleep(0)
+    # Each reserved its unit up front; none of them blocks the others.
+    assert bucket.level == pytest.approx(-3.0, abs=0.1)
+    await asyncio.wait_for(asyncio.gather(*waiters), timeout=1.0)
+
+
+async def test_cancelled_waiter_gives_its_units_back() -> None:
+    bucket = TokenBucket(per_minute=60)
+    bucket.level = 0.0
+
+    waiter = asyncio.create_task(bucket.acquire(30))
+    await asyncio.sleep(0.01)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert bucket.level == pytest.approx(0.0, abs=0.1)
+
+
+async def test_queue_timeout_releases_slot_and_budget() -> None:
+    limiter = ProviderLimiter(
+        "Mock", ProviderLimits(requests_per_minute=60, tokens_per_minute=1_000_000)
+    )
+    limiter.requests.level = 0.0
+    model = RateLimitedModel(MockModel(), limiter)
+
+    with pytest.raises(DeadlineExceededError):
+        await model.generate("", MESSAGES, timeout=0.05)
+
+    assert limiter.in_flight == 0
+    assert limiter.queue_depth == 0
+    assert limiter.requests.level == pytest.approx(0.0, abs=0.1)
@@ -0,0 +1,21 @@
+"""Tests for the model registry."""
+
+import pytest
+
+from ai_debate.models.openai_compat import OpenAICompatibleModel
+from ai_debate.models.registry import ModelRegistry
+from ai_debate.models.wrapper import unwrap_model
+
+
+def test_local_model_reads_environment_when_built(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Set after the registry module was imported, as load_dotenv() in a script would.
+    monkeypatch.setenv("LOCAL_MODEL_ID", "qwen3-32b")
+    monkeypatch.setenv("LOCAL_BASE_URL", "http://gpu-box:8000/v1")
+    registry = ModelRegistry()
+
+    model = unwrap_model(registry.get("local"))
+
+    assert isinstance(model, OpenAICompatibleModel)
+    assert model.model_id == "qwen3-32b"
+    assert model.base_url == "http://gpu-box:8000/v1"
+    assert registry.config("local").dialect == "llama.cpp"
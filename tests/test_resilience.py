@@ -0,0 +1,110 @@
+"""Tests for the circuit breaker's half-open probe."""
+
+import asyncio
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass, field
+from typing import Any
+
+import pytest
+
+from ai_debate.models.base import Message, ModelResponse, Role, StreamChunk
+from ai_debate.models.deadline import DeadlineExceededError
+from ai_debate.models.mock import LatencyProfile, MockAPIError, MockModel
+from ai_debate.models.resilience import CircuitBreaker, CircuitOpenError, ResilientModel
+
+MESSAGES = [Message(role=Role.USER, content="Stay within 20 words.")]
+
+
+@dataclass
+class FailingModel(MockModel):
+    """Fails every call with ``error``; streams fail after their first delta."""
+
+    error: Exception = field(default_factory=lambda: MockAPIError(400, "bad request"))
+
+    async def generate(self, *args: Any, **kwargs: Any) -> ModelResponse:
+        raise self.error
+
+    async def generate_stream(self, *args: Any, **kwargs: Any) -> AsyncGenerator[StreamChunk, None]:
+        yield StreamChunk(text="Partial")
+        raise self.error
+
+
+def half_open_breaker() -> CircuitBreaker:
+    breaker = CircuitBreaker("Mock", failure_threshold=1, reset_timeout=0.0)
+    breaker.record_failure()
+    assert breaker.state == "half-open"
+    return breaker
+
+
+def slow_model(breaker: CircuitBreaker) -> ResilientModel:
+    inner = MockModel(latency=LatencyProfile(kind="fixed", seconds=10.0))
+    return ResilientModel(inner, max_retries=0, breaker=breaker)
+
+
+async def test_cancelled_probe_releases_half_open_slot() -> None:
+    breaker = half_open_breaker()
+    model = slow_model(breaker)
+    probe = asyncio.create_task(model.generate("", MESSAGES))
+    await asyncio.sleep(0.01)
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    probe.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await probe
+
+    # Not counted as a success: still half-open, and the next call may probe.
+    assert breaker.state == "half-open"
+    assert breaker.before_call() is True
+
+
+async def test_closed_stream_releases_half_open_slot() -> None:
+    breaker = half_open_breaker()
+    inner = MockModel(latency=LatencyProfile(kind="fixed", seconds=0.0))
+    model = ResilientModel(inner, max_retries=0, breaker=breaker)
+    stream = model.generate_stream("", MESSAGES)
+    await anext(stream)
+    await stream.aclose()
+
+    assert breaker.state == "half-open"
+    assert breaker.before_call() is True
+
+
+async def test_finished_probe_closes_breaker() -> None:
+    breaker = half_open_breaker()
+    inner = MockModel(latency=LatencyProfile(kind="fixed", seconds=0.0))
+    model = ResilientModel(inner, max_retries=0, breaker=breaker)
+    await model.generate("", MESSAGES)
+
+    assert breaker.state == "closed"
+    assert breaker.before_call() is False
+
+
+async def test_deadline_during_probe_leaves_breaker_half_open() -> None:
+    breaker = half_open_breaker()
+    model = ResilientModel(FailingModel(error=DeadlineExceededError("debate")), breaker=breaker)
+    with pytest.raises(DeadlineExceededError):
+        await model.generate("", MESSAGES)
+
+    assert breaker.state == "half-open"
+    assert breaker.before_call() is True
+
+
+async def test_timed_out_probe_counts_as_failure() -> None:
+    breaker = half_open_breaker()
+    model = slow_model(breaker)
+    with pytest.raises(TimeoutError):
+        await model.generate("", MESSAGES, timeout=0.05)
+
+    # The provider hung: a failure on top of the one that opened the breaker.
+    assert breaker.consecutive_failures == 2
+
+
+async def test_request_error_mid_stream_is_not_a_provider_failure() -> None:
+    breaker = CircuitBreaker("Mock", failure_threshold=1)
+    model = ResilientModel(FailingModel(), max_retries=0, breaker=breaker)
+    with pytest.raises(MockAPIError):
+        async for _ in model.generate_stream("", MESSAGES):
+            pass
+
+    assert breaker.state == "closed"
@@ -0,0 +1,110 @@
+"""Tests for the matrix runner."""
+
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass, field
+from typing import Any
+
+import pytest
+
+from ai_debate.debate.formats import SIMULTANEOUS_OPENINGS
+from ai_debate.matrix import MatrixRunner, build_matrix_schedule
+from ai_debate.models.base import DebateModel, ModelResponse, StreamChunk
+from ai_debate.models.batch import BatchDispatcher, BatchRequest, BatchResult, LocalBatchBackend
+from ai_debate.models.mock import LatencyProfile, MockAPIError, MockModel
+
+RESOLUTION = "Resolved: Tests should run offline."
+
+
+def mock_models(count: int = 3) -> dict[str, DebateModel]:
+    return {
+        f"Mock {i}": MockModel(
+            model_id=f"mock-{i}",
+            name=f"Mock {i}",
+            latency=LatencyProfile(kind="fixed", seconds=0.0),
+            tokens_per_second=1e6,
+        )
+        for i in range(1, count + 1)
+    }
+
+
+@dataclass
+class BrokenModel(MockModel):
+    """Raises ``error`` from every call."""
+
+    error: Exception = field(default_factory=lambda: MockAPIError(400, "bad request"))
+
+    async def generate(self, *args: Any, **kwargs: Any) -> ModelResponse:
+        raise self.error
+
+    async def generate_stream(self, *args: Any, **kwargs: Any) -> AsyncGenerator[StreamChunk, None]:
+        raise self.error
+        yield StreamChunk(text="")
+
+
+def runner_with_broken(error: Exception) -> tuple[MatrixRunner, list[str]]:
+    models = mock_models(3)
+    models["Broken"] = BrokenModel(
+        model_id="broken", name="Broken", tokens_per_second=1e6, error=error
+    )
+    return MatrixRunner(models, verbose=False, max_attempts=1), list(models)
+
+
+class FailingDispatcher(BatchDispatcher):
+    """Local batch jobs where the requests in ``fail`` come back as errors."""
+
+    def __init__(self, fail: set[str]):
+        super().__init__(local=LocalBatchBackend(poll_interval=0.01), verbose=False)
+        self.fail = fail
+
+    async def complete(
+        self,
+        requests: list[BatchRequest],
+        straggler_timeout: float | None = None,
+        fallback_timeout: float | None = None,
+    ) -> dict[str, BatchResult]:
+        results = await super().complete(requests, straggler_timeout, fallback_timeout)
+        for custom_id in self.fail & results.keys():
+            results[custom_id] = BatchResult(custom_id, error="injected failure")
+        return results
+
+
+async def test_lockstep_shares_speech_of_dropped_debate() -> None:
+    # Debate 0 (Mock 1 vs Mock 2) loses its affirmative constructive, which
+    # debate 1 shares; its negative constructive (same round) is the shared
+    # speech debate 5 (Mock 3 vs Mock 2) waits on.
+    models = mock_models()
+    runner = MatrixRunner(
+        models,
+        verbose=False,
+        max_attempts=1,
+        lockstep=FailingDispatcher(fail={"d0-p1"}),
+        debate_format=SIMULTANEOUS_OPENINGS,
+        share_openings=True,
+    )
+    result = await runner.run_matrix(RESOLUTION, build_matrix_schedule(list(models)))
+
+    assert result.failed_debates == [0, 1]
+    assert len(runner.full_results) == 4
+    for transcript, _ in runner.full_results:
+        assert len(transcript.phases) == len(SIMULTANEOUS_OPENINGS.phases)
+
+
+async def test_provider_error_fails_only_that_debate() -> None:
+    runner, names = runner_with_broken(MockAPIError(400, "bad request"))
+    schedule = build_matrix_schedule(names)
+    result = await runner.run_matrix(RESOLUTION, schedule)
+
+    # Broken judges are replaced from the bench; only its own debates fail.
+    broken = [
+        entry.debate_index
+        for entry in schedule
+        if "Broken" in (entry.affirmative_name, entry.negative_name)
+    ]
+    assert result.failed_debates == broken
+    assert len(runner.full_results) == len(schedule) - len(broken)
+
+
+async def test_programming_error_propagates() -> None:
+    runner, names = runner_with_broken(TypeError("bug"))
+    with pytest.raises(TypeError):
+        await runner.run_matrix(RESOLUTION, build_matrix_schedule(names))